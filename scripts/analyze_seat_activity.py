@@ -4,53 +4,45 @@ Seat Activity Analyzer
 
 This script analyzes seat activity CSV files and calculates the percentage
 of active users. A user is considered active if they have activity within the last 60 days.
+
+Several files and windows can be analyzed together; each file is read once
+and every user is bucketed into all windows in the same pass:
+  python3 scripts/analyze_seat_activity.py org-a.csv org-b.csv --days 30 --days 60 --days 90
+
+Large files can be split into newline-aligned byte ranges and counted in a
+process pool with --workers N (see seat_scan.py).
 """
 
-import csv
 import sys
 import argparse
+from bisect import bisect_right
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import List, Optional, Tuple
+
+from seat_scan import column_index, scan
 
+ACTIVITY_COLUMN = 'Last Activity At'
 
-def analyze_seat_activity(csv_path: str, days: int = 60) -> dict:
+
+def analyze_seat_activity(csv_path: str, days: int = 60, workers: int = 1,
+                          now: Optional[datetime] = None) -> dict:
     """
     Analyze a seat activity CSV file.
     
     Args:
         csv_path: Path to the CSV file
+        workers: Number of worker processes; 1 reads the file serially
+        now: Reference time (defaults to the current UTC time)
         
     Returns:
         Dictionary containing analysis results
     """
-    total_users = 0
-    active_users = 0
-    inactive_users = 0
-    
     # Calculate the cutoff date (days ago from now)
-    cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
+    cutoff_date = (now or datetime.now(timezone.utc)) - timedelta(days=days)
     
-    with open(csv_path, 'r', encoding='utf-8') as file:
-        reader = csv.DictReader(file)
-        
-        for row in reader:
-            total_users += 1
-            last_activity = row.get('Last Activity At', '').strip()
-            
-            if last_activity and last_activity.lower() != 'none':
-                try:
-                    # Parse the ISO 8601 date format (e.g., "2025-12-01T19:59:43Z")
-                    activity_date = datetime.fromisoformat(last_activity.replace('Z', '+00:00'))
-                    
-                    if activity_date >= cutoff_date:
-                        active_users += 1
-                    else:
-                        inactive_users += 1
-                except (ValueError, AttributeError):
-                    # If date parsing fails, consider as inactive
-                    inactive_users += 1
-            else:
-                inactive_users += 1
+    total_users, (active_users,) = count_activity(csv_path, [cutoff_date], workers=workers)
+    inactive_users = total_users - active_users
     
     active_percentage = (active_users / total_users * 100) if total_users > 0 else 0
     inactive_percentage = (inactive_users / total_users * 100) if total_users > 0 else 0
@@ -65,26 +57,184 @@ def analyze_seat_activity(csv_path: str, days: int = 60) -> dict:
     }
 
 
+def parse_activity(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse a 'Last Activity At' value.
+    
+    Returns:
+        The activity time, or None for empty, 'None' or unparseable values
+    """
+    value = (value or '').strip()
+    if not value or value.lower() == 'none':
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+
+class ActivityAggregator:
+    """
+    Seat scan aggregator counting active users for several cutoffs at once.
+    
+    Each timestamp is parsed once and bisected into the sorted cutoffs, so
+    a row costs the same however many windows are asked for.
+    """
+    
+    def __init__(self, cutoffs: List[datetime]):
+        """
+        Args:
+            cutoffs: Cutoff dates, oldest first
+        """
+        self.cutoffs = list(cutoffs)
+        self.column = None
+        self.total_users = 0
+        # histogram[k] counts users whose activity is on or after exactly k cutoffs
+        self.histogram = [0] * (len(self.cutoffs) + 1)
+    
+    def start(self, header: List[str]) -> None:
+        self.column = column_index(header, ACTIVITY_COLUMN)
+    
+    def add(self, row: List[str]) -> None:
+        self.total_users += 1
+        column = self.column
+        activity_date = parse_activity(row[column] if column is not None and column < len(row) else None)
+        if activity_date is None:
+            self.histogram[0] += 1
+        else:
+            self.histogram[bisect_right(self.cutoffs, activity_date)] += 1
+    
+    def merge(self, other: 'ActivityAggregator') -> None:
+        self.total_users += other.total_users
+        self.histogram = [a + b for a, b in zip(self.histogram, other.histogram)]
+    
+    def active_counts(self) -> List[int]:
+        """Number of users with activity on or after each cutoff."""
+        active_counts = []
+        running = 0
+        for k in range(len(self.cutoffs), 0, -1):
+            running += self.histogram[k]
+            active_counts.append(running)
+        active_counts.reverse()
+        return active_counts
+
+
+def count_activity(csv_path: str, cutoffs: List[datetime], workers: int = 1) -> Tuple[int, List[int]]:
+    """
+    Count active users for several cutoffs in a single pass over a CSV.
+    
+    Args:
+        csv_path: Path to the CSV file
+        cutoffs: Cutoff dates, oldest first
+        workers: Number of worker processes; 1 reads the file serially
+        
+    Returns:
+        (total_users, active_counts) where active_counts[i] is the number
+        of users with activity on or after cutoffs[i]
+    """
+    activity, = scan(csv_path, [ActivityAggregator(cutoffs)], workers=workers)
+    return activity.total_users, activity.active_counts()
+
+
+def analyze_seat_activity_windows(csv_paths: List[str], windows: List[int],
+                                  now: Optional[datetime] = None, workers: int = 1) -> List[dict]:
+    """
+    Analyze several seat activity CSV files for several activity windows.
+    
+    Every file is read once, and all windows share one reference time so
+    results are comparable across files.
+    
+    Args:
+        csv_paths: Paths to the CSV files
+        windows: Activity windows in days
+        now: Reference time (defaults to the current UTC time)
+        workers: Number of worker processes per file; 1 reads serially
+        
+    Returns:
+        One dictionary per file with 'csv_path', 'total_users' and
+        'windows', which maps each window to the same fields
+        analyze_seat_activity returns
+    """
+    now = now or datetime.now(timezone.utc)
+    windows = sorted(set(windows), reverse=True)  # longest window = oldest cutoff first
+    cutoffs = [now - timedelta(days=days) for days in windows]
+    
+    results = []
+    for csv_path in csv_paths:
+        total_users, active_counts = count_activity(csv_path, cutoffs, workers=workers)
+        by_window = {}
+        for days, cutoff_date, active_users in zip(windows, cutoffs, active_counts):
+            inactive_users = total_users - active_users
+            by_window[days] = {
+                'total_users': total_users,
+                'active_users': active_users,
+                'inactive_users': inactive_users,
+                'active_percentage': (active_users / total_users * 100) if total_users > 0 else 0,
+                'inactive_percentage': (inactive_users / total_users * 100) if total_users > 0 else 0,
+                'cutoff_date': cutoff_date
+            }
+        results.append({'csv_path': csv_path, 'total_users': total_users, 'windows': by_window})
+    return results
+
+
+def print_windows_table(results: List[dict], windows: List[int]) -> None:
+    """Print a combined table of active users per file and window."""
+    windows = sorted(set(windows))
+    name_width = max([len('TOTAL')] + [len(Path(r['csv_path']).name) for r in results]) + 2
+    cutoffs = results[0]['windows'] if results else {}
+    print("Activity cutoffs: " + ", ".join(
+        f"{days}d = {cutoffs[days]['cutoff_date'].strftime('%Y-%m-%d')}" for days in windows if days in cutoffs
+    ))
+    print("-" * 60)
+    
+    header = f"{'File':<{name_width}}{'Users':>10}" + "".join(f"{f'{days}d active':>22}" for days in windows)
+    print(header)
+    
+    def row(name: str, total_users: int, active: List[int]) -> str:
+        cells = "".join(
+            f"{f'{count:,} ({(count / total_users * 100) if total_users > 0 else 0:.2f}%)':>22}"
+            for count in active
+        )
+        return f"{name:<{name_width}}{total_users:>10,}{cells}"
+    
+    for r in results:
+        print(row(Path(r['csv_path']).name, r['total_users'],
+                  [r['windows'][days]['active_users'] for days in windows]))
+    if len(results) > 1:
+        print("-" * len(header))
+        print(row('TOTAL', sum(r['total_users'] for r in results),
+                  [sum(r['windows'][days]['active_users'] for r in results) for days in windows]))
+
+
 def main():
     """Main function to run the analysis."""
     parser = argparse.ArgumentParser(description="Analyze seat activity CSV")
-    parser.add_argument("csv", nargs="?", default=str(Path(__file__).parent / 'seat-activity.csv'), help="Path to CSV file")
-    parser.add_argument("--days", type=int, default=60, help="Activity window in days (default: 60)")
+    parser.add_argument("csv", nargs="*", default=[str(Path(__file__).parent / 'seat-activity.csv')], help="Path to CSV file; several may be given")
+    parser.add_argument("--days", type=int, action="append", help="Activity window in days; repeat for several windows (default: 60)")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes for splitting large files (default: 1)")
     args = parser.parse_args()
+    windows = args.days or [60]
 
-    csv_file = Path(args.csv)
+    for path in args.csv:
+        if not Path(path).exists():
+            print(f"Error: CSV file not found at {Path(path)}")
+            sys.exit(1)
     
-    if not csv_file.exists():
-        print(f"Error: CSV file not found at {csv_file}")
-        sys.exit(1)
+    if len(args.csv) > 1 or len(windows) > 1:
+        print(f"Analyzing: {', '.join(Path(path).name for path in args.csv)}")
+        print("-" * 60)
+        print_windows_table(analyze_seat_activity_windows(args.csv, windows, workers=args.workers), windows)
+        return
     
+    days = windows[0]
+    csv_file = Path(args.csv[0])
     print(f"Analyzing: {csv_file.name}")
     print("-" * 60)
     
-    results = analyze_seat_activity(str(csv_file), days=args.days)
+    results = analyze_seat_activity(str(csv_file), days=days, workers=args.workers)
     
     cutoff_date_str = results['cutoff_date'].strftime('%Y-%m-%d')
-    print(f"\nActivity cutoff date: {cutoff_date_str} ({args.days} days ago)")
+    print(f"\nActivity cutoff date: {cutoff_date_str} ({days} days ago)")
     print(f"\nTotal Users:      {results['total_users']:,}")
     print(f"Active Users:     {results['active_users']:,} ({results['active_percentage']:.2f}%)")
     print(f"Inactive Users:   {results['inactive_users']:,} ({results['inactive_percentage']:.2f}%)")
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+bench_report_seat_versions.py
+
+Compare the per-row surface parsing that report_seat_versions used to do
+(parse_surface plus fresh f-string Counter keys for every row) with the
+memoized, dictionary-encoded SurfaceAggregator. Rows are read from a seat
+activity CSV, or generated with a few hundred distinct surfaces, and held
+in memory so only the counting is timed. The two must produce the same
+counts; tests/test_report_seat_versions.py checks this, including merge
+and the cache limit, on every test run.
+
+Usage:
+  python3 scripts/bench_report_seat_versions.py --rows 2000000
+  python3 scripts/bench_report_seat_versions.py --csv seat-activity.csv
+"""
+
+import argparse
+import csv
+import random
+import sys
+import time
+from collections import Counter
+
+from report_seat_versions import SURFACE_COLUMNS, SurfaceAggregator, is_copilot_extension, parse_surface
+from seat_scan import column_index
+
+
+def synthetic_rows(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    surfaces = ["None", "", "unknown"]
+    for minor in range(80):
+        surfaces.append(f"vscode/1.{minor}.{rng.randint(0, 3)}/copilot-chat/0.{minor // 3}.{rng.randint(0, 9)}")
+        surfaces.append(f"vscode/1.{minor}.0/copilot/1.{200 + minor}.0")
+        surfaces.append(f"JetBrains-IC/{240 + minor // 10}.{rng.randint(10000, 29999)}.{rng.randint(1, 99)}/")
+        surfaces.append(f"VisualStudio/17.{minor % 12}.{minor}/copilot-vs/1.{minor}.0.0")
+    header = ["login", "last_activity_at", "Last Surface Used"]
+    return header, [[f"user{n}", "2025-01-01T00:00:00Z", rng.choice(surfaces)] for n in range(count)]
+
+
+def legacy_counts(rows, surface_col):
+    """The row loop as it was before parse results were cached."""
+    ide_counts = Counter()
+    copilot_version_counts = Counter()
+    copilot_name_version_counts = Counter()
+    malformed_surfaces = 0
+    empty_surfaces = 0
+    for row in rows:
+        raw_surface = row[surface_col]
+        ide_name, ide_ver, ext_name, ext_ver = parse_surface(raw_surface)
+        if ide_name is None or ide_ver is None:
+            if raw_surface and raw_surface.strip().lower() != "none":
+                malformed_surfaces += 1
+            else:
+                empty_surfaces += 1
+            continue
+        ide_counts[f"{ide_name.lower()}/{ide_ver}"] += 1
+        if is_copilot_extension(ext_name) and ext_ver:
+            copilot_version_counts[ext_ver] += 1
+            copilot_name_version_counts[f"{ext_name.lower()}/{ext_ver}"] += 1
+    return ide_counts, copilot_version_counts, copilot_name_version_counts, malformed_surfaces, empty_surfaces
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark memoized surface parsing.")
+    parser.add_argument("--csv", help="Seat activity CSV to read rows from (default: synthetic rows)")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Synthetic rows to generate (default: 1000000)")
+    args = parser.parse_args()
+
+    if args.csv:
+        with open(args.csv, newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            rows = [row for row in reader if row]
+    else:
+        header, rows = synthetic_rows(args.rows)
+    surface_col = column_index(header, *SURFACE_COLUMNS, ignore_case=True)
+    if surface_col is None:
+        print("Could not find 'Last Surface Used' column in CSV headers.", file=sys.stderr)
+        sys.exit(1)
+    rows = [row for row in rows if surface_col < len(row)]
+
+    start = time.perf_counter()
+    expected = legacy_counts(rows, surface_col)
+    legacy_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    surfaces = SurfaceAggregator()
+    surfaces.start(header)
+    add = surfaces.add
+    for row in rows:
+        add(row)
+    cached_seconds = time.perf_counter() - start
+
+    actual = (surfaces.ide_counts, surfaces.copilot_version_counts, surfaces.copilot_name_version_counts,
+              surfaces.malformed_surfaces, surfaces.empty_surfaces)
+    distinct = len({row[surface_col] for row in rows})
+    print(f"{len(rows):,} rows, {distinct:,} distinct surfaces")
+    print(f"  per-row parse      {legacy_seconds:8.3f}s  ({len(rows) / legacy_seconds:,.0f} rows/s)")
+    print(f"  memoized, encoded  {cached_seconds:8.3f}s  ({len(rows) / cached_seconds:,.0f} rows/s, "
+          f"{legacy_seconds / cached_seconds:.1f}x)")
+    print(f"  identical counts: {actual == expected}")
+    if actual != expected:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
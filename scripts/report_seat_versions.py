@@ -7,6 +7,11 @@ import sys
 from collections import Counter, defaultdict
 from pathlib import Path
 
+from seat_scan import column_index, scan
+
+# Accepted spellings of the surface column, matched case-insensitively
+SURFACE_COLUMNS = ("last surface used", "last_surface_used", "surface", "lastsurfaceused")
+
 
 def parse_surface(surface: str):
     """
@@ -59,6 +64,191 @@ def find_default_csv() -> Optional[Path]:
     return None
 
 
+# Distinct surface strings remembered per aggregator; real exports have a few hundred
+MAX_CACHED_SURFACES = 100_000
+
+# Outcome codes for a parsed surface
+_COUNTED, _EMPTY, _MALFORMED = 0, 1, 2
+
+
+class KeyTable:
+    """Interns strings as small integer codes, numbered in first-seen order."""
+
+    def __init__(self):
+        self.codes = {}
+        self.keys = []
+
+    def code(self, key: str) -> int:
+        code = self.codes.get(key)
+        if code is None:
+            code = self.codes[key] = len(self.keys)
+            self.keys.append(key)
+        return code
+
+
+class SurfaceAggregator:
+    """
+    Seat scan aggregator counting IDE and Copilot extension versions.
+
+    Each distinct raw surface string is parsed once; the result is cached
+    as integer codes for its counter keys, so a repeated surface costs one
+    dict lookup and a few list increments. Keys are decoded into Counters
+    only when the counts are read.
+    """
+
+    def __init__(self):
+        self.surface_col = None
+        self.malformed_surfaces = 0
+        self.empty_surfaces = 0
+        self._ide_keys = KeyTable()
+        self._version_keys = KeyTable()
+        self._name_version_keys = KeyTable()
+        self._ide_counts = []
+        self._version_counts = []
+        self._name_version_counts = []
+        # raw surface -> (outcome, ide code, extension version code, name/version code)
+        self._cache = {}
+
+    def start(self, header):
+        # try to detect the column name case-insensitively
+        self.surface_col = column_index(header, *SURFACE_COLUMNS, ignore_case=True)
+        if self.surface_col is None:
+            raise ValueError("Could not find 'Last Surface Used' column in CSV headers.")
+
+    def add(self, row):
+        raw_surface = row[self.surface_col] if self.surface_col < len(row) else None
+        parsed = self._cache.get(raw_surface)
+        if parsed is None:
+            parsed = self._parse(raw_surface)
+            if len(self._cache) < MAX_CACHED_SURFACES:
+                self._cache[raw_surface] = parsed
+        outcome, ide_code, version_code, name_version_code = parsed
+        if outcome == _COUNTED:
+            self._ide_counts[ide_code] += 1
+            if version_code is not None:
+                self._version_counts[version_code] += 1
+                self._name_version_counts[name_version_code] += 1
+        elif outcome == _EMPTY:
+            self.empty_surfaces += 1
+        else:
+            self.malformed_surfaces += 1
+
+    def _parse(self, raw_surface):
+        ide_name, ide_ver, ext_name, ext_ver = parse_surface(raw_surface)
+        if ide_name is None or ide_ver is None:
+            if raw_surface and raw_surface.strip().lower() != "none":
+                return _MALFORMED, None, None, None
+            return _EMPTY, None, None, None
+
+        # Normalize IDE name to lower for grouping consistency
+        ide_code = self._intern(self._ide_keys, self._ide_counts, f"{ide_name.lower()}/{ide_ver}")
+        if is_copilot_extension(ext_name) and ext_ver:
+            version_code = self._intern(self._version_keys, self._version_counts, ext_ver)
+            name_version_code = self._intern(self._name_version_keys, self._name_version_counts,
+                                             f"{ext_name.lower()}/{ext_ver}")
+            return _COUNTED, ide_code, version_code, name_version_code
+        return _COUNTED, ide_code, None, None
+
+    @staticmethod
+    def _intern(keys: KeyTable, counts: list, key: str) -> int:
+        code = keys.code(key)
+        if code == len(counts):
+            counts.append(0)
+        return code
+
+    @staticmethod
+    def _decode(keys: KeyTable, counts: list) -> Counter:
+        # Codes follow first-seen order, so ties list in the same order as a plain Counter
+        return Counter({key: count for key, count in zip(keys.keys, counts) if count})
+
+    @property
+    def ide_counts(self) -> Counter:
+        return self._decode(self._ide_keys, self._ide_counts)
+
+    @property
+    def copilot_version_counts(self) -> Counter:
+        return self._decode(self._version_keys, self._version_counts)
+
+    @property
+    def copilot_name_version_counts(self) -> Counter:
+        return self._decode(self._name_version_keys, self._name_version_counts)
+
+    def merge(self, other):
+        for keys, counts, other_keys, other_counts in (
+            (self._ide_keys, self._ide_counts, other._ide_keys, other._ide_counts),
+            (self._version_keys, self._version_counts, other._version_keys, other._version_counts),
+            (self._name_version_keys, self._name_version_counts, other._name_version_keys, other._name_version_counts),
+        ):
+            for key, count in zip(other_keys.keys, other_counts):
+                counts[self._intern(keys, counts, key)] += count
+        self.malformed_surfaces += other.malformed_surfaces
+        self.empty_surfaces += other.empty_surfaces
+
+
+def print_counter(title: str, counter: Counter):
+    print(title)
+    for key, count in counter.most_common():
+        print(f"  {key}: {count}")
+    if not counter:
+        print("  (none)")
+    print()
+
+
+def print_report(surfaces: SurfaceAggregator, by_extension_name: bool = False):
+    print_counter("IDE Versions (name/version):", surfaces.ide_counts)
+    print_counter("Copilot Extension Versions (by version):", surfaces.copilot_version_counts)
+    if by_extension_name:
+        print_counter("Copilot Extension Versions (by extension name/version):", surfaces.copilot_name_version_counts)
+
+
+def write_report_csvs(surfaces: SurfaceAggregator, out_dir: Path, prefix: str, by_extension_name: bool = False):
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    ide_out = out_dir / f"{prefix}_ide_versions.csv"
+    copilot_out = out_dir / f"{prefix}_copilot_versions.csv"
+    copilot_byname_out = out_dir / f"{prefix}_copilot_extname_versions.csv"
+
+    # Write IDE versions as columns: ide_name, ide_version, count
+    with ide_out.open('w', newline='') as f:
+        w = csv.writer(f)
+        w.writerow(["ide_name", "ide_version", "count"])
+        for key, count in surfaces.ide_counts.most_common():
+            ide_name, ide_version = key.split('/', 1) if '/' in key else (key, "")
+            w.writerow([ide_name, ide_version, count])
+
+    # Write Copilot versions as columns: extension_version, count
+    with copilot_out.open('w', newline='') as f:
+        w = csv.writer(f)
+        w.writerow(["extension_version", "count"])
+        for ver, count in surfaces.copilot_version_counts.most_common():
+            w.writerow([ver, count])
+
+    # Optional: by extension name and version
+    if by_extension_name:
+        with copilot_byname_out.open('w', newline='') as f:
+            w = csv.writer(f)
+            w.writerow(["extension_name", "extension_version", "count"])
+            for key, count in surfaces.copilot_name_version_counts.most_common():
+                ext_name, ext_version = key.split('/', 1) if '/' in key else (key, "")
+                w.writerow([ext_name, ext_version, count])
+
+    print("Written CSVs:")
+    print(f"  {ide_out}")
+    print(f"  {copilot_out}")
+    if by_extension_name:
+        print(f"  {copilot_byname_out}")
+
+
+def print_notes(surfaces: SurfaceAggregator):
+    # Small diagnostic footer
+    if surfaces.malformed_surfaces or surfaces.empty_surfaces:
+        print("Notes:")
+        if surfaces.empty_surfaces:
+            print(f"  Rows with empty/None surface: {surfaces.empty_surfaces}")
+        if surfaces.malformed_surfaces:
+            print(f"  Rows with unparseable surface: {surfaces.malformed_surfaces}")
+
+
 def main():
     parser = argparse.ArgumentParser(description="Report counts of IDE versions and Copilot extension versions from seat activity CSV.")
     parser.add_argument("csv_path", nargs="?", help="Path to CSV (defaults to scripts/seat-activity-*.csv)")
@@ -66,6 +256,7 @@ def main():
     parser.add_argument("--write-csv", action="store_true", help="Write results to CSV files alongside the input or to --out-dir.")
     parser.add_argument("--out-dir", help="Directory to write CSV files. Defaults to the input CSV's directory.")
     parser.add_argument("--prefix", help="Output filename prefix. Defaults to the input CSV filename stem.")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes for splitting large files (default: 1)")
     args = parser.parse_args()
 
     csv_path = args.csv_path
@@ -81,107 +272,23 @@ def main():
         print(f"CSV not found: {csv_file}", file=sys.stderr)
         sys.exit(1)
 
-    ide_counts = Counter()
-    copilot_version_counts = Counter()
-    copilot_name_version_counts = Counter()  # optional detailed breakdown
-    malformed_surfaces = 0
-    empty_surfaces = 0
-
-    with csv_file.open(newline='') as f:
-        reader = csv.DictReader(f)
-        # try to detect the column name case-insensitively
-        header_map = {h.lower(): h for h in reader.fieldnames or []}
-        surface_col = None
-        for key in ("last surface used", "last_surface_used", "surface", "lastsurfaceused"):
-            if key in header_map:
-                surface_col = header_map[key]
-                break
-        if surface_col is None:
-            print("Could not find 'Last Surface Used' column in CSV headers.", file=sys.stderr)
-            sys.exit(1)
-
-        for row in reader:
-            raw_surface = row.get(surface_col)
-            ide_name, ide_ver, ext_name, ext_ver = parse_surface(raw_surface)
-            if ide_name is None or ide_ver is None:
-                if raw_surface and raw_surface.strip().lower() != "none":
-                    malformed_surfaces += 1
-                else:
-                    empty_surfaces += 1
-                continue
-
-            # Normalize IDE name to lower for grouping consistency
-            norm_ide_name = ide_name.lower()
-            ide_key = f"{norm_ide_name}/{ide_ver}"
-            ide_counts[ide_key] += 1
-
-            if is_copilot_extension(ext_name) and ext_ver:
-                copilot_version_counts[ext_ver] += 1
-                name_ver_key = f"{ext_name.lower()}/{ext_ver}"
-                copilot_name_version_counts[name_ver_key] += 1
-
-    def print_counter(title: str, counter: Counter):
-        print(title)
-        for key, count in counter.most_common():
-            print(f"  {key}: {count}")
-        if not counter:
-            print("  (none)")
-        print()
+    try:
+        surfaces, = scan(str(csv_file), [SurfaceAggregator()], workers=args.workers)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
 
     print(f"Source: {csv_file}")
     print()
-    print_counter("IDE Versions (name/version):", ide_counts)
-    print_counter("Copilot Extension Versions (by version):", copilot_version_counts)
-    if args.by_extension_name:
-        print_counter("Copilot Extension Versions (by extension name/version):", copilot_name_version_counts)
+    print_report(surfaces, args.by_extension_name)
 
     # Optionally write results to CSV files
     if args.write_csv:
         out_dir = Path(args.out_dir) if args.out_dir else csv_file.parent
-        out_dir.mkdir(parents=True, exist_ok=True)
         prefix = args.prefix if args.prefix else csv_file.stem
+        write_report_csvs(surfaces, out_dir, prefix, args.by_extension_name)
 
-        ide_out = out_dir / f"{prefix}_ide_versions.csv"
-        copilot_out = out_dir / f"{prefix}_copilot_versions.csv"
-        copilot_byname_out = out_dir / f"{prefix}_copilot_extname_versions.csv"
-
-        # Write IDE versions as columns: ide_name, ide_version, count
-        with ide_out.open('w', newline='') as f:
-            w = csv.writer(f)
-            w.writerow(["ide_name", "ide_version", "count"])
-            for key, count in ide_counts.most_common():
-                ide_name, ide_version = key.split('/', 1) if '/' in key else (key, "")
-                w.writerow([ide_name, ide_version, count])
-
-        # Write Copilot versions as columns: extension_version, count
-        with copilot_out.open('w', newline='') as f:
-            w = csv.writer(f)
-            w.writerow(["extension_version", "count"])
-            for ver, count in copilot_version_counts.most_common():
-                w.writerow([ver, count])
-
-        # Optional: by extension name and version
-        if args.by_extension_name:
-            with copilot_byname_out.open('w', newline='') as f:
-                w = csv.writer(f)
-                w.writerow(["extension_name", "extension_version", "count"])
-                for key, count in copilot_name_version_counts.most_common():
-                    ext_name, ext_version = key.split('/', 1) if '/' in key else (key, "")
-                    w.writerow([ext_name, ext_version, count])
-
-        print("Written CSVs:")
-        print(f"  {ide_out}")
-        print(f"  {copilot_out}")
-        if args.by_extension_name:
-            print(f"  {copilot_byname_out}")
-
-    # Small diagnostic footer
-    if malformed_surfaces or empty_surfaces:
-        print("Notes:")
-        if empty_surfaces:
-            print(f"  Rows with empty/None surface: {empty_surfaces}")
-        if malformed_surfaces:
-            print(f"  Rows with unparseable surface: {malformed_surfaces}")
+    print_notes(surfaces)
 
 
 if __name__ == "__main__":
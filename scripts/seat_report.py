@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+seat_report.py
+
+Produce the seat activity summary and the IDE / Copilot extension version
+report from a single read of a seat activity CSV. Both reports are
+aggregators on the shared seat_scan engine, so the file is scanned once
+however many reports and activity windows are requested.
+
+Usage:
+  python3 scripts/seat_report.py seat-activity.csv
+  python3 scripts/seat_report.py seat-activity.csv --days 30 --days 90 --by-extension-name
+  python3 scripts/seat_report.py seat-activity.csv --write-csv --out-dir reports --workers 4
+"""
+
+import argparse
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from analyze_seat_activity import ActivityAggregator
+from report_seat_versions import SurfaceAggregator, find_default_csv, print_notes, print_report, write_report_csvs
+from seat_scan import scan
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report seat activity and IDE/extension versions from one read of a seat activity CSV.")
+    parser.add_argument("csv_path", nargs="?", help="Path to CSV (defaults to scripts/seat-activity-*.csv)")
+    parser.add_argument("--days", type=int, action="append", help="Activity window in days; repeat for several windows (default: 60)")
+    parser.add_argument("--by-extension-name", action="store_true", help="Also break down Copilot counts by extension name.")
+    parser.add_argument("--write-csv", action="store_true", help="Write version results to CSV files alongside the input or to --out-dir.")
+    parser.add_argument("--out-dir", help="Directory to write CSV files. Defaults to the input CSV's directory.")
+    parser.add_argument("--prefix", help="Output filename prefix. Defaults to the input CSV filename stem.")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes for splitting large files (default: 1)")
+    args = parser.parse_args()
+
+    csv_path = args.csv_path
+    if not csv_path:
+        default = find_default_csv()
+        if not default:
+            print("No CSV provided and no default seat activity CSV found in scripts/", file=sys.stderr)
+            sys.exit(1)
+        csv_path = str(default)
+
+    csv_file = Path(csv_path)
+    if not csv_file.exists():
+        print(f"CSV not found: {csv_file}", file=sys.stderr)
+        sys.exit(1)
+
+    now = datetime.now(timezone.utc)
+    windows = sorted(set(args.days or [60]), reverse=True)  # oldest cutoff first
+    cutoffs = [now - timedelta(days=days) for days in windows]
+
+    try:
+        activity, surfaces = scan(str(csv_file), [ActivityAggregator(cutoffs), SurfaceAggregator()],
+                                  workers=args.workers)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+
+    print(f"Source: {csv_file}")
+    print()
+    total_users = activity.total_users
+    print(f"Seat Activity ({total_users:,} users):")
+    for days, cutoff, active_users in sorted(zip(windows, cutoffs, activity.active_counts())):
+        percentage = (active_users / total_users * 100) if total_users > 0 else 0
+        print(f"  {days}d (since {cutoff.strftime('%Y-%m-%d')}): {active_users:,} active ({percentage:.2f}%), "
+              f"{total_users - active_users:,} inactive")
+    print()
+
+    print_report(surfaces, args.by_extension_name)
+
+    if args.write_csv:
+        out_dir = Path(args.out_dir) if args.out_dir else csv_file.parent
+        prefix = args.prefix if args.prefix else csv_file.stem
+        write_report_csvs(surfaces, out_dir, prefix, args.by_extension_name)
+
+    print_notes(surfaces)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Single-pass scanning engine for seat activity CSV files.
+
+A scan reads a CSV once and hands every data row to a list of aggregators,
+so several reports can share one read of the file. An aggregator is any
+object with these methods:
+
+  start(header)   resolve column positions from the header row
+  add(row)        count one data row, given as a list of strings
+  merge(other)    fold in the counts of another aggregator of the same kind
+
+With workers > 1 the rows are split into newline-aligned byte ranges that
+are scanned in a process pool. Every range is scanned into fresh copies of
+the aggregators, which are merged back into the originals, so aggregators
+must be picklable. Splitting assumes no field contains a line break, which
+holds for seat activity exports.
+
+Example:
+  from seat_scan import scan
+  activity, surfaces = scan("seat-activity.csv", [ActivityAggregator(cutoffs), SurfaceAggregator()])
+"""
+
+import csv
+import io
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Protocol, Sequence, Tuple
+
+# Target size of the byte ranges handed to each worker process
+CHUNK_SIZE = 8 * 1024 * 1024
+
+
+class Aggregator(Protocol):
+    def start(self, header: List[str]) -> None:
+        ...
+
+    def add(self, row: List[str]) -> None:
+        ...
+
+    def merge(self, other: "Aggregator") -> None:
+        ...
+
+
+def column_index(header: List[str], *names: str, ignore_case: bool = False) -> Optional[int]:
+    """
+    Index of the first of names found in the header, or None.
+
+    When a name occurs more than once the last occurrence wins, as it does
+    for the dicts csv.DictReader builds.
+    """
+    fields = [h.lower() for h in header] if ignore_case else header
+    for name in names:
+        name = name.lower() if ignore_case else name
+        if name in fields:
+            return len(fields) - 1 - fields[::-1].index(name)
+    return None
+
+
+def scan(csv_path: str, aggregators: Sequence[Aggregator], workers: int = 1,
+         chunk_size: int = CHUNK_SIZE) -> Sequence[Aggregator]:
+    """
+    Read a CSV once, feeding every non-empty data row to each aggregator.
+
+    Returns:
+        The aggregators, for convenient unpacking
+    """
+    if workers > 1:
+        _scan_parallel(csv_path, aggregators, workers, chunk_size)
+        return aggregators
+
+    with open(csv_path, 'r', encoding='utf-8') as file:
+        reader = csv.reader(file)
+        header = next(reader, [])
+        for aggregator in aggregators:
+            aggregator.start(header)
+        _feed(reader, aggregators)
+    return aggregators
+
+
+def _feed(rows, aggregators: Sequence[Aggregator]) -> None:
+    adds = [aggregator.add for aggregator in aggregators]
+    if len(adds) == 1:
+        add = adds[0]
+        for row in rows:
+            if row:
+                add(row)
+        return
+    for row in rows:
+        if row:
+            for add in adds:
+                add(row)
+
+
+def byte_ranges(csv_path: str, parts: int) -> Tuple[bytes, List[Tuple[int, int]]]:
+    """
+    Split the rows after the header into about parts newline-aligned byte ranges.
+
+    Returns:
+        (header_line, [(start, end), ...])
+    """
+    size = os.path.getsize(csv_path)
+    with open(csv_path, 'rb') as file:
+        header = file.readline()
+        step = max(1, (size - len(header)) // parts)
+        bounds = [len(header)]
+        while bounds[-1] < size:
+            file.seek(min(bounds[-1] + step, size))
+            file.readline()  # finish the row the split point landed in
+            bounds.append(min(file.tell(), size))
+    return header, list(zip(bounds, bounds[1:]))
+
+
+def _scan_range(csv_path: str, start: int, end: int, blank_aggregators: bytes) -> List[Aggregator]:
+    """Worker: scan one byte range into fresh aggregators."""
+    aggregators = pickle.loads(blank_aggregators)
+    with open(csv_path, 'rb') as file:
+        file.seek(start)
+        data = file.read(end - start)
+    _feed(csv.reader(io.TextIOWrapper(io.BytesIO(data), encoding='utf-8')), aggregators)
+    return aggregators
+
+
+def _scan_parallel(csv_path: str, aggregators: Sequence[Aggregator], workers: int, chunk_size: int) -> None:
+    size = os.path.getsize(csv_path)
+    header_line, ranges = byte_ranges(csv_path, max(workers, -(-size // chunk_size)))
+    header = next(csv.reader(io.TextIOWrapper(io.BytesIO(header_line), encoding='utf-8')), [])
+    for aggregator in aggregators:
+        aggregator.start(header)
+    # Snapshot the started, still empty aggregators before any merging begins
+    blank = pickle.dumps(list(aggregators))
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_scan_range, csv_path, start, end, blank) for start, end in ranges]
+        for future in futures:
+            for aggregator, partial in zip(aggregators, future.result()):
+                aggregator.merge(partial)
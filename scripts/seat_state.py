@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+"""
+seat_state.py
+
+Track seat activity across snapshots in a persistent SQLite state store.
+
+The store keeps one row per user login with the last seen activity time,
+surface and active flag. Ingesting a new seat-activity CSV diffs it against
+that state and records per-snapshot deltas: newly added and removed seats,
+seats that became active or inactive, and IDE or Copilot extension version
+upgrades. Only seats whose state changed are written, and each snapshot's
+totals go into a summary table so trends over time are a single small
+query. Snapshots must be ingested oldest first; the as-of time is taken
+from a timestamp in the file name (e.g. seat-activity-2025-12-01.csv) or,
+failing that, the file's modification time. A snapshot is identified by
+its resolved path, so exports with the same name from different
+directories (e.g. one per org) are separate snapshots. The store lives in the user's
+data directory ($XDG_DATA_HOME, else ~/.local/share) unless --db is given.
+
+Usage:
+  python3 scripts/seat_state.py ingest                      # every new scripts/seat-activity-*.csv
+  python3 scripts/seat_state.py ingest export.csv --days 30
+  python3 scripts/seat_state.py trend
+  python3 scripts/seat_state.py changes 3 --kind extension_upgrade
+"""
+
+import argparse
+import os
+import re
+import sqlite3
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from analyze_seat_activity import ACTIVITY_COLUMN, parse_activity
+from report_seat_versions import SURFACE_COLUMNS, parse_surface
+from seat_scan import column_index, scan
+
+DEFAULT_DB = str(Path(os.environ.get("XDG_DATA_HOME") or Path.home() / ".local" / "share")
+                 / "seat-reports" / "seat_state.db")
+
+# Accepted spellings of the login column, matched case-insensitively
+LOGIN_COLUMNS = ("login", "user login", "user_login", "username", "user", "github login")
+
+# Kinds of per-snapshot change
+ADDED = "added"
+REMOVED = "removed"
+NEWLY_ACTIVE = "newly_active"
+NEWLY_INACTIVE = "newly_inactive"
+IDE_UPGRADE = "ide_upgrade"
+EXTENSION_UPGRADE = "extension_upgrade"
+CHANGE_KINDS = (ADDED, REMOVED, NEWLY_ACTIVE, NEWLY_INACTIVE, IDE_UPGRADE, EXTENSION_UPGRADE)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS seats (
+    login TEXT PRIMARY KEY,
+    last_activity TEXT,
+    surface TEXT,
+    active INTEGER NOT NULL,
+    snapshot_id INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL UNIQUE,
+    as_of TEXT NOT NULL,
+    window_days INTEGER NOT NULL,
+    total_users INTEGER NOT NULL,
+    active_users INTEGER NOT NULL,
+    added INTEGER NOT NULL,
+    removed INTEGER NOT NULL,
+    newly_active INTEGER NOT NULL,
+    newly_inactive INTEGER NOT NULL,
+    ide_upgrades INTEGER NOT NULL,
+    extension_upgrades INTEGER NOT NULL,
+    changed_rows INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS snapshots_as_of ON snapshots (as_of);
+CREATE TABLE IF NOT EXISTS changes (
+    snapshot_id INTEGER NOT NULL,
+    login TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    old_value TEXT,
+    new_value TEXT
+);
+CREATE INDEX IF NOT EXISTS changes_snapshot ON changes (snapshot_id, kind);
+CREATE INDEX IF NOT EXISTS changes_login ON changes (login);
+"""
+
+_FILENAME_TIME = re.compile(r"(\d{4})-?(\d{2})-?(\d{2})(?:[T_ -]?(\d{2})[-:]?(\d{2})(?:[-:]?(\d{2}))?)?")
+
+
+def snapshot_time(csv_path: str) -> datetime:
+    """As-of time of a snapshot: a timestamp in the file name, else its mtime (UTC)."""
+    match = _FILENAME_TIME.search(Path(csv_path).name)
+    if match:
+        parts = [int(p) if p else 0 for p in match.groups()]
+        try:
+            return datetime(*parts, tzinfo=timezone.utc)
+        except ValueError:
+            pass
+    return datetime.fromtimestamp(os.path.getmtime(csv_path), tz=timezone.utc)
+
+
+def snapshot_source(csv_path: str) -> str:
+    """Key a snapshot is stored under: its resolved path, so equally named exports stay apart."""
+    return str(Path(csv_path).resolve())
+
+
+def version_key(version: Optional[str]) -> Optional[Tuple[int, ...]]:
+    """Numeric sort key for a dotted version, None if it is not purely numeric."""
+    if not version:
+        return None
+    try:
+        return tuple(int(p) for p in version.split('.'))
+    except ValueError:
+        return None
+
+
+def is_upgrade(old: Optional[str], new: Optional[str]) -> bool:
+    old_key, new_key = version_key(old), version_key(new)
+    return old_key is not None and new_key is not None and new_key > old_key
+
+
+class SeatRowsAggregator:
+    """Seat scan aggregator collecting (last activity, surface) per login."""
+
+    def __init__(self):
+        self.columns = None
+        self.width = 0
+        self.seats: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+
+    def start(self, header: List[str]) -> None:
+        login = column_index(header, *LOGIN_COLUMNS, ignore_case=True)
+        if login is None:
+            raise ValueError("Could not find a login column in CSV headers.")
+        activity = column_index(header, ACTIVITY_COLUMN)
+        if activity is None:
+            raise ValueError(f"Could not find '{ACTIVITY_COLUMN}' column in CSV headers.")
+        # A missing surface column reads as the padding past the last field
+        surface = column_index(header, *SURFACE_COLUMNS, ignore_case=True)
+        if surface is None:
+            surface = len(header)
+        self.columns = (login, activity, surface)
+        self.width = max(self.columns) + 1
+
+    def add(self, row: List[str]) -> None:
+        if len(row) < self.width:
+            row = row + [''] * (self.width - len(row))
+        login, activity, surface = self.columns
+        login = row[login].strip()
+        if login:
+            self.seats[login] = (row[activity].strip() or None, row[surface].strip() or None)
+
+    def merge(self, other: "SeatRowsAggregator") -> None:
+        self.seats.update(other.seats)
+
+
+class SeatState:
+    """
+    SQLite-backed seat state with per-snapshot deltas.
+
+    ingest() reads a snapshot once, loads the stored rows of just the
+    logins it contains (and of the logins it no longer contains) through a
+    temporary table, and writes only the seats that changed plus one
+    change record per delta, in a single transaction.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_DB):
+        self.db_path = db_path
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def has_snapshot(self, csv_path: str) -> bool:
+        """Whether the CSV at this path was already ingested."""
+        return self.conn.execute("SELECT 1 FROM snapshots WHERE source = ?",
+                                 (snapshot_source(csv_path),)).fetchone() is not None
+
+    def ingest(self, csv_path: str, window_days: int = 60, as_of: Optional[datetime] = None,
+               workers: int = 1) -> dict:
+        """
+        Diff a snapshot CSV against the stored state and record the deltas.
+
+        Args:
+            csv_path: Path to the seat activity CSV
+            window_days: Activity window used to decide whether a seat is active
+            as_of: Snapshot time (defaults to snapshot_time(csv_path))
+            workers: Worker processes for reading large files
+
+        Returns:
+            The snapshot summary row as a dictionary
+        """
+        source = snapshot_source(csv_path)
+        if self.has_snapshot(csv_path):
+            raise ValueError(f"Snapshot {source} was already ingested")
+        as_of = as_of or snapshot_time(csv_path)
+        latest = self.conn.execute("SELECT MAX(as_of) FROM snapshots").fetchone()[0]
+        if latest is not None and as_of.isoformat() < latest:
+            raise ValueError(f"Snapshot {source} ({as_of.isoformat()}) is older than the latest ingested ({latest})")
+
+        rows, = scan(csv_path, [SeatRowsAggregator()], workers=workers)
+        cutoff = as_of - timedelta(days=window_days)
+        self.conn.execute("CREATE TEMP TABLE incoming (login TEXT PRIMARY KEY)")
+        try:
+            self.conn.executemany("INSERT INTO incoming (login) VALUES (?)", ((login,) for login in rows.seats))
+            previous = {row[0]: row[1:] for row in self.conn.execute(
+                "SELECT login, last_activity, surface, active FROM seats JOIN incoming USING (login)")}
+            removed = self.conn.execute(
+                "SELECT login, surface FROM seats WHERE login NOT IN (SELECT login FROM incoming)").fetchall()
+        finally:
+            self.conn.execute("DROP TABLE temp.incoming")
+
+        parsed_surfaces = {}
+
+        def surface_parts(surface):
+            if surface not in parsed_surfaces:
+                parsed_surfaces[surface] = parse_surface(surface)
+            return parsed_surfaces[surface]
+
+        upserts, changes = [], []
+        active_users = 0
+        for login, (activity, surface) in rows.seats.items():
+            activity_date = parse_activity(activity)
+            active = int(activity_date is not None and activity_date >= cutoff)
+            active_users += active
+            old = previous.get(login)
+            if old is None:
+                changes.append((login, ADDED, None, surface))
+                upserts.append((login, activity, surface, active))
+                continue
+            old_activity, old_surface, old_active = old
+            if (activity, surface, active) == old:
+                continue
+            upserts.append((login, activity, surface, active))
+            if active and not old_active:
+                changes.append((login, NEWLY_ACTIVE, old_activity, activity))
+            elif old_active and not active:
+                changes.append((login, NEWLY_INACTIVE, old_activity, activity))
+            if surface != old_surface:
+                old_ide, old_ide_ver, old_ext, old_ext_ver = surface_parts(old_surface)
+                ide, ide_ver, ext, ext_ver = surface_parts(surface)
+                if ide and old_ide and ide.lower() == old_ide.lower() and is_upgrade(old_ide_ver, ide_ver):
+                    changes.append((login, IDE_UPGRADE, old_ide_ver, ide_ver))
+                if ext and old_ext and ext.lower() == old_ext.lower() and is_upgrade(old_ext_ver, ext_ver):
+                    changes.append((login, EXTENSION_UPGRADE, old_ext_ver, ext_ver))
+        changes.extend((login, REMOVED, surface, None) for login, surface in removed)
+
+        counts = {kind: 0 for kind in CHANGE_KINDS}
+        for _, kind, _, _ in changes:
+            counts[kind] += 1
+        summary = {
+            'source': source,
+            'as_of': as_of.isoformat(),
+            'window_days': window_days,
+            'total_users': len(rows.seats),
+            'active_users': active_users,
+            'added': counts[ADDED],
+            'removed': counts[REMOVED],
+            'newly_active': counts[NEWLY_ACTIVE],
+            'newly_inactive': counts[NEWLY_INACTIVE],
+            'ide_upgrades': counts[IDE_UPGRADE],
+            'extension_upgrades': counts[EXTENSION_UPGRADE],
+            'changed_rows': len(upserts) + len(removed),
+        }
+
+        with self.conn:
+            cursor = self.conn.execute(
+                f"INSERT INTO snapshots ({', '.join(summary)}) VALUES ({', '.join('?' * len(summary))})",
+                tuple(summary.values()))
+            snapshot_id = cursor.lastrowid
+            self.conn.executemany(
+                "INSERT INTO seats (login, last_activity, surface, active, snapshot_id) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (login) DO UPDATE SET last_activity = excluded.last_activity, "
+                "surface = excluded.surface, active = excluded.active, snapshot_id = excluded.snapshot_id",
+                [row + (snapshot_id,) for row in upserts])
+            self.conn.executemany("DELETE FROM seats WHERE login = ?", [(login,) for login, _ in removed])
+            self.conn.executemany(
+                "INSERT INTO changes (snapshot_id, login, kind, old_value, new_value) VALUES (?, ?, ?, ?, ?)",
+                [(snapshot_id,) + change for change in changes])
+        summary['id'] = snapshot_id
+        return summary
+
+    def trend(self) -> List[dict]:
+        """Summary of every snapshot, oldest first."""
+        cursor = self.conn.execute("SELECT * FROM snapshots ORDER BY as_of, id")
+        names = [d[0] for d in cursor.description]
+        return [dict(zip(names, row)) for row in cursor]
+
+    def changes(self, snapshot_id: int, kind: Optional[str] = None) -> List[Tuple[str, str, Optional[str], Optional[str]]]:
+        """(login, kind, old, new) changes recorded for a snapshot."""
+        if kind is None:
+            cursor = self.conn.execute(
+                "SELECT login, kind, old_value, new_value FROM changes WHERE snapshot_id = ? ORDER BY kind, login",
+                (snapshot_id,))
+        else:
+            cursor = self.conn.execute(
+                "SELECT login, kind, old_value, new_value FROM changes WHERE snapshot_id = ? AND kind = ? ORDER BY login",
+                (snapshot_id, kind))
+        return cursor.fetchall()
+
+
+def print_summary(summary: dict) -> None:
+    total = summary['total_users']
+    percentage = (summary['active_users'] / total * 100) if total > 0 else 0
+    print(f"Snapshot {summary['id']}: {summary['source']} (as of {summary['as_of'][:10]})")
+    print(f"  Users: {total:,}, active: {summary['active_users']:,} ({percentage:.2f}%)")
+    print(f"  Added: {summary['added']:,}  Removed: {summary['removed']:,}  "
+          f"Newly active: {summary['newly_active']:,}  Newly inactive: {summary['newly_inactive']:,}")
+    print(f"  IDE upgrades: {summary['ide_upgrades']:,}  Extension upgrades: {summary['extension_upgrades']:,}  "
+          f"Rows written: {summary['changed_rows']:,}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Track seat activity across snapshots in a SQLite state store.")
+    parser.add_argument("--db", default=DEFAULT_DB, help="State database (default: %(default)s)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    ingest = commands.add_parser("ingest", help="Diff snapshots against the stored state")
+    ingest.add_argument("csv_paths", nargs="*", help="Snapshot CSVs (default: every new scripts/seat-activity-*.csv)")
+    ingest.add_argument("--days", type=int, default=60, help="Activity window in days (default: 60)")
+    ingest.add_argument("--workers", type=int, default=1, help="Worker processes for splitting large files (default: 1)")
+
+    commands.add_parser("trend", help="Show per-snapshot totals and deltas")
+
+    changes = commands.add_parser("changes", help="List the changes recorded for a snapshot")
+    changes.add_argument("snapshot_id", type=int, help="Snapshot id (see trend)")
+    changes.add_argument("--kind", choices=CHANGE_KINDS, help="Only show one kind of change")
+    args = parser.parse_args()
+
+    state = SeatState(args.db)
+    try:
+        if args.command == "ingest":
+            csv_paths = args.csv_paths
+            if not csv_paths:
+                found = sorted(Path(__file__).resolve().parent.glob("seat-activity-*.csv"))
+                csv_paths = [str(p) for p in found if not state.has_snapshot(str(p))]
+                if not csv_paths:
+                    print("No new seat activity CSVs found in scripts/")
+                    return
+            for csv_path in csv_paths:
+                if not Path(csv_path).exists():
+                    print(f"CSV not found: {csv_path}", file=sys.stderr)
+                    sys.exit(1)
+            # Oldest first, so deltas chain in order
+            for csv_path in sorted(csv_paths, key=snapshot_time):
+                try:
+                    print_summary(state.ingest(csv_path, args.days, workers=args.workers))
+                except ValueError as e:
+                    print(e, file=sys.stderr)
+                    sys.exit(1)
+
+        elif args.command == "trend":
+            rows = state.trend()
+            if not rows:
+                print("No snapshots ingested yet.")
+                return
+            print(f"{'id':>4}  {'as of':10}  {'users':>9}  {'active':>9}  {'active%':>8}  {'+seats':>7}  {'-seats':>7}  "
+                  f"{'+active':>8}  {'-active':>8}  {'ide up':>7}  {'ext up':>7}")
+            for r in rows:
+                percentage = (r['active_users'] / r['total_users'] * 100) if r['total_users'] > 0 else 0
+                print(f"{r['id']:>4}  {r['as_of'][:10]:10}  {r['total_users']:>9,}  {r['active_users']:>9,}  "
+                      f"{percentage:>7.2f}%  {r['added']:>7,}  {r['removed']:>7,}  {r['newly_active']:>8,}  "
+                      f"{r['newly_inactive']:>8,}  {r['ide_upgrades']:>7,}  {r['extension_upgrades']:>7,}")
+
+        else:
+            for login, kind, old, new in state.changes(args.snapshot_id, args.kind):
+                print(f"{kind:18} {login}: {old or '-'} -> {new or '-'}")
+    finally:
+        state.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Tests for multi-file, multi-window seat activity analysis."""
+
+import csv
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analyze_seat_activity import analyze_seat_activity, analyze_seat_activity_windows, print_windows_table
+
+NOW = datetime(2025, 12, 1, 12, 0, tzinfo=timezone.utc)
+WINDOWS = [90, 7, 30]
+
+
+def _write_activity(path, ages):
+    """One seat per age in days; None leaves the activity empty."""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Login", "Last Activity At", "Last Surface Used"])
+        for n, age in enumerate(ages):
+            activity = "" if age is None else (NOW - timedelta(days=age)).strftime("%Y-%m-%dT%H:%M:%SZ")
+            writer.writerow([f"user{n}", activity, "vscode/1.99.3/"])
+    return str(path)
+
+
+@pytest.fixture
+def csv_paths(tmp_path):
+    return [
+        _write_activity(tmp_path / "org-a.csv", [0, 1, 6.9, 7.1, 29, 31, 89, 91, 400, None]),
+        _write_activity(tmp_path / "org-b.csv", [2, 45, None, None, 120]),
+        _write_activity(tmp_path / "org-c.csv", []),
+    ]
+
+
+class TestWindows:
+    """Test that every window matches a single-window serial run."""
+
+    def test_each_window_matches_analyze_seat_activity(self, csv_paths):
+        """Per file and window, counts should equal analyze_seat_activity at the same time."""
+        results = analyze_seat_activity_windows(csv_paths, WINDOWS, now=NOW)
+        assert [r['csv_path'] for r in results] == csv_paths
+        for result in results:
+            assert sorted(result['windows']) == sorted(WINDOWS)
+            for days in WINDOWS:
+                expected = analyze_seat_activity(result['csv_path'], days, now=NOW)
+                assert result['windows'][days] == expected
+                assert result['total_users'] == expected['total_users']
+
+    def test_known_counts(self, csv_paths):
+        """Spot-check the counts against the fixture's activity ages."""
+        first = analyze_seat_activity_windows(csv_paths, WINDOWS, now=NOW)[0]
+        assert first['total_users'] == 10
+        assert [first['windows'][days]['active_users'] for days in (7, 30, 90)] == [3, 5, 7]
+
+    def test_total_row_sums_serial_runs(self, csv_paths, capsys):
+        """The TOTAL row should add up the per-file counts for every window."""
+        print_windows_table(analyze_seat_activity_windows(csv_paths, WINDOWS, now=NOW), WINDOWS)
+        lines = capsys.readouterr().out.splitlines()
+        total = next(line for line in lines if line.startswith("TOTAL"))
+
+        users = sum(analyze_seat_activity(path, now=NOW)['total_users'] for path in csv_paths)
+        cells = [f"{users:,}"]
+        for days in sorted(WINDOWS):
+            active = sum(analyze_seat_activity(path, days, now=NOW)['active_users'] for path in csv_paths)
+            cells.append(f"{active:,} ({active / users * 100:.2f}%)")
+        assert total.split(None, 1)[1].split() == " ".join(cells).split()
+        assert "Activity cutoffs: 7d = 2025-11-24, 30d = 2025-11-01, 90d = 2025-09-02" in lines
@@ -0,0 +1,106 @@
+"""Tests for the memoized surface version counts."""
+
+import os
+import random
+import sys
+from collections import Counter
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import report_seat_versions
+from report_seat_versions import SurfaceAggregator, is_copilot_extension, parse_surface
+
+HEADER = ["login", "last_activity_at", "Last Surface Used"]
+
+
+def _rows(count, seed=0):
+    rng = random.Random(seed)
+    surfaces = ["None", "", "  none ", "unknown", "vscode", "/1.2/", " vscode / 1.99.3 / Copilot-Chat / 0.26.7 "]
+    for minor in range(30):
+        surfaces.append(f"vscode/1.{minor}.{rng.randint(0, 3)}/copilot-chat/0.{minor // 3}.{rng.randint(0, 9)}")
+        surfaces.append(f"VSCode/1.{minor}.0/copilot/1.{200 + minor}.0")
+        surfaces.append(f"JetBrains-IC/{240 + minor // 10}.{rng.randint(10000, 29999)}.{minor}/")
+        surfaces.append(f"VisualStudio/17.{minor % 12}.{minor}/copilot-vs/1.{minor}.0.0")
+        surfaces.append(f"vscode/1.{minor}.0/other-ext/2.0")
+    rows = [[f"user{n}", "2025-01-01T00:00:00Z", rng.choice(surfaces)] for n in range(count)]
+    # A row cut short before the surface column counts as empty
+    rows.append(["short", "2025-01-01T00:00:00Z"])
+    return rows
+
+
+def _legacy_counts(rows, surface_col=2):
+    """The per-row parse_surface loop the aggregator replaced."""
+    ide_counts = Counter()
+    copilot_version_counts = Counter()
+    copilot_name_version_counts = Counter()
+    malformed_surfaces = 0
+    empty_surfaces = 0
+    for row in rows:
+        raw_surface = row[surface_col] if surface_col < len(row) else None
+        ide_name, ide_ver, ext_name, ext_ver = parse_surface(raw_surface)
+        if ide_name is None or ide_ver is None:
+            if raw_surface and raw_surface.strip().lower() != "none":
+                malformed_surfaces += 1
+            else:
+                empty_surfaces += 1
+            continue
+        ide_counts[f"{ide_name.lower()}/{ide_ver}"] += 1
+        if is_copilot_extension(ext_name) and ext_ver:
+            copilot_version_counts[ext_ver] += 1
+            copilot_name_version_counts[f"{ext_name.lower()}/{ext_ver}"] += 1
+    return ide_counts, copilot_version_counts, copilot_name_version_counts, malformed_surfaces, empty_surfaces
+
+
+def _aggregate(rows):
+    surfaces = SurfaceAggregator()
+    surfaces.start(HEADER)
+    for row in rows:
+        surfaces.add(row)
+    return surfaces
+
+
+def _counts(surfaces):
+    return (surfaces.ide_counts, surfaces.copilot_version_counts, surfaces.copilot_name_version_counts,
+            surfaces.malformed_surfaces, surfaces.empty_surfaces)
+
+
+class TestSurfaceAggregator:
+    """Test SurfaceAggregator against per-row parsing."""
+
+    def test_matches_per_row_parsing(self):
+        """Counts, and their first-seen order for ties, should match the old loop."""
+        rows = _rows(5000)
+        actual, expected = _counts(_aggregate(rows)), _legacy_counts(rows)
+        assert actual == expected
+        for counter, legacy in zip(actual[:3], expected[:3]):
+            assert counter.most_common() == legacy.most_common()
+
+    def test_merge_reinterns_keys(self):
+        """Merging aggregators that numbered keys differently should add up correctly."""
+        rows = _rows(4000, seed=1)
+        # Reversing one half changes first-seen order, so the two key tables disagree on codes
+        left, right = _aggregate(rows[:2000]), _aggregate(list(reversed(rows[2000:])))
+        left.merge(right)
+        assert _counts(left) == _legacy_counts(rows)
+
+    def test_merge_into_empty_aggregator(self):
+        """An aggregator that saw no rows should take on the other's counts."""
+        rows = _rows(500, seed=2)
+        merged = _aggregate([])
+        merged.merge(_aggregate(rows))
+        assert _counts(merged) == _legacy_counts(rows)
+
+    def test_cache_overflow_still_counts_every_row(self, monkeypatch):
+        """Surfaces beyond the cache limit should be parsed per row and counted the same."""
+        monkeypatch.setattr(report_seat_versions, "MAX_CACHED_SURFACES", 5)
+        rows = _rows(3000, seed=3)
+        surfaces = _aggregate(rows)
+        assert len(surfaces._cache) == 5
+        assert _counts(surfaces) == _legacy_counts(rows)
+
+    def test_missing_surface_column_raises(self):
+        """A header without a surface column should be rejected."""
+        with pytest.raises(ValueError):
+            SurfaceAggregator().start(["login", "last_activity_at"])
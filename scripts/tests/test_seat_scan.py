@@ -0,0 +1,79 @@
+"""Tests for the single-pass seat CSV scanner."""
+
+import csv
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analyze_seat_activity import ActivityAggregator
+from report_seat_versions import SurfaceAggregator
+from seat_scan import byte_ranges, scan
+from seat_state import SeatRowsAggregator
+
+AS_OF = datetime(2025, 12, 1, tzinfo=timezone.utc)
+CUTOFFS = [AS_OF - timedelta(days=days) for days in (90, 60, 30, 7)]
+
+SURFACES = [
+    "vscode/1.99.3/copilot-chat/0.26.7",
+    "vscode/1.100.0/copilot/1.300.0",
+    "JetBrains-IC/251.26927.53/",
+    "VisualStudio/17.8.21/copilot-vs/1.0.0",
+    "None",
+    "",
+    "not a surface",
+]
+
+
+def _write_seats(path, count):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Login", "Last Activity At", "Last Surface Used"])
+        for n in range(count):
+            seen = AS_OF - timedelta(days=n % 120, hours=n % 24)
+            activity = "" if n % 11 == 0 else seen.strftime("%Y-%m-%dT%H:%M:%SZ")
+            # Quoted fields must not throw the chunking off (line breaks inside
+            # fields are not supported in parallel scans; exports have none)
+            surface = 'weird, "quoted" surface' if n % 97 == 0 else SURFACES[n % len(SURFACES)]
+            writer.writerow([f"user{n}", activity, surface])
+            if n % 53 == 0:
+                f.write("\n")
+    return str(path)
+
+
+def _scan(path, **kwargs):
+    return scan(path, [ActivityAggregator(CUTOFFS), SurfaceAggregator(), SeatRowsAggregator()], **kwargs)
+
+
+class TestParallelScan:
+    """Test that the chunked parallel scan matches the serial scan."""
+
+    @pytest.fixture
+    def seats_csv(self, tmp_path):
+        return _write_seats(tmp_path / "seats.csv", 2000)
+
+    @pytest.mark.parametrize("workers, chunk_size", [(2, 1 << 20), (3, 4096), (4, 257)])
+    def test_results_match_serial(self, seats_csv, workers, chunk_size):
+        """Every aggregator should end with the same results in both modes."""
+        activity, surfaces, seats = _scan(seats_csv)
+        par_activity, par_surfaces, par_seats = _scan(seats_csv, workers=workers, chunk_size=chunk_size)
+
+        assert activity.total_users == 2000
+        assert par_activity.total_users == activity.total_users
+        assert par_activity.active_counts() == activity.active_counts()
+        assert par_surfaces.ide_counts == surfaces.ide_counts
+        assert par_surfaces.copilot_version_counts == surfaces.copilot_version_counts
+        assert par_surfaces.copilot_name_version_counts == surfaces.copilot_name_version_counts
+        assert par_surfaces.malformed_surfaces == surfaces.malformed_surfaces
+        assert par_surfaces.empty_surfaces == surfaces.empty_surfaces
+        assert par_seats.seats == seats.seats
+
+    def test_ranges_cover_the_rows(self, seats_csv):
+        """Byte ranges should be contiguous and cover everything after the header."""
+        header, ranges = byte_ranges(seats_csv, 7)
+        assert ranges[0][0] == len(header)
+        assert ranges[-1][1] == os.path.getsize(seats_csv)
+        assert all(end == start for (_, end), (start, _) in zip(ranges, ranges[1:]))
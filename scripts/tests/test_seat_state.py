@@ -0,0 +1,168 @@
+"""Tests for the SQLite seat state store."""
+
+import csv
+import os
+import sys
+from datetime import datetime, timezone
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import seat_state
+from seat_state import (ADDED, EXTENSION_UPGRADE, IDE_UPGRADE, NEWLY_ACTIVE, NEWLY_INACTIVE, REMOVED,
+                        SeatState, snapshot_time)
+
+
+def _write_snapshot(directory, date, seats):
+    path = directory / f"seat-activity-{date}.csv"
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Login", "Last Activity At", "Last Surface Used"])
+        for login, activity, surface in seats:
+            writer.writerow([login, activity, surface])
+    return str(path)
+
+
+FIRST = [
+    ("alice", "2025-11-20T10:00:00Z", "vscode/1.99.3/copilot-chat/0.26.7"),
+    ("bob", "2025-08-01T10:00:00Z", "JetBrains-IC/251.26927.53/"),
+    ("carol", "2025-11-25T10:00:00Z", "vscode/1.99.3/copilot/1.300.0"),
+    ("dave", "", "None"),
+]
+
+SECOND = [
+    ("alice", "2025-12-10T10:00:00Z", "vscode/1.100.0/copilot-chat/0.27.1"),
+    ("bob", "2025-12-12T10:00:00Z", "JetBrains-IC/251.26927.53/"),
+    ("carol", "2025-11-25T10:00:00Z", "vscode/1.99.3/copilot/1.300.0"),
+    ("erin", "2025-12-14T10:00:00Z", "vscode/1.100.0/"),
+]
+
+
+@pytest.fixture
+def state(tmp_path):
+    state = SeatState(str(tmp_path / "state.db"))
+    yield state
+    state.close()
+
+
+class TestIngest:
+    """Test diffing snapshots against the stored state."""
+
+    def test_first_snapshot_adds_every_seat(self, state, tmp_path):
+        """Every seat in the first snapshot should be recorded as added."""
+        summary = state.ingest(_write_snapshot(tmp_path, "2025-12-01", FIRST))
+        assert summary["as_of"] == "2025-12-01T00:00:00+00:00"
+        assert (summary["total_users"], summary["active_users"], summary["added"]) == (4, 2, 4)
+        assert summary["changed_rows"] == 4
+        assert [c[:2] for c in state.changes(summary["id"])] == [
+            ("alice", ADDED), ("bob", ADDED), ("carol", ADDED), ("dave", ADDED)]
+
+    def test_second_snapshot_records_deltas(self, state, tmp_path):
+        """Only seats that changed should be written, with one change per delta."""
+        state.ingest(_write_snapshot(tmp_path, "2025-12-01", FIRST))
+        summary = state.ingest(_write_snapshot(tmp_path, "2025-12-15", SECOND))
+
+        assert summary["total_users"] == 4
+        assert summary["active_users"] == 4
+        assert (summary["added"], summary["removed"]) == (1, 1)
+        assert (summary["newly_active"], summary["newly_inactive"]) == (1, 0)
+        assert (summary["ide_upgrades"], summary["extension_upgrades"]) == (1, 1)
+        # alice and bob changed, erin is new, dave is gone; carol is untouched
+        assert summary["changed_rows"] == 4
+        assert state.changes(summary["id"]) == [
+            ("erin", ADDED, None, "vscode/1.100.0/"),
+            ("alice", EXTENSION_UPGRADE, "0.26.7", "0.27.1"),
+            ("alice", IDE_UPGRADE, "1.99.3", "1.100.0"),
+            ("bob", NEWLY_ACTIVE, "2025-08-01T10:00:00Z", "2025-12-12T10:00:00Z"),
+            ("dave", REMOVED, "None", None),
+        ]
+
+    def test_aging_out_is_newly_inactive(self, state, tmp_path):
+        """A seat with unchanged activity should turn inactive once it leaves the window."""
+        state.ingest(_write_snapshot(tmp_path, "2025-12-01", FIRST))
+        summary = state.ingest(_write_snapshot(tmp_path, "2026-03-01", FIRST))
+        assert summary["newly_inactive"] == 2
+        assert [c[0] for c in state.changes(summary["id"], NEWLY_INACTIVE)] == ["alice", "carol"]
+
+    def test_reingest_is_rejected(self, state, tmp_path):
+        """Ingesting the same snapshot twice should raise and record nothing."""
+        path = _write_snapshot(tmp_path, "2025-12-01", FIRST)
+        state.ingest(path)
+        with pytest.raises(ValueError, match="already ingested"):
+            state.ingest(path)
+        assert len(state.trend()) == 1
+
+    def test_older_snapshot_is_rejected(self, state, tmp_path):
+        """Snapshots must be ingested oldest first."""
+        state.ingest(_write_snapshot(tmp_path, "2025-12-15", SECOND))
+        with pytest.raises(ValueError, match="older than"):
+            state.ingest(_write_snapshot(tmp_path, "2025-12-01", FIRST))
+
+    def test_same_file_name_in_other_directory_is_a_new_snapshot(self, state, tmp_path):
+        """Snapshots should be keyed by path, not by file name alone."""
+        (tmp_path / "org-a").mkdir()
+        (tmp_path / "org-b").mkdir()
+        state.ingest(_write_snapshot(tmp_path / "org-a", "2025-12-01", FIRST))
+        summary = state.ingest(_write_snapshot(tmp_path / "org-b", "2025-12-01", SECOND))
+        assert summary["source"] == str((tmp_path / "org-b" / "seat-activity-2025-12-01.csv").resolve())
+        assert len(state.trend()) == 2
+
+    def test_state_survives_reopening(self, state, tmp_path):
+        """Deltas should be computed against the state stored by an earlier process."""
+        state.ingest(_write_snapshot(tmp_path, "2025-12-01", FIRST))
+        state.close()
+        reopened = SeatState(state.db_path)
+        try:
+            summary = reopened.ingest(_write_snapshot(tmp_path, "2025-12-15", SECOND))
+        finally:
+            reopened.close()
+        assert (summary["added"], summary["removed"]) == (1, 1)
+
+
+class TestQueries:
+    """Test the trend and changes queries."""
+
+    def test_trend_lists_snapshots_oldest_first(self, state, tmp_path):
+        """trend() should return one summary per snapshot in as-of order."""
+        first = state.ingest(_write_snapshot(tmp_path, "2025-12-01", FIRST))
+        second = state.ingest(_write_snapshot(tmp_path, "2025-12-15", SECOND))
+        trend = state.trend()
+        assert [row["id"] for row in trend] == [first["id"], second["id"]]
+        assert trend[1] == second
+
+    def test_changes_filters_by_kind(self, state, tmp_path):
+        """changes() should only return the requested kind."""
+        state.ingest(_write_snapshot(tmp_path, "2025-12-01", FIRST))
+        summary = state.ingest(_write_snapshot(tmp_path, "2025-12-15", SECOND))
+        assert state.changes(summary["id"], REMOVED) == [("dave", REMOVED, "None", None)]
+        assert state.changes(summary["id"] + 1) == []
+
+
+class TestCommandLine:
+    """Test the ingest command's handling of its arguments."""
+
+    def test_missing_csv_is_reported(self, tmp_path, monkeypatch, capsys):
+        """A missing file should print an error, not a traceback from sorting by mtime."""
+        existing = _write_snapshot(tmp_path, "2025-12-01", FIRST)
+        missing = str(tmp_path / "export.csv")
+        monkeypatch.setattr(sys, "argv", ["seat_state.py", "--db", str(tmp_path / "state.db"),
+                                          "ingest", existing, missing])
+        with pytest.raises(SystemExit) as exit_info:
+            seat_state.main()
+        assert exit_info.value.code == 1
+        assert capsys.readouterr().err.strip() == f"CSV not found: {missing}"
+
+
+class TestDefaults:
+    """Test snapshot times and the default store location."""
+
+    def test_snapshot_time_from_file_name(self, tmp_path):
+        """A date in the file name should set the as-of time."""
+        path = _write_snapshot(tmp_path, "2025-12-01", FIRST)
+        assert snapshot_time(path) == datetime(2025, 12, 1, tzinfo=timezone.utc)
+
+    def test_default_db_is_outside_the_repo(self):
+        """The default store should not be written next to the scripts."""
+        scripts = os.path.dirname(os.path.abspath(seat_state.__file__))
+        assert not os.path.abspath(seat_state.DEFAULT_DB).startswith(scripts + os.sep)
@@ -0,0 +1,167 @@
+"""
+Columnar revenue analytics over orders.
+
+Requires numpy (pip install numpy); the rest of the order system does not.
+"""
+
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Union
+from models import Customer, Product, Order
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional for everything except this module
+    np = None
+
+
+def round_cents(values: "np.ndarray") -> "np.ndarray":
+    """
+    Round to 2 decimals exactly as Python's round(x, 2) does.
+
+    np.round scales by 100 and rounds, which can land on the other side of
+    a half-cent tie than Python's correctly rounded round(). Values within a
+    hair of a tie are therefore re-rounded with round() itself; everything
+    else takes the vectorized path, which agrees with round() away from ties.
+    """
+    scaled = values * 100
+    rounded = np.rint(scaled) / 100
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    for i in np.flatnonzero(near_tie):
+        rounded[i] = round(float(values[i]), 2)
+    return rounded
+
+
+class OrderFrame:
+    """
+    Orders, items, products and customers as NumPy columns.
+
+    Order totals reproduce OrderProcessor.calculate_order_total to the cent:
+    line totals are accumulated per order in item order, the customer's
+    membership discount is applied, and the result is rounded like round().
+    Orders with invalid structure total 0, missing products contribute
+    nothing and orders from unknown customers get no discount. Pricing
+    rules are not modelled, so a processor built with pricing_rules cannot
+    be turned into a frame.
+    """
+
+    def __init__(
+        self,
+        orders: Sequence[Order],
+        products: Union[Mapping[str, Product], Iterable[Product]],
+        customers: Union[Mapping[str, Customer], Iterable[Customer]],
+    ):
+        if np is None:
+            raise ImportError("analytics requires numpy: pip install numpy")
+
+        products = list(products.values()) if isinstance(products, Mapping) else list(products)
+        customers = list(customers.values()) if isinstance(customers, Mapping) else list(customers)
+
+        self.product_ids: List[str] = [p.id for p in products]
+        product_codes = {pid: n for n, pid in enumerate(self.product_ids)}
+        self.categories: List[str] = sorted({p.category for p in products})
+        category_codes = {c: n for n, c in enumerate(self.categories)}
+        self.prices = np.fromiter((p.price for p in products), dtype=np.float64, count=len(products))
+        self.product_category = np.fromiter(
+            (category_codes[p.category] for p in products), dtype=np.int64, count=len(products)
+        )
+
+        self.customer_ids: List[str] = [c.id for c in customers]
+        customer_codes = {cid: n for n, cid in enumerate(self.customer_ids)}
+        self.discount_rates = np.fromiter(
+            (c.get_discount_rate() for c in customers), dtype=np.float64, count=len(customers)
+        )
+
+        n_orders = len(orders)
+        self.order_ids: List[str] = [o.id for o in orders]
+        self.order_customer = np.fromiter(
+            (customer_codes.get(o.customer_id, -1) for o in orders), dtype=np.int64, count=n_orders
+        )
+        self.order_valid = np.fromiter((o.is_valid() for o in orders), dtype=bool, count=n_orders)
+        self.days: List[str] = sorted({o.order_date[:10] for o in orders})
+        day_codes = {d: n for n, d in enumerate(self.days)}
+        self.order_day = np.fromiter(
+            (day_codes[o.order_date[:10]] for o in orders), dtype=np.int64, count=n_orders
+        )
+        self.statuses: List[str] = list(Order.VALID_STATUSES)
+        status_codes = {s: n for n, s in enumerate(self.statuses)}
+        self.order_status = np.fromiter(
+            (status_codes.get(o.status, -1) for o in orders), dtype=np.int64, count=n_orders
+        )
+
+        n_items = sum(len(o.items) for o in orders)
+        self.item_order = np.fromiter(
+            (n for n, o in enumerate(orders) for _ in o.items), dtype=np.int64, count=n_items
+        )
+        self.item_product = np.fromiter(
+            (product_codes.get(i.product_id, -1) for o in orders for i in o.items),
+            dtype=np.int64, count=n_items,
+        )
+        self.item_quantity = np.fromiter(
+            (i.quantity for o in orders for i in o.items), dtype=np.int64, count=n_items
+        )
+
+    @classmethod
+    def from_processor(cls, processor, orders: Sequence[Order]) -> "OrderFrame":
+        """
+        Build a frame from an OrderProcessor's current products and customers.
+        Raises ValueError if the processor prices orders with pricing rules.
+        """
+        if processor.pricing is not None:
+            raise ValueError("OrderFrame totals do not apply pricing rules; "
+                             "the processor was built with pricing_rules")
+        return cls(orders, processor.products, processor.customers)
+
+    def __len__(self) -> int:
+        return len(self.order_ids)
+
+    def line_totals(self) -> "np.ndarray":
+        """price * quantity for every item, 0 where the product is unknown."""
+        known = self.item_product >= 0
+        return np.where(known, self.prices[np.where(known, self.item_product, 0)], 0.0) * self.item_quantity
+
+    def order_discount_rates(self) -> "np.ndarray":
+        """Membership discount rate per order, 0 for unknown customers."""
+        known = self.order_customer >= 0
+        return np.where(known, self.discount_rates[np.where(known, self.order_customer, 0)], 0.0)
+
+    def order_totals(self) -> "np.ndarray":
+        """Discounted, rounded total per order, aligned with order_ids."""
+        # bincount adds weights in input order, matching the per-order float loop
+        subtotals = np.bincount(self.item_order, weights=self.line_totals(), minlength=len(self))
+        totals = round_cents(subtotals * (1 - self.order_discount_rates()))
+        totals[~self.order_valid] = 0.0
+        return totals
+
+    def _order_mask(self, statuses: Optional[Iterable[str]]) -> "np.ndarray":
+        if statuses is None:
+            return np.ones(len(self), dtype=bool)
+        codes = [self.statuses.index(s) for s in statuses if s in self.statuses]
+        return np.isin(self.order_status, codes)
+
+    def revenue_by_customer(self, statuses: Optional[Iterable[str]] = None) -> Dict[str, float]:
+        """Sum of order totals per known customer, optionally for some statuses only."""
+        mask = self._order_mask(statuses) & (self.order_customer >= 0)
+        return self._group_sum(self.customer_ids, self.order_customer[mask], self.order_totals()[mask])
+
+    def revenue_by_day(self, statuses: Optional[Iterable[str]] = None) -> Dict[str, float]:
+        """Sum of order totals per order day (YYYY-MM-DD)."""
+        mask = self._order_mask(statuses)
+        return self._group_sum(self.days, self.order_day[mask], self.order_totals()[mask])
+
+    def revenue_by_category(self, statuses: Optional[Iterable[str]] = None) -> Dict[str, float]:
+        """
+        Discounted line revenue per product category. Lines are not rounded
+        individually, so these can differ from summed order totals by
+        fractions of a cent per order.
+        """
+        mask = self._order_mask(statuses) & self.order_valid
+        known = self.item_product >= 0
+        lines = self.line_totals() * (1 - self.order_discount_rates()[self.item_order])
+        keep = known & mask[self.item_order]
+        return self._group_sum(self.categories, self.product_category[self.item_product[keep]], lines[keep])
+
+    @staticmethod
+    def _group_sum(labels: List[str], groups: "np.ndarray", values: "np.ndarray") -> Dict[str, float]:
+        """Sum values per group code, rounded to cents, for groups that occur."""
+        sums = round_cents(np.bincount(groups, weights=values, minlength=len(labels)))
+        counts = np.bincount(groups, minlength=len(labels))
+        return {labels[n]: float(sums[n]) for n in np.flatnonzero(counts)}
@@ -0,0 +1,178 @@
+"""Asynchronous order processing over pluggable customer and product repositories."""
+
+import asyncio
+from typing import Dict, Iterable, List, Optional, Protocol, Sequence, Tuple
+from models import Customer, Product, Order
+from order_processor import (
+    INVALID_STRUCTURE_MESSAGE,
+    OrderResult,
+    insufficient_stock_message,
+    order_errors,
+    order_total,
+    product_not_found_message,
+)
+
+
+class CustomerRepository(Protocol):
+    """Async source of customers."""
+
+    async def get(self, customer_id: str) -> Optional[Customer]:
+        ...
+
+
+class ProductRepository(Protocol):
+    """Async source of products that can also reserve stock."""
+
+    async def get(self, product_id: str) -> Optional[Product]:
+        ...
+
+    async def reserve(self, lines: Sequence[Tuple[str, int]]) -> List[str]:
+        """
+        Atomically take stock for (product_id, quantity) lines.
+        Returns error messages; on any error no stock is taken.
+        """
+        ...
+
+
+class InMemoryCustomerRepository:
+    """CustomerRepository backed by a dict."""
+
+    def __init__(self, customers: Iterable[Customer]):
+        self._customers = {c.id: c for c in customers}
+
+    async def get(self, customer_id: str) -> Optional[Customer]:
+        return self._customers.get(customer_id)
+
+
+class InMemoryProductRepository:
+    """ProductRepository backed by a dict."""
+
+    def __init__(self, products: Iterable[Product]):
+        self._products = {p.id: p for p in products}
+
+    async def get(self, product_id: str) -> Optional[Product]:
+        return self._products.get(product_id)
+
+    async def reserve(self, lines: Sequence[Tuple[str, int]]) -> List[str]:
+        # No awaits between the check and the update, so this is atomic on the event loop
+        wanted: Dict[str, int] = {}
+        for product_id, quantity in lines:
+            wanted[product_id] = wanted.get(product_id, 0) + quantity
+
+        errors = []
+        for product_id, quantity in wanted.items():
+            product = self._products.get(product_id)
+            if not product:
+                errors.append(product_not_found_message(product_id))
+            elif not product.is_available(quantity):
+                errors.append(insufficient_stock_message(product, quantity))
+        if errors:
+            return errors
+
+        for product_id, quantity in wanted.items():
+            product = self._products[product_id]
+            product.stock_quantity -= quantity
+            if product.stock_quantity == 0:
+                product.in_stock = False
+        return errors
+
+
+class AsyncOrderProcessor:
+    """Async counterpart of OrderProcessor."""
+
+    def __init__(self, customers: CustomerRepository, products: ProductRepository):
+        self.customers = customers
+        self.products = products
+
+    async def get_customer(self, customer_id: str) -> Optional[Customer]:
+        """Retrieve a customer by ID."""
+        return await self.customers.get(customer_id)
+
+    async def get_product(self, product_id: str) -> Optional[Product]:
+        """Retrieve a product by ID."""
+        return await self.products.get(product_id)
+
+    async def _fetch(self, order: Order) -> Tuple[Optional[Customer], Dict[str, Optional[Product]]]:
+        """Look up the order's customer and all of its products concurrently."""
+        product_ids = list(dict.fromkeys(item.product_id for item in order.items))
+        customer, *products = await asyncio.gather(
+            self.customers.get(order.customer_id),
+            *(self.products.get(product_id) for product_id in product_ids),
+        )
+        return customer, dict(zip(product_ids, products))
+
+    async def validate_order(self, order: Order) -> Tuple[bool, List[str]]:
+        """
+        Validate an order and return validation result with error messages.
+        """
+        if not order.is_valid():
+            return False, [INVALID_STRUCTURE_MESSAGE]
+        customer, products = await self._fetch(order)
+        errors = _validation_errors(order, customer, products)
+        return len(errors) == 0, errors
+
+    async def calculate_order_total(self, order: Order) -> float:
+        """Calculate the total price for an order including discounts."""
+        if not order.is_valid():
+            return 0.0
+        customer, products = await self._fetch(order)
+        return _order_total(order, customer, products)
+
+    async def process_order(self, order: Order) -> Tuple[bool, str]:
+        """
+        Process an order: validate, calculate total, and reserve stock.
+        Returns success status and message.
+        """
+        result = await self._process(order)
+        if not result.success:
+            return False, f"Order validation failed: {'; '.join(result.errors)}"
+        return True, f"Order processed successfully. Total: ${result.total:.2f}"
+
+    async def process_orders(self, orders: Iterable[Order], concurrency: int = 32) -> List[OrderResult]:
+        """
+        Process a batch of orders with at most `concurrency` in flight.
+        Results are returned in input order.
+
+        `concurrency` worker coroutines pull orders from one shared iterator,
+        so the number of tasks stays fixed however large the batch is.
+        """
+        orders = list(orders)
+        results: List[Optional[OrderResult]] = [None] * len(orders)
+        pending = enumerate(orders)
+
+        async def worker() -> None:
+            for index, order in pending:
+                results[index] = await self._process(order)
+
+        await asyncio.gather(*(worker() for _ in range(min(max(concurrency, 1), len(orders)))))
+        return results
+
+    async def _process(self, order: Order) -> OrderResult:
+        if not order.is_valid():
+            return OrderResult(order.id, False, errors=[INVALID_STRUCTURE_MESSAGE])
+        customer, products = await self._fetch(order)
+        errors = _validation_errors(order, customer, products)
+        if not errors:
+            # Stock may have moved while the lookups were in flight; the repository re-checks
+            errors = await self.products.reserve(
+                [(item.product_id, item.quantity) for item in order.items]
+            )
+        if errors:
+            return OrderResult(order.id, False, errors=errors)
+        return OrderResult(order.id, True, _order_total(order, customer, products))
+
+
+def _validation_errors(order: Order, customer: Optional[Customer],
+                       products: Dict[str, Optional[Product]]) -> List[str]:
+    found = [products[item.product_id] for item in order.items]
+    return [message for _, message in order_errors(order, customer, found)]
+
+
+def _order_total(order: Order, customer: Optional[Customer],
+                 products: Dict[str, Optional[Product]]) -> float:
+    lines = []
+    for item in order.items:
+        product = products[item.product_id]
+        if product:
+            lines.append((product, item.quantity))
+    return order_total(lines, customer)
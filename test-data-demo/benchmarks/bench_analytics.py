@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Compare per-order revenue loops with the columnar OrderFrame.
+
+Computes order totals and revenue per customer, category and day by
+looping over calculate_order_total, then with OrderFrame, and checks that
+the order totals agree. Requires numpy.
+
+Usage:
+  python3 benchmarks/bench_analytics.py --orders 1000000
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import defaultdict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analytics import OrderFrame
+from order_processor import OrderProcessor
+from synthetic import Scale, generate_customers, generate_orders, generate_products
+
+
+def loop_revenue(processor: OrderProcessor, orders):
+    totals = []
+    by_customer, by_category, by_day = defaultdict(float), defaultdict(float), defaultdict(float)
+    for order in orders:
+        total = processor.calculate_order_total(order)
+        totals.append(total)
+        by_customer[order.customer_id] += total
+        by_day[order.order_date[:10]] += total
+        rate = processor.get_customer(order.customer_id).get_discount_rate()
+        for item in order.items:
+            product = processor.get_product(item.product_id)
+            by_category[product.category] += product.price * item.quantity * (1 - rate)
+    return totals, by_customer, by_category, by_day
+
+
+def frame_revenue(frame: OrderFrame):
+    return (frame.order_totals(), frame.revenue_by_customer(),
+            frame.revenue_by_category(), frame.revenue_by_day())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark columnar revenue analytics")
+    parser.add_argument("--orders", type=int, default=200_000, help="Number of orders (default: 200000)")
+    args = parser.parse_args()
+
+    scale = Scale.for_orders(args.orders)
+    processor = OrderProcessor(list(generate_customers(scale.customers)), list(generate_products(scale.products)))
+    orders = list(generate_orders(scale.orders, scale.customers, scale.products))
+
+    start = time.perf_counter()
+    loop_totals = loop_revenue(processor, orders)[0]
+    loop_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    frame = OrderFrame.from_processor(processor, orders)
+    build_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    frame_totals = frame_revenue(frame)[0]
+    query_seconds = time.perf_counter() - start
+
+    print(f"{args.orders:,} orders")
+    print("-" * 60)
+    print(f"Python loop:             {loop_seconds:8.3f} s")
+    print(f"OrderFrame build:        {build_seconds:8.3f} s")
+    print(f"OrderFrame aggregations: {query_seconds:8.3f} s  ({loop_seconds / query_seconds:.0f}x faster)")
+    print(f"Totals identical:        {frame_totals.tolist() == loop_totals}")
+
+
+if __name__ == "__main__":
+    main()
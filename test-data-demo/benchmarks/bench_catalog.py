@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Measure the memory cost of holding a large product catalog.
+
+Compares the {id: Product} dict OrderProcessor builds from plain
+(__dict__-backed) dataclasses, the same dict of slotted Products, and the
+columnar ProductCatalog. Id and name strings are created before measuring,
+so the numbers are the per-SKU overhead of each representation. Prices are
+converted from integer cents while building, as a JSON parse would create a
+fresh float per product.
+
+Usage:
+  python3 benchmarks/bench_catalog.py --count 1000000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tracemalloc
+from dataclasses import make_dataclass
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from catalog import ProductCatalog
+from models import Product
+
+# Pre-slots layout of Product, kept here only as the comparison baseline
+DictProduct = make_dataclass(
+    "DictProduct",
+    [("id", str), ("name", str), ("price", float), ("category", str),
+     ("in_stock", bool), ("stock_quantity", int)],
+)
+
+CATEGORIES = ("electronics", "home", "stationery", "garden", "toys", "books")
+
+
+def raw_rows(count: int, seed: int = 1):
+    rng = random.Random(seed)
+    rows = []
+    for n in range(count):
+        stock = rng.randrange(0, 500)
+        rows.append((
+            f"sku-{n:08d}", f"Product {n}", rng.randrange(100, 50000),
+            rng.choice(CATEGORIES), stock > 0, stock,
+        ))
+    return rows
+
+
+def measure(build):
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure product catalog memory usage")
+    parser.add_argument("--count", type=int, default=200_000, help="Number of synthetic SKUs (default: 200000)")
+    args = parser.parse_args()
+
+    rows = raw_rows(args.count)
+
+    def build_dict(cls):
+        return {r[0]: cls(r[0], r[1], r[2] / 100, r[3], r[4], r[5]) for r in rows}
+
+    def build_catalog():
+        catalog = ProductCatalog()
+        for r in rows:
+            catalog.add(Product(r[0], r[1], r[2] / 100, r[3], r[4], r[5]))
+        return catalog
+
+    results = [
+        ("dict of plain dataclasses", measure(lambda: build_dict(DictProduct))[1]),
+        ("dict of slotted Products", measure(lambda: build_dict(Product))[1]),
+        ("ProductCatalog", measure(build_catalog)[1]),
+    ]
+
+    baseline = results[0][1]
+    print(f"Catalog of {args.count:,} SKUs")
+    print("-" * 60)
+    for label, size in results:
+        print(f"{label:28} {size / 2**20:9.1f} MiB  {size / args.count:7.1f} B/SKU  "
+              f"{baseline / size:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
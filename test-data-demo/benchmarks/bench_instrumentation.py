@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Measure what OrderProcessor instrumentation costs.
+
+Processes the same synthetic orders three ways: through a copy of
+process_order with the instrumentation hook removed (the code as it was
+before instrumentation existed), with instrumentation disabled, and with it
+enabled. The first two differ only by the hook, so their difference is
+what a processor without an Instrumentation pays for having the option.
+process_orders tests the hook once per batch rather than per order, so it
+is compared disabled against enabled only. Runs are interleaved and the
+best of --repeat is kept, and all variants must return the same results.
+
+Usage:
+  python3 benchmarks/bench_instrumentation.py --orders 100000
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+from typing import Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from instrumentation import Instrumentation
+from models import Order
+from order_processor import OrderProcessor
+from synthetic import Scale, generate_customers, generate_orders, generate_products
+
+
+class UnhookedProcessor(OrderProcessor):
+    """OrderProcessor whose process_order has no instrumentation check."""
+
+    def process_order(self, order: Order) -> Tuple[bool, str]:
+        is_valid, errors = self.validate_order(order)
+        if not is_valid:
+            return False, f"Order validation failed: {'; '.join(errors)}"
+
+        if self._stock_locks is not None:
+            errors = self._reserve_stock(
+                [(self.get_product(item.product_id), item.quantity) for item in order.items]
+            )
+            if errors:
+                return False, f"Order validation failed: {'; '.join(errors)}"
+        else:
+            for item in order.items:
+                product = self.get_product(item.product_id)
+                if product:
+                    self._decrement_stock(product, item.quantity)
+
+        total = self.calculate_order_total(order)
+        return True, f"Order processed successfully. Total: ${total:.2f}"
+
+
+def time_processing(scale: Scale, orders, processor_class, instrumentation, batch: bool):
+    # Fresh stock for every run so each one accepts and rejects the same orders
+    processor = processor_class(list(generate_customers(scale.customers)),
+                                list(generate_products(scale.products)),
+                                instrumentation=instrumentation)
+    gc.collect()
+    start = time.perf_counter()
+    if batch:
+        results = [(r.success, r.total, r.errors) for r in processor.process_orders(orders)]
+    else:
+        results = [processor.process_order(order) for order in orders]
+    return results, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark instrumentation overhead")
+    parser.add_argument("--orders", type=int, default=100_000, help="Number of orders (default: 100000)")
+    parser.add_argument("--repeat", type=int, default=5, help="Best of this many runs (default: 5)")
+    args = parser.parse_args()
+
+    scale = Scale.for_orders(args.orders)
+    orders = list(generate_orders(scale.orders, scale.customers, scale.products))
+    per_order = 1e9 / args.orders
+
+    variants = {
+        "process_order": [("no hook", UnhookedProcessor, False), ("disabled", OrderProcessor, False),
+                          ("enabled", OrderProcessor, True)],
+        "process_orders": [("disabled", OrderProcessor, False), ("enabled", OrderProcessor, True)],
+    }
+
+    print(f"{args.orders:,} orders, best of {args.repeat}")
+    print("-" * 60)
+    mismatched = []
+    for label, runs in variants.items():
+        batch = label == "process_orders"
+        best, results = {}, {}
+        for _ in range(args.repeat):
+            for name, processor_class, enabled in runs:
+                outcome, seconds = time_processing(
+                    scale, orders, processor_class, Instrumentation() if enabled else None, batch)
+                results[name] = outcome
+                best[name] = min(seconds, best.get(name, seconds))
+        if any(outcome != results["disabled"] for outcome in results.values()):
+            mismatched.append(label)
+
+        print(label)
+        for name, _, _ in runs:
+            print(f"  {name:10}{best[name] * per_order:8.0f} ns/order")
+        if "no hook" in best:
+            print(f"  disabled hook costs {(best['disabled'] - best['no hook']) * per_order:+.0f} ns/order "
+                  f"({best['disabled'] / best['no hook'] - 1:+.1%})")
+        print(f"  enabled costs {(best['enabled'] - best['disabled']) * per_order:+.0f} ns/order "
+              f"({best['enabled'] / best['disabled'] - 1:+.1%})")
+    if mismatched:
+        print(f"results differ for: {', '.join(mismatched)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Measure how validate_orders_parallel scales with the number of workers.
+
+Validates the same synthetic orders serially with validate_order and then
+with one, two, four, ... worker processes (up to --max-workers), passing
+the orders as a one-shot iterator as iter_orders would. The orders are
+generated up front so generation time is left out. Reports the wall time,
+speedup over the serial loop and per-worker efficiency, and checks that
+every run gives the serial results. Scaling can only show on a machine
+with that many free cores.
+
+Usage:
+  python3 benchmarks/bench_parallel_validation.py --orders 500000 --max-workers 8
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from order_processor import OrderProcessor
+from parallel_validation import validate_orders_parallel
+from synthetic import Scale, generate_customers, generate_orders, generate_products
+
+
+def timed(fn):
+    gc.collect()
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark multi-process order validation")
+    parser.add_argument("--orders", type=int, default=200_000, help="Number of orders (default: 200000)")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1,
+                        help="Largest worker count to try (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=5000, help="Orders per chunk (default: 5000)")
+    args = parser.parse_args()
+
+    scale = Scale.for_orders(args.orders)
+    processor = OrderProcessor(generate_customers(scale.customers), generate_products(scale.products))
+
+    backlog = list(generate_orders(args.orders, scale.customers, scale.products))
+
+    def orders():
+        return iter(backlog)
+
+    validate = processor.validate_order
+    expected, serial = timed(lambda: [validate(order) for order in orders()])
+
+    print(f"{args.orders:,} orders, {os.cpu_count()} CPUs")
+    print(f"{'workers':>8}{'seconds':>10}{'speedup':>10}{'efficiency':>12}")
+    print(f"{'serial':>8}{serial:10.3f}{1.0:9.2f}x")
+    workers, mismatched = 1, []
+    while workers <= args.max_workers:
+        results, seconds = timed(lambda: validate_orders_parallel(
+            processor, orders(), workers=workers, chunk_size=args.chunk_size))
+        if results != expected:
+            mismatched.append(workers)
+        speedup = serial / seconds
+        print(f"{workers:>8}{seconds:10.3f}{speedup:9.2f}x{speedup / workers:11.0%}")
+        workers *= 2
+    if mismatched:
+        print(f"results differ for workers: {mismatched}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
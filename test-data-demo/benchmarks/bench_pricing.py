@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Compare float order pricing with the integer-cents PricingEngine.
+
+Prices a synthetic batch with OrderProcessor.calculate_order_total, then
+with PricingEngine.price_orders, and checks that every total agrees.
+
+Usage:
+  python3 benchmarks/bench_pricing.py --orders 1000000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from order_processor import OrderProcessor
+from pricing import HALF_UP, PricingEngine
+from synthetic import Scale, generate_customers, generate_orders, generate_products
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark integer-cents pricing")
+    parser.add_argument("--orders", type=int, default=200_000, help="Number of orders (default: 200000)")
+    args = parser.parse_args()
+
+    scale = Scale.for_orders(args.orders)
+    processor = OrderProcessor(list(generate_customers(scale.customers)), list(generate_products(scale.products)))
+    orders = list(generate_orders(scale.orders, scale.customers, scale.products))
+
+    start = time.perf_counter()
+    calculate = processor.calculate_order_total
+    float_totals = [calculate(order) for order in orders]
+    float_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    engine = PricingEngine.from_processor(processor)
+    build_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    cents_totals = engine.price_orders(orders)
+    cents_seconds = time.perf_counter() - start
+
+    half_up = PricingEngine.from_processor(processor, rounding=HALF_UP)
+    start = time.perf_counter()
+    half_up_totals = half_up.price_orders(orders)
+    half_up_seconds = time.perf_counter() - start
+
+    mismatches = sum(a != b for a, b in zip(float_totals, cents_totals))
+    ties = sum(a != b for a, b in zip(float_totals, half_up_totals))
+    print(f"{len(orders):,} orders, {scale.products:,} products")
+    print(f"  calculate_order_total   {float_seconds:8.3f}s")
+    print(f"  engine build            {build_seconds:8.3f}s")
+    print(f"  price_orders            {cents_seconds:8.3f}s  ({float_seconds / cents_seconds:.1f}x)")
+    print(f"  price_orders (half up)  {half_up_seconds:8.3f}s  ({float_seconds / half_up_seconds:.1f}x)")
+    print(f"  totals differing from float path: {mismatches:,} (half up: {ties:,} ties)")
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
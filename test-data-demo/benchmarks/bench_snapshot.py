@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Compare OrderProcessor startup from JSON with restoring a snapshot.
+
+Writes a synthetic customer and product dataset, then times building a
+processor from the JSON files and restoring one with load_snapshot, and
+checks that both hold the same data.
+
+Usage:
+  python3 benchmarks/bench_snapshot.py --customers 1000000 --products 100000
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_loader import load_customers, load_products
+from order_processor import OrderProcessor
+from synthetic import generate_customers, generate_products, write_json_array
+
+
+def timed(fn):
+    gc.collect()
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark OrderProcessor snapshot restore")
+    parser.add_argument("--customers", type=int, default=200_000, help="Number of customers (default: 200000)")
+    parser.add_argument("--products", type=int, default=50_000, help="Number of products (default: 50000)")
+    parser.add_argument("--repeat", type=int, default=3, help="Best of this many runs (default: 3)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        customers_path = os.path.join(tmp, "customers.json")
+        products_path = os.path.join(tmp, "products.json")
+        snapshot_path = os.path.join(tmp, "processor.snap")
+        write_json_array(customers_path, generate_customers(args.customers))
+        write_json_array(products_path, generate_products(args.products))
+
+        def from_json():
+            return OrderProcessor(load_customers(customers_path), load_products(products_path), track_stock=True)
+
+        def from_snapshot():
+            return OrderProcessor.load_snapshot(snapshot_path, track_stock=True)
+
+        processor, _ = timed(from_json)
+        _, save_seconds = timed(lambda: processor.save_snapshot(snapshot_path))
+        json_seconds = min(timed(from_json)[1] for _ in range(args.repeat))
+        snapshot_seconds = min(timed(from_snapshot)[1] for _ in range(args.repeat))
+
+        restored = from_snapshot()
+        same = (restored.customers == processor.customers and restored.products == processor.products
+                and restored.stock_index.entries() == processor.stock_index.entries())
+
+        json_bytes = os.path.getsize(customers_path) + os.path.getsize(products_path)
+        print(f"{args.customers:,} customers, {args.products:,} products")
+        print(f"  JSON sources     {json_bytes / 2**20:8.1f} MiB")
+        print(f"  snapshot         {os.path.getsize(snapshot_path) / 2**20:8.1f} MiB  (saved in {save_seconds:.3f}s)")
+        print(f"  start from JSON  {json_seconds:8.3f}s")
+        print(f"  load_snapshot    {snapshot_seconds:8.3f}s  ({json_seconds / snapshot_seconds:.1f}x)")
+        print(f"  identical state: {same}")
+        if not same:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Measure what keeping a StockLevelIndex costs per sale.
+
+Processes the same synthetic orders with process_orders on a processor
+that tracks stock levels and on one that does not, each on a fresh copy of
+the products, and reports the difference per unit of stock taken. Also
+times StockLevelIndex.update alone and checks that both processors end
+with the same stock and low-stock results.
+
+Usage:
+  python3 benchmarks/bench_stock_index.py --orders 30000
+"""
+
+import argparse
+import copy
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from order_processor import OrderProcessor
+from stock_index import StockLevelIndex
+from synthetic import Scale, generate_customers, generate_orders, generate_products
+
+
+def timed(fn):
+    gc.collect()
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark stock-level index upkeep")
+    parser.add_argument("--orders", type=int, default=30_000, help="Number of orders (default: 30000)")
+    parser.add_argument("--repeat", type=int, default=4, help="Best of this many runs (default: 4)")
+    args = parser.parse_args()
+
+    scale = Scale.for_orders(args.orders)
+    customers = list(generate_customers(scale.customers))
+    products = list(generate_products(scale.products))
+    orders = list(generate_orders(args.orders, scale.customers, scale.products))
+
+    def run(track_stock):
+        processor = OrderProcessor(customers, copy.deepcopy(products), track_stock=track_stock)
+        results, seconds = timed(lambda: processor.process_orders(orders))
+        return processor, results, seconds
+
+    # Interleave the two modes so drift affects both equally
+    plain_seconds, tracked_seconds = [], []
+    for _ in range(args.repeat):
+        plain, plain_results, seconds = run(False)
+        plain_seconds.append(seconds)
+        tracked, tracked_results, seconds = run(True)
+        tracked_seconds.append(seconds)
+    plain_best, tracked_best = min(plain_seconds), min(tracked_seconds)
+
+    sales = sum(len(order.items) for order, result in zip(orders, plain_results) if result.success)
+    same = (plain_results == tracked_results
+            and [p.stock_quantity for p in plain.products.values()]
+            == [p.stock_quantity for p in tracked.products.values()]
+            and plain.get_low_stock_products(5) == tracked.get_low_stock_products(5))
+
+    index = StockLevelIndex(copy.deepcopy(products))
+    ids = [p.id for p in products]
+    updates = [(ids[n % len(ids)], (n * 7) % 1000) for n in range(200_000)]
+
+    def apply_updates():
+        update = index.update
+        for product_id, quantity in updates:
+            update(product_id, quantity)
+
+    _, update_seconds = timed(apply_updates)
+
+    print(f"{args.orders:,} orders, {scale.products:,} products, {sales:,} sale lines")
+    print(f"  process_orders             {plain_best:8.3f}s")
+    print(f"  process_orders, indexed    {tracked_best:8.3f}s  "
+          f"(+{(tracked_best - plain_best) / max(sales, 1) * 1e6:.2f}us per sale line)")
+    print(f"  StockLevelIndex.update     {update_seconds / len(updates) * 1e6:8.2f}us per call")
+    print(f"  identical results: {same}")
+    if not same:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
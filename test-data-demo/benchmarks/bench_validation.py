@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Compare per-object model validation with the compiled ValidationEngine.
+
+The "before" side is the models as they were before the engine existed
+(a regex compiled per email check, a discount table built per call),
+reproduced below as Legacy* classes, run through a loop that builds the
+same ValidationReport the engine does, reasons for every reject included.
+Both sides validate the same synthetic records, a few percent of which are
+invalid, and must accept and reject the same ones.
+
+Usage:
+  python3 benchmarks/bench_validation.py --count 200000
+"""
+
+import argparse
+import gc
+import os
+import random
+import re
+import sys
+import time
+from dataclasses import dataclass
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import Customer, Order, OrderItem, Product
+from validation import RecordError, ValidationEngine, ValidationReport
+
+
+@dataclass
+class LegacyCustomer:
+    id: str
+    name: str
+    email: str
+    membership_level: str
+    created_at: str
+
+    VALID_MEMBERSHIP_LEVELS = ("bronze", "silver", "gold", "platinum")
+
+    def is_valid(self) -> bool:
+        if not self.id or not self.name:
+            return False
+        if not self._is_valid_email(self.email):
+            return False
+        if self.membership_level not in self.VALID_MEMBERSHIP_LEVELS:
+            return False
+        return True
+
+    def _is_valid_email(self, email: str) -> bool:
+        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+        return bool(re.match(pattern, email))
+
+    def get_discount_rate(self) -> float:
+        discounts = {
+            "bronze": 0.0,
+            "silver": 0.05,
+            "gold": 0.10,
+            "platinum": 0.15
+        }
+        return discounts.get(self.membership_level, 0.0)
+
+
+@dataclass
+class LegacyProduct:
+    id: str
+    name: str
+    price: float
+    category: str
+    in_stock: bool
+    stock_quantity: int
+
+    def is_valid(self) -> bool:
+        if not self.id or not self.name:
+            return False
+        if self.price <= 0:
+            return False
+        if self.stock_quantity < 0:
+            return False
+        return True
+
+
+@dataclass
+class LegacyOrderItem:
+    product_id: str
+    quantity: int
+
+    def is_valid(self) -> bool:
+        return bool(self.product_id) and self.quantity > 0
+
+
+@dataclass
+class LegacyOrder:
+    id: str
+    customer_id: str
+    items: List[LegacyOrderItem]
+    status: str
+    order_date: str
+
+    VALID_STATUSES = ("pending", "confirmed", "shipped", "delivered", "cancelled")
+
+    def is_valid(self) -> bool:
+        if not self.id or not self.customer_id:
+            return False
+        if not self.items:
+            return False
+        if self.status not in self.VALID_STATUSES:
+            return False
+        if not all(item.is_valid() for item in self.items):
+            return False
+        return True
+
+
+MODELS = (Customer, Product, Order, OrderItem)
+LEGACY_MODELS = (LegacyCustomer, LegacyProduct, LegacyOrder, LegacyOrderItem)
+
+
+def make_records(count: int, seed: int = 1, models=MODELS):
+    customer, product, order, order_item = models
+    rng = random.Random(seed)
+
+    def bad(rate=0.02):
+        return rng.random() < rate
+
+    customers = [
+        customer(f"c{n}", f"Customer {n}",
+                 f"user{n}@bad" if bad() else f"user{n}@example.com",
+                 "diamond" if bad() else rng.choice(Customer.VALID_MEMBERSHIP_LEVELS),
+                 "2024-01-01")
+        for n in range(count)
+    ]
+    products = [
+        product(f"p{n}", f"Product {n}", -1.0 if bad() else rng.uniform(1, 500), "misc", True,
+                -1 if bad() else rng.randrange(0, 200))
+        for n in range(count)
+    ]
+    orders = [
+        order(f"o{n}", f"c{n}",
+              [order_item(f"p{rng.randrange(count)}", 0 if bad(0.01) else rng.randrange(1, 6))
+               for _ in range(rng.randrange(1, 4))],
+              "lost" if bad() else rng.choice(Order.VALID_STATUSES), "2024-05-01")
+        for n in range(count)
+    ]
+    return customers, products, orders
+
+
+def per_object_report(records, errors) -> ValidationReport:
+    """The is_valid() loop, building the same report as the engine."""
+    report = ValidationReport()
+    valid, rejected = report.valid.append, report.rejected.append
+    for index, record in enumerate(records):
+        if record.is_valid():
+            valid(record)
+        else:
+            rejected(RecordError(index, record.id, errors(record)))
+    return report
+
+
+def timed(fn, repeat):
+    best, result = None, None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = fn()
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    return result, best
+
+
+def same_outcome(before, after) -> bool:
+    if isinstance(before, ValidationReport):
+        return ([r.id for r in before.valid] == [r.id for r in after.valid]
+                and before.rejected == after.rejected)
+    return before == after
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark bulk validation")
+    parser.add_argument("--count", type=int, default=200_000, help="Records of each kind (default: 200000)")
+    parser.add_argument("--repeat", type=int, default=5, help="Best of this many runs (default: 5)")
+    args = parser.parse_args()
+
+    customers, products, orders = make_records(args.count)
+    legacy_customers, legacy_products, legacy_orders = make_records(args.count, models=LEGACY_MODELS)
+    engine = ValidationEngine()
+
+    cases = [
+        ("customers",
+         lambda: per_object_report(legacy_customers, engine.customer_errors),
+         lambda: engine.validate_customers(customers)),
+        ("discount rates",
+         lambda: [c.get_discount_rate() for c in legacy_customers],
+         lambda: [engine.discount_rate(c) for c in customers]),
+        ("products",
+         lambda: per_object_report(legacy_products, engine.product_errors),
+         lambda: engine.validate_products(products)),
+        ("orders",
+         lambda: per_object_report(legacy_orders, engine.order_errors),
+         lambda: engine.validate_orders(orders)),
+    ]
+
+    print(f"{args.count:,} records per kind")
+    print("-" * 60)
+    print(f"{'':16}{'per-object':>14}{'engine':>14}{'speedup':>10}")
+    mismatched = []
+    for label, per_object, bulk in cases:
+        expected, before = timed(per_object, args.repeat)
+        actual, after = timed(bulk, args.repeat)
+        if not same_outcome(expected, actual):
+            mismatched.append(label)
+        print(f"{label:16}{before * 1000:11.1f} ms{after * 1000:11.1f} ms{before / after:9.2f}x")
+    if mismatched:
+        print(f"results differ for: {', '.join(mismatched)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the order system.
+
+Generates a seeded synthetic dataset at each requested scale, then times
+load, validate, price, process and query operations, recording throughput
+and peak traced memory. Each operation is run --repeat times and its best
+run is kept. Results are compared against a stored baseline and any
+operation that is slower or larger than the tolerance allows is reported
+as a regression (exit status 1); operations whose best run is shorter
+than --min-seconds are too noisy to compare and are only reported.
+
+The baseline is specific to the machine it was recorded on, so the
+default benchmarks/baseline.json is ignored by git.
+
+Usage:
+  python3 benchmarks/run.py --scale 1e3 --scale 1e5
+  python3 benchmarks/run.py --scale 1e4 --save-baseline
+  python3 benchmarks/run.py --scale 1e6 --no-memory --tolerance 0.3
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_loader import iter_orders, load_customers, load_products
+from order_index import OrderIndex
+from order_processor import OrderProcessor
+from synthetic import Scale, write_dataset
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+def operations(paths: Dict[str, str]) -> List[Tuple[str, Callable[[dict], int]]]:
+    """
+    The benchmarked operations, in run order. Each takes a shared state dict
+    (so later operations can reuse what load produced) and returns the
+    number of records it handled.
+    """
+    def load(state):
+        state["customers"] = load_customers(paths["customers"])
+        state["products"] = load_products(paths["products"])
+        state["orders"] = list(iter_orders(paths["orders"]))
+        return len(state["customers"]) + len(state["products"]) + len(state["orders"])
+
+    def validate(state):
+        processor = OrderProcessor(state["customers"], state["products"])
+        validate_order = processor.validate_order
+        for order in state["orders"]:
+            validate_order(order)
+        return len(state["orders"])
+
+    def price(state):
+        processor = OrderProcessor(state["customers"], state["products"])
+        calculate = processor.calculate_order_total
+        for order in state["orders"]:
+            calculate(order)
+        return len(state["orders"])
+
+    def process(state):
+        # Stock changes must not leak into later runs, so reload the catalog
+        processor = OrderProcessor(state["customers"], load_products(paths["products"]))
+        processor.process_orders(state["orders"])
+        return len(state["orders"])
+
+    def query(state):
+        processor = OrderProcessor(state["customers"], state["products"])
+        index = OrderIndex(state["orders"])
+        customer_ids = [c.id for c in state["customers"][:1000]]
+        for status in ("pending", "confirmed", "shipped", "delivered", "cancelled"):
+            processor.get_orders_by_status(index, status)
+        for customer_id in customer_ids:
+            processor.get_customer_orders(index, customer_id)
+        for month in range(1, 13):
+            index.between(f"2024-{month:02d}", f"2024-{month:02d}-08")
+        processor.get_low_stock_products(10)
+        return len(state["orders"])
+
+    return [("load", load), ("validate", validate), ("price", price),
+            ("process", process), ("query", query)]
+
+
+def run_scale(scale: Scale, seed: int, workdir: str, measure_memory: bool, repeat: int = 5) -> Dict[str, dict]:
+    paths = write_dataset(os.path.join(workdir, f"scale-{scale.orders}"), scale, seed)
+    ops = operations(paths)
+    results: Dict[str, dict] = {}
+
+    state: dict = {}
+    for name, op in ops:
+        best = None
+        for _ in range(repeat):
+            gc.collect()
+            start = time.perf_counter()
+            count = op(state)
+            seconds = time.perf_counter() - start
+            best = seconds if best is None else min(best, seconds)
+        results[name] = {"seconds": best, "records": count, "throughput": count / best}
+
+    if measure_memory:
+        # Tracing slows everything down, so memory is measured in its own pass
+        state = {}
+        for name, op in ops:
+            gc.collect()
+            tracemalloc.start()
+            op(state)
+            results[name]["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+    return results
+
+
+def compare(results: Dict[str, Dict[str, dict]], baseline: Dict[str, Dict[str, dict]],
+            tolerance: float, min_seconds: float = 0.0) -> List[str]:
+    """List every operation that regressed beyond the tolerance."""
+    regressions = []
+    for scale, ops in results.items():
+        for name, current in ops.items():
+            previous = baseline.get(scale, {}).get(name)
+            if not previous:
+                continue
+            timeable = min(current["seconds"], previous["seconds"]) >= min_seconds
+            if timeable and current["throughput"] < previous["throughput"] * (1 - tolerance):
+                regressions.append(
+                    f"{name} @ {scale}: throughput {current['throughput']:,.0f}/s "
+                    f"vs baseline {previous['throughput']:,.0f}/s"
+                )
+            if "peak_bytes" in current and "peak_bytes" in previous and \
+                    current["peak_bytes"] > previous["peak_bytes"] * (1 + tolerance):
+                regressions.append(
+                    f"{name} @ {scale}: peak memory {current['peak_bytes'] / 2**20:,.1f} MiB "
+                    f"vs baseline {previous['peak_bytes'] / 2**20:,.1f} MiB"
+                )
+    return regressions
+
+
+def print_results(scale: str, ops: Dict[str, dict], baseline: Dict[str, dict], min_seconds: float = 0.0) -> None:
+    print(f"\nScale: {int(scale):,} orders")
+    print("-" * 80)
+    print(f"{'operation':10}{'seconds':>10}{'records/s':>14}{'peak MiB':>11}{'vs baseline':>22}")
+    for name, r in ops.items():
+        peak = f"{r['peak_bytes'] / 2**20:.1f}" if "peak_bytes" in r else "-"
+        previous = baseline.get(name)
+        delta = f"{r['throughput'] / previous['throughput']:.2f}x" if previous else "-"
+        if previous and min(r["seconds"], previous["seconds"]) < min_seconds:
+            delta += " (untimed)"
+        print(f"{name:10}{r['seconds']:10.3f}{r['throughput']:14,.0f}{peak:>11}{delta:>22}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the order system on synthetic data")
+    parser.add_argument("--scale", action="append", type=float,
+                        help="Number of orders to generate; repeatable, e.g. 1e3 (default: 1e4)")
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic data seed (default: 0)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline results file")
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed slowdown or memory growth before flagging a regression (default: 0.2)")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per operation; the best is kept (default: 5)")
+    parser.add_argument("--min-seconds", type=float, default=0.05,
+                        help="Operations faster than this are not checked for time regressions (default: 0.05)")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the peak-memory pass")
+    parser.add_argument("--workdir", help="Where to write generated datasets (default: a temp dir)")
+    parser.add_argument("--json", dest="json_out", help="Also write results to this JSON file")
+    args = parser.parse_args()
+
+    scales = [int(s) for s in (args.scale or [1e4])]
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    results: Dict[str, Dict[str, dict]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for orders in scales:
+            scale = Scale.for_orders(orders)
+            ops = run_scale(scale, args.seed, args.workdir or tmp, not args.no_memory, args.repeat)
+            results[str(orders)] = ops
+            print_results(str(orders), ops, baseline.get(str(orders), {}), args.min_seconds)
+
+    if args.json_out:
+        with open(args.json_out, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.save_baseline:
+        baseline.update(results)
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"\nBaseline saved to {args.baseline}")
+        return
+
+    regressions = compare(results, baseline, args.tolerance, args.min_seconds)
+    if regressions:
+        print("\nRegressions:")
+        for line in regressions:
+            print(f"  {line}")
+        sys.exit(1)
+    if baseline:
+        print("\nNo regressions against baseline.")
+
+
+if __name__ == "__main__":
+    main()
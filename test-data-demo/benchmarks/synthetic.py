@@ -0,0 +1,117 @@
+"""
+Seeded synthetic data for benchmarking the order system.
+
+Generators yield model objects lazily so datasets up to 1e7 orders can be
+written to disk without holding them in memory. The same seed and sizes
+always produce the same data.
+"""
+
+import json
+import os
+import random
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterable, Iterator
+
+from models import Customer, Order, OrderItem, Product
+
+CATEGORIES = ("electronics", "home", "stationery", "garden", "toys", "books", "sports", "grocery")
+FIRST_NAMES = ("Ada", "Alan", "Grace", "Edsger", "Barbara", "Donald", "Frances", "Ken", "Radia", "Tim")
+LAST_NAMES = ("Lovelace", "Turing", "Hopper", "Dijkstra", "Liskov", "Knuth", "Allen", "Thompson", "Perlman", "Berners-Lee")
+# Weighted so most orders are still open, as in production
+STATUS_WEIGHTS = (("pending", 40), ("confirmed", 25), ("shipped", 15), ("delivered", 15), ("cancelled", 5))
+
+
+@dataclass
+class Scale:
+    """Record counts for one benchmark scale."""
+    orders: int
+    customers: int
+    products: int
+
+    @classmethod
+    def for_orders(cls, orders: int) -> "Scale":
+        """Derive customer and product counts from an order count."""
+        return cls(orders=orders, customers=max(orders // 10, 10), products=max(orders // 20, 20))
+
+
+def generate_customers(count: int, seed: int = 0) -> Iterator[Customer]:
+    rng = random.Random(f"customers-{seed}")
+    levels = Customer.VALID_MEMBERSHIP_LEVELS
+    for n in range(count):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        yield Customer(
+            id=f"cust-{n:08d}",
+            name=f"{first} {last}",
+            email=f"{first.lower()}.{last.lower()}.{n}@example.com",
+            membership_level=rng.choices(levels, weights=(50, 30, 15, 5))[0],
+            created_at=f"20{rng.randrange(18, 25)}-{rng.randrange(1, 13):02d}-{rng.randrange(1, 29):02d}",
+        )
+
+
+def generate_products(count: int, seed: int = 0) -> Iterator[Product]:
+    rng = random.Random(f"products-{seed}")
+    for n in range(count):
+        stock = 0 if rng.random() < 0.05 else rng.randrange(1, 1000)
+        yield Product(
+            id=f"prod-{n:08d}",
+            name=f"Product {n}",
+            price=round(rng.uniform(0.5, 500), 2),
+            category=rng.choice(CATEGORIES),
+            in_stock=stock > 0,
+            stock_quantity=stock,
+        )
+
+
+def generate_orders(count: int, customers: int, products: int, seed: int = 0) -> Iterator[Order]:
+    rng = random.Random(f"orders-{seed}")
+    statuses = [s for s, _ in STATUS_WEIGHTS]
+    weights = [w for _, w in STATUS_WEIGHTS]
+    for n in range(count):
+        items = [
+            OrderItem(product_id=f"prod-{rng.randrange(products):08d}", quantity=rng.randrange(1, 6))
+            for _ in range(rng.choices((1, 2, 3, 4, 5), weights=(40, 25, 15, 12, 8))[0])
+        ]
+        yield Order(
+            id=f"ord-{n:09d}",
+            customer_id=f"cust-{rng.randrange(customers):08d}",
+            items=items,
+            status=rng.choices(statuses, weights=weights)[0],
+            order_date=f"2024-{rng.randrange(1, 13):02d}-{rng.randrange(1, 29):02d}",
+        )
+
+
+def write_json_array(path: str, records: Iterable) -> None:
+    """Stream dataclass records to a JSON array file."""
+    with open(path, "w") as f:
+        f.write("[")
+        for n, record in enumerate(records):
+            f.write(",\n" if n else "\n")
+            f.write(json.dumps(asdict(record)))
+        f.write("\n]\n")
+
+
+def write_json_lines(path: str, records: Iterable) -> None:
+    """Stream dataclass records to a JSON Lines file."""
+    with open(path, "w") as f:
+        for record in records:
+            f.write(json.dumps(asdict(record)))
+            f.write("\n")
+
+
+def write_dataset(directory: str, scale: Scale, seed: int = 0, json_lines: bool = False) -> Dict[str, str]:
+    """
+    Write customers, products and orders for a scale into a directory,
+    using the fixture file names. Returns the paths keyed by record kind.
+    """
+    os.makedirs(directory, exist_ok=True)
+    write = write_json_lines if json_lines else write_json_array
+    suffix = "jsonl" if json_lines else "json"
+    paths = {
+        "customers": os.path.join(directory, f"sample_customers.{suffix}"),
+        "products": os.path.join(directory, f"sample_products.{suffix}"),
+        "orders": os.path.join(directory, f"sample_orders.{suffix}"),
+    }
+    write(paths["customers"], generate_customers(scale.customers, seed))
+    write(paths["products"], generate_products(scale.products, seed))
+    write(paths["orders"], generate_orders(scale.orders, scale.customers, scale.products, seed))
+    return paths
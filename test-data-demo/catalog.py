@@ -0,0 +1,168 @@
+"""Compact columnar product catalog."""
+
+from array import array
+from collections.abc import Mapping
+from typing import Dict, Iterable, Iterator, List, Optional
+from models import Product
+
+
+class ProductRecord:
+    """
+    Lightweight view of one row of a ProductCatalog.
+
+    Exposes the same attributes and methods as Product. Reads and writes go
+    straight to the catalog's columns, so stock updates made through a record
+    are visible to every other record for the same product.
+    """
+
+    __slots__ = ("_catalog", "_row")
+
+    def __init__(self, catalog: "ProductCatalog", row: int):
+        self._catalog = catalog
+        self._row = row
+
+    @property
+    def id(self) -> str:
+        return self._catalog._ids[self._row]
+
+    @property
+    def name(self) -> str:
+        return self._catalog._names[self._row]
+
+    @property
+    def category(self) -> str:
+        catalog = self._catalog
+        return catalog._category_names[catalog._categories[self._row]]
+
+    @property
+    def price(self) -> float:
+        return self._catalog._prices[self._row]
+
+    @price.setter
+    def price(self, value: float) -> None:
+        self._catalog._prices[self._row] = value
+
+    @property
+    def stock_quantity(self) -> int:
+        return self._catalog._stock[self._row]
+
+    @stock_quantity.setter
+    def stock_quantity(self, value: int) -> None:
+        self._catalog._stock[self._row] = value
+
+    @property
+    def in_stock(self) -> bool:
+        return bool(self._catalog._in_stock[self._row])
+
+    @in_stock.setter
+    def in_stock(self, value: bool) -> None:
+        self._catalog._in_stock[self._row] = bool(value)
+
+    # Validation rules are shared with Product rather than duplicated
+    is_valid = Product.is_valid
+    is_available = Product.is_available
+
+    def to_product(self) -> Product:
+        """Materialize the row as a standalone Product."""
+        return Product(self.id, self.name, self.price, self.category,
+                       self.in_stock, self.stock_quantity)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (ProductRecord, Product)):
+            return (
+                self.id == other.id and self.name == other.name
+                and self.price == other.price and self.category == other.category
+                and self.in_stock == other.in_stock
+                and self.stock_quantity == other.stock_quantity
+            )
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (
+            f"ProductRecord(id={self.id!r}, name={self.name!r}, price={self.price!r}, "
+            f"category={self.category!r}, in_stock={self.in_stock!r}, "
+            f"stock_quantity={self.stock_quantity!r})"
+        )
+
+
+class ProductCatalog(Mapping):
+    """
+    Array-backed product store keyed by a dense integer row id.
+
+    price, stock_quantity and in_stock live in typed arrays and categories are
+    dictionary-encoded, so a SKU costs a few dozen bytes beyond its id and
+    name strings. Behaves like the {product_id: Product} dict OrderProcessor
+    builds, except that lookups return ProductRecord views, not Product
+    instances: each lookup makes a new view, so two lookups of the same
+    product compare equal but are not the same object, and isinstance
+    checks against Product fail. to_product() gives a standalone Product.
+    """
+
+    def __init__(self, products: Iterable[Product] = ()):
+        self._rows: Dict[str, int] = {}
+        self._ids: List[str] = []
+        self._names: List[str] = []
+        # 32-bit codes: a 16-bit array would overflow past 65,535 categories
+        self._categories = array("I")
+        self._category_codes: Dict[str, int] = {}
+        self._category_names: List[str] = []
+        self._prices = array("d")
+        self._stock = array("q")
+        self._in_stock = array("b")
+        for product in products:
+            self.add(product)
+
+    def add(self, product: Product) -> int:
+        """Add a product, or overwrite the existing row with the same ID. Returns its row id."""
+        category = self._category_codes.get(product.category)
+        if category is None:
+            category = len(self._category_names)
+            self._category_codes[product.category] = category
+            self._category_names.append(product.category)
+
+        row = self._rows.get(product.id)
+        if row is not None:
+            self._names[row] = product.name
+            self._categories[row] = category
+            self._prices[row] = product.price
+            self._stock[row] = product.stock_quantity
+            self._in_stock[row] = bool(product.in_stock)
+            return row
+
+        row = len(self._ids)
+        self._rows[product.id] = row
+        self._ids.append(product.id)
+        self._names.append(product.name)
+        self._categories.append(category)
+        self._prices.append(product.price)
+        self._stock.append(product.stock_quantity)
+        self._in_stock.append(bool(product.in_stock))
+        return row
+
+    def row_of(self, product_id: str) -> Optional[int]:
+        """Get the dense row id of a product, or None if it is not in the catalog."""
+        return self._rows.get(product_id)
+
+    def record(self, row: int) -> ProductRecord:
+        """Get a view of the product stored at a row id."""
+        return ProductRecord(self, row)
+
+    def get(self, product_id: str, default=None):
+        row = self._rows.get(product_id)
+        if row is None:
+            return default
+        return ProductRecord(self, row)
+
+    def __getitem__(self, product_id: str) -> ProductRecord:
+        return ProductRecord(self, self._rows[product_id])
+
+    def __contains__(self, product_id) -> bool:
+        return product_id in self._rows
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
@@ -1,76 +1,313 @@
 """Utilities for loading test data from JSON fixtures."""
 
+import gc
 import json
 import os
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, get_origin, get_type_hints
 from models import Customer, Product, Order, OrderItem
+from validation import ValidationEngine
 
 
 FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "tests", "fixtures")
 
+# Bytes read per step by the streaming parsers
+READ_CHUNK_SIZE = 1 << 16
+
+
+def _customer_from_dict(c: dict) -> Customer:
+    return Customer(
+        id=c["id"],
+        name=c["name"],
+        email=c["email"],
+        membership_level=c["membership_level"],
+        created_at=c["created_at"]
+    )
+
+
+def _product_from_dict(p: dict) -> Product:
+    return Product(
+        id=p["id"],
+        name=p["name"],
+        price=p["price"],
+        category=p["category"],
+        in_stock=p["in_stock"],
+        stock_quantity=p["stock_quantity"]
+    )
+
+
+def _order_from_dict(o: dict) -> Order:
+    items = [
+        OrderItem(product_id=i["product_id"], quantity=i["quantity"])
+        for i in o["items"]
+    ]
+    return Order(
+        id=o["id"],
+        customer_id=o["customer_id"],
+        items=items,
+        status=o["status"],
+        order_date=o["order_date"]
+    )
+
 
 def load_customers(filepath: str = None) -> List[Customer]:
     """Load customers from a JSON file."""
     if filepath is None:
         filepath = os.path.join(FIXTURES_DIR, "sample_customers.json")
-    
+
     with open(filepath, "r") as f:
         data = json.load(f)
-    
-    return [
-        Customer(
-            id=c["id"],
-            name=c["name"],
-            email=c["email"],
-            membership_level=c["membership_level"],
-            created_at=c["created_at"]
-        )
-        for c in data
-    ]
+
+    return [_customer_from_dict(c) for c in data]
 
 
 def load_products(filepath: str = None) -> List[Product]:
     """Load products from a JSON file."""
     if filepath is None:
         filepath = os.path.join(FIXTURES_DIR, "sample_products.json")
-    
+
     with open(filepath, "r") as f:
         data = json.load(f)
-    
-    return [
-        Product(
-            id=p["id"],
-            name=p["name"],
-            price=p["price"],
-            category=p["category"],
-            in_stock=p["in_stock"],
-            stock_quantity=p["stock_quantity"]
-        )
-        for p in data
-    ]
+
+    return [_product_from_dict(p) for p in data]
 
 
 def load_orders(filepath: str = None) -> List[Order]:
     """Load orders from a JSON file."""
     if filepath is None:
         filepath = os.path.join(FIXTURES_DIR, "sample_orders.json")
-    
+
     with open(filepath, "r") as f:
         data = json.load(f)
-    
-    orders = []
-    for o in data:
-        items = [
-            OrderItem(product_id=i["product_id"], quantity=i["quantity"])
-            for i in o["items"]
-        ]
-        orders.append(
-            Order(
-                id=o["id"],
-                customer_id=o["customer_id"],
-                items=items,
-                status=o["status"],
-                order_date=o["order_date"]
-            )
-        )
-    return orders
+
+    return [_order_from_dict(o) for o in data]
+
+
+def iter_records(filepath: str) -> Iterator[dict]:
+    """
+    Yield the records of a JSON array or JSON Lines file one at a time.
+
+    The format is detected from the first non-whitespace character. Input is
+    read in fixed-size chunks, so memory use is bounded by the largest single
+    record rather than the size of the file.
+    """
+    with open(filepath, "r") as f:
+        buf = f.read(READ_CHUNK_SIZE)
+        # Leading whitespace can fill whole chunks; it means nothing in either format
+        while buf and not buf.strip():
+            buf = f.read(READ_CHUNK_SIZE)
+        start = len(buf) - len(buf.lstrip())
+        if buf[start:start + 1] == "[":
+            yield from _iter_json_array(f, buf, start + 1)
+        else:
+            yield from _iter_json_lines(f, buf)
+
+
+def _skip_whitespace(f, buf: str, pos: int, eof: bool) -> Tuple[str, int, bool]:
+    """Advance past whitespace, reading more input as needed; pos == len(buf) only at EOF."""
+    while True:
+        while pos < len(buf) and buf[pos] in " \t\r\n":
+            pos += 1
+        if pos < len(buf) or eof:
+            return buf, pos, eof
+        buf, pos = f.read(READ_CHUNK_SIZE), 0
+        eof = not buf
+
+
+def _iter_json_array(f, buf: str, pos: int) -> Iterator[dict]:
+    decoder = json.JSONDecoder()
+    eof = False
+    first = True
+    while True:
+        # Elements are separated by exactly one comma
+        buf, pos, eof = _skip_whitespace(f, buf, pos, eof)
+        if pos >= len(buf):
+            raise ValueError(f"{f.name}: unterminated JSON array")
+        if buf[pos] == "]":
+            return
+        if not first:
+            if buf[pos] != ",":
+                raise ValueError(f"{f.name}: expected ',' or ']' at offset {pos}")
+            buf, pos, eof = _skip_whitespace(f, buf, pos + 1, eof)
+            if pos >= len(buf):
+                raise ValueError(f"{f.name}: unterminated JSON array")
+
+        while True:
+            try:
+                record, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                end = None
+            # A record that fails to parse or runs to the end of the buffer may be
+            # truncated, so read more before trusting the result
+            if end is None or (end == len(buf) and not eof):
+                if eof:
+                    raise ValueError(f"{f.name}: malformed JSON array element at offset {pos}")
+                chunk = f.read(READ_CHUNK_SIZE)
+                eof = not chunk
+                buf, pos = buf[pos:] + chunk, 0
+                continue
+            break
+
+        yield record
+        first = False
+        pos = end
+        if pos > READ_CHUNK_SIZE:
+            buf, pos = buf[pos:], 0
+
+
+def _iter_json_lines(f, buf: str) -> Iterator[dict]:
+    lines = buf.split("\n")
+    tail = lines.pop()
+    for line in lines:
+        if line.strip():
+            yield json.loads(line)
+    # f is positioned right after the first chunk, so line iteration resumes there
+    for line in f:
+        if tail:
+            line, tail = tail + line, ""
+        if line.strip():
+            yield json.loads(line)
+    if tail.strip():
+        yield json.loads(tail)
+
+
+def iter_customers(filepath: str = None) -> Iterator[Customer]:
+    """Stream customers from a JSON array or JSON Lines file."""
+    if filepath is None:
+        filepath = os.path.join(FIXTURES_DIR, "sample_customers.json")
+    for c in iter_records(filepath):
+        yield _customer_from_dict(c)
+
+
+def iter_products(filepath: str = None) -> Iterator[Product]:
+    """Stream products from a JSON array or JSON Lines file."""
+    if filepath is None:
+        filepath = os.path.join(FIXTURES_DIR, "sample_products.json")
+    for p in iter_records(filepath):
+        yield _product_from_dict(p)
+
+
+def iter_orders(filepath: str = None) -> Iterator[Order]:
+    """Stream orders from a JSON array or JSON Lines file."""
+    if filepath is None:
+        filepath = os.path.join(FIXTURES_DIR, "sample_orders.json")
+    for o in iter_records(filepath):
+        yield _order_from_dict(o)
+
+
+@dataclass
+class LoadReject:
+    """A fixture record that could not be loaded or failed validation."""
+    file: str
+    index: int
+    record_id: Optional[str]
+    reasons: List[str]
+
+
+@dataclass
+class LoadResult:
+    """Valid records from load_all plus every rejected one."""
+    customers: List[Customer] = field(default_factory=list)
+    products: List[Product] = field(default_factory=list)
+    orders: List[Order] = field(default_factory=list)
+    rejects: List[LoadReject] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.rejects
+
+
+_field_types: Dict[type, List[Tuple[str, object]]] = {}
+
+
+def _wrong_types(obj) -> List[str]:
+    """Reasons for every field of a model (or its items) that does not hold its annotated type."""
+    types = _field_types.get(type(obj))
+    if types is None:
+        hints = get_type_hints(type(obj))
+        types = _field_types[type(obj)] = [(f.name, hints[f.name]) for f in fields(obj)]
+    reasons = []
+    for name, expected in types:
+        value = getattr(obj, name)
+        if get_origin(expected) is list:
+            if not isinstance(value, list):
+                reasons.append(f"wrong type for field {name!r}")
+                continue
+            for item in value:
+                reasons.extend(r for r in _wrong_types(item) if r not in reasons)
+        elif not isinstance(value, (int, float) if expected is float else expected):
+            reasons.append(f"wrong type for field {name!r}")
+    return reasons
+
+
+def _load_valid(filepath: str, from_dict: Callable, is_valid: Callable[[object], bool],
+                errors_of: Callable[[object], List[str]]) -> Tuple[list, List[LoadReject]]:
+    """Build and validate each record of a file in one pass."""
+    valid, rejects = [], []
+    append = valid.append
+    for index, record in enumerate(iter_records(filepath)):
+        try:
+            obj = from_dict(record)
+        except KeyError as e:
+            record_id = record.get("id") if isinstance(record, dict) else None
+            rejects.append(LoadReject(filepath, index, record_id, [f"missing field {e.args[0]!r}"]))
+            continue
+        except (TypeError, AttributeError):
+            record_id = record.get("id") if isinstance(record, dict) else None
+            rejects.append(LoadReject(filepath, index, record_id, ["malformed record"]))
+            continue
+        try:
+            if is_valid(obj):
+                append(obj)
+            else:
+                rejects.append(LoadReject(filepath, index, obj.id, errors_of(obj)))
+        except (TypeError, ValueError):
+            # A null or mistyped field breaks the comparisons in the rules
+            record_id = obj.id if isinstance(obj.id, str) else None
+            rejects.append(LoadReject(filepath, index, record_id, _wrong_types(obj) or ["malformed record"]))
+    return valid, rejects
+
+
+def load_all(customers_path: str = None, products_path: str = None, orders_path: str = None,
+             engine: Optional[ValidationEngine] = None) -> LoadResult:
+    """
+    Load customers, products and orders concurrently, validating as they load.
+
+    Each file (JSON array or JSON Lines) is parsed on its own thread, and
+    every record is checked with the ValidationEngine as soon as it is
+    built, so there is no separate validation pass. Records with missing
+    or wrongly typed fields or broken rules are left out and listed in rejects with their
+    file, position and reasons. A file that is not valid JSON raises
+    ValueError.
+
+    The cyclic garbage collector is paused while loading: the loaders only
+    create acyclic objects, and with millions of them it would otherwise
+    rescan the growing lists over and over.
+    """
+    engine = engine or ValidationEngine()
+    customers_path = customers_path or os.path.join(FIXTURES_DIR, "sample_customers.json")
+    products_path = products_path or os.path.join(FIXTURES_DIR, "sample_products.json")
+    orders_path = orders_path or os.path.join(FIXTURES_DIR, "sample_orders.json")
+
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            customers = pool.submit(_load_valid, customers_path, _customer_from_dict,
+                                    engine.is_valid_customer, engine.customer_errors)
+            products = pool.submit(_load_valid, products_path, _product_from_dict,
+                                   engine.is_valid_product, engine.product_errors)
+            orders = pool.submit(_load_valid, orders_path, _order_from_dict,
+                                 engine.is_valid_order, engine.order_errors)
+            result = LoadResult()
+            result.customers, rejects = customers.result()
+            result.rejects.extend(rejects)
+            result.products, rejects = products.result()
+            result.rejects.extend(rejects)
+            result.orders, rejects = orders.result()
+            result.rejects.extend(rejects)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return result
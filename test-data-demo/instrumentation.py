@@ -0,0 +1,147 @@
+"""Optional metrics for the order processing hot path."""
+
+import json
+import logging
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Protocol
+
+# Stages of OrderProcessor.process_order, in execution order
+STAGES = ("lookup", "validate", "stock", "price")
+
+# Histogram bucket upper bounds: 1us, 2us, 4us ... ~16s
+BUCKET_BOUNDS = tuple(1e-6 * 2 ** i for i in range(25))
+
+
+class MetricsSink(Protocol):
+    """Destination for instrumentation snapshots."""
+
+    def emit(self, snapshot: dict) -> None:
+        ...
+
+
+class InMemorySink:
+    """Keeps every emitted snapshot, mainly for tests."""
+
+    def __init__(self):
+        self.snapshots: List[dict] = []
+
+    def emit(self, snapshot: dict) -> None:
+        self.snapshots.append(snapshot)
+
+
+class LoggingSink:
+    """Writes each snapshot as one JSON log line."""
+
+    def __init__(self, logger: Optional[logging.Logger] = None, level: int = logging.INFO):
+        self.logger = logger or logging.getLogger("order_processor.metrics")
+        self.level = level
+
+    def emit(self, snapshot: dict) -> None:
+        self.logger.log(self.level, json.dumps(snapshot, sort_keys=True))
+
+
+class LatencyHistogram:
+    """Latency distribution over power-of-two buckets from 1us."""
+
+    def __init__(self):
+        self.buckets = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.buckets[bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th quantile."""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for bound, n in zip(BUCKET_BOUNDS + (self.max,), self.buckets):
+            seen += n
+            if seen >= target:
+                return min(bound, self.max)
+        return self.max
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "total_seconds": self.total,
+            "max_seconds": self.max,
+            "p50_seconds": self.quantile(0.5),
+            "p99_seconds": self.quantile(0.99),
+            "buckets": {
+                (f"le_{bound * 1e6:g}us" if i < len(BUCKET_BOUNDS) else "le_inf"): n
+                for i, (bound, n) in enumerate(zip(BUCKET_BOUNDS + (float("inf"),), self.buckets))
+                if n
+            },
+        }
+
+
+class Instrumentation:
+    """
+    Per-stage timers, order counters and latency histograms for OrderProcessor.
+
+    Pass an instance as OrderProcessor(instrumentation=...) to enable it.
+    Recording is guarded by a lock so a concurrent processor can share one
+    instance. snapshot() returns the current metrics as plain data and
+    flush() hands that snapshot to the configured sink.
+    """
+
+    def __init__(self, sink: Optional[MetricsSink] = None,
+                 clock: Callable[[], float] = time.perf_counter):
+        self.sink = sink
+        self.clock = clock
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all recorded metrics."""
+        with self._lock:
+            self.processed = 0
+            self.rejected = 0
+            self.rejections: Counter = Counter()
+            self.stages: Dict[str, LatencyHistogram] = {stage: LatencyHistogram() for stage in STAGES}
+            self.orders = LatencyHistogram()
+
+    def record_order(self, stage_seconds: Dict[str, float], total_seconds: float,
+                     error_kinds: List[str]) -> None:
+        """
+        Record one processed order. error_kinds is empty for accepted orders;
+        a rejected order counts once towards each distinct kind it hit.
+        """
+        with self._lock:
+            for stage, seconds in stage_seconds.items():
+                self.stages[stage].record(seconds)
+            self.orders.record(total_seconds)
+            if error_kinds:
+                self.rejected += 1
+                self.rejections.update(set(error_kinds))
+            else:
+                self.processed += 1
+
+    def snapshot(self) -> dict:
+        """Current metrics as a JSON-serializable dict."""
+        with self._lock:
+            return {
+                "orders_processed": self.processed,
+                "orders_rejected": self.rejected,
+                "rejections_by_kind": dict(self.rejections),
+                "order_latency": self.orders.snapshot(),
+                "stage_latency": {stage: h.snapshot() for stage, h in self.stages.items()},
+            }
+
+    def flush(self) -> dict:
+        """Send a snapshot to the sink (if any) and return it."""
+        snapshot = self.snapshot()
+        if self.sink is not None:
+            self.sink.emit(snapshot)
+        return snapshot
@@ -0,0 +1,145 @@
+"""Random access to orders in a JSON Lines file without loading them all."""
+
+import functools
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+from bisect import bisect_left
+from typing import Optional
+from models import Order
+from data_loader import _order_from_dict
+
+INDEX_MAGIC = b"TDIDX001"
+# magic, source size, source mtime_ns, record count
+_HEADER = struct.Struct("<8sQqQ")
+
+
+def key_hash(order_id: str) -> int:
+    """64-bit hash of an order id, stable across processes."""
+    return int.from_bytes(hashlib.blake2b(order_id.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class LazyOrderStore:
+    """
+    Order lookups by id over a JSON Lines file, decoding only what is read.
+
+    On first use an index file is built next to the data: a header, then
+    sorted 64-bit id hashes, byte offsets and record lengths as three packed
+    columns. Both files are memory-mapped, so opening the store is O(1) and
+    a lookup is a bisect over the hash column plus one json.loads of the
+    record, independent of file size. Decoded orders are kept in an LRU
+    cache, so repeat lookups return the same Order object. The index is
+    rebuilt automatically when the data file's size or mtime changes.
+    """
+
+    def __init__(self, path: str, index_path: Optional[str] = None, cache_size: int = 1024):
+        self.path = path
+        self.index_path = index_path or path + ".idx"
+        self._data_file = open(path, "rb")
+        stat = os.fstat(self._data_file.fileno())
+        if not self._index_is_current(stat.st_size, stat.st_mtime_ns):
+            self.build_index()
+
+        self._index_file = open(self.index_path, "rb")
+        self._index = mmap.mmap(self._index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        count = _HEADER.unpack_from(self._index, 0)[3]
+        self._count = count
+        view = memoryview(self._index)
+        start = _HEADER.size
+        self._views = [view]
+        self._hashes = view[start:start + 8 * count].cast("Q")
+        self._offsets = view[start + 8 * count:start + 16 * count].cast("Q")
+        self._lengths = view[start + 16 * count:start + 20 * count].cast("I")
+        self._views += [self._hashes, self._offsets, self._lengths]
+        # mmap refuses to map empty files
+        self._data = (mmap.mmap(self._data_file.fileno(), 0, access=mmap.ACCESS_READ)
+                      if stat.st_size else b"")
+        self._cached = functools.lru_cache(maxsize=cache_size)(self._load)
+
+    def _index_is_current(self, size: int, mtime_ns: int) -> bool:
+        try:
+            with open(self.index_path, "rb") as f:
+                magic, indexed_size, indexed_mtime, _ = _HEADER.unpack(f.read(_HEADER.size))
+        except (OSError, struct.error):
+            return False
+        return (magic, indexed_size, indexed_mtime) == (INDEX_MAGIC, size, mtime_ns)
+
+    def build_index(self) -> None:
+        """Scan the data file once and write the id -> offset index."""
+        entries = []
+        offset = 0
+        self._data_file.seek(0)
+        for line in self._data_file:
+            if line.strip():
+                order_id = json.loads(line)["id"]
+                entries.append((key_hash(order_id), offset, len(line)))
+            offset += len(line)
+        entries.sort()
+
+        stat = os.fstat(self._data_file.fileno())
+        directory = os.path.dirname(os.path.abspath(self.index_path))
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_HEADER.pack(INDEX_MAGIC, stat.st_size, stat.st_mtime_ns, len(entries)))
+                array("Q", (e[0] for e in entries)).tofile(f)
+                array("Q", (e[1] for e in entries)).tofile(f)
+                array("I", (e[2] for e in entries)).tofile(f)
+            os.replace(tmp, self.index_path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def _load(self, order_id: str) -> Optional[Order]:
+        hashes = self._hashes
+        h = key_hash(order_id)
+        pos = bisect_left(hashes, h)
+        # Distinct ids can share a hash, so check each candidate's real id
+        while pos < self._count and hashes[pos] == h:
+            offset = self._offsets[pos]
+            record = json.loads(self._data[offset:offset + self._lengths[pos]])
+            if record["id"] == order_id:
+                return _order_from_dict(record)
+            pos += 1
+        return None
+
+    def get(self, order_id: str) -> Optional[Order]:
+        """Retrieve an order by ID, decoding it on first access."""
+        return self._cached(order_id)
+
+    def __getitem__(self, order_id: str) -> Order:
+        order = self.get(order_id)
+        if order is None:
+            raise KeyError(order_id)
+        return order
+
+    def __contains__(self, order_id: str) -> bool:
+        return self.get(order_id) is not None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def cache_info(self):
+        """Hit and miss counts of the decoded-order cache."""
+        return self._cached.cache_info()
+
+    def close(self) -> None:
+        """Release the memory maps and files."""
+        self._cached.cache_clear()
+        for view in reversed(self._views):
+            view.release()
+        self._index.close()
+        self._index_file.close()
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._data_file.close()
+
+    def __enter__(self) -> "LazyOrderStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
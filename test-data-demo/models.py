@@ -6,7 +6,10 @@ import re
 from datetime import datetime
 
 
-@dataclass
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+
+@dataclass(slots=True)
 class Customer:
     id: str
     name: str
@@ -15,6 +18,12 @@ class Customer:
     created_at: str
 
     VALID_MEMBERSHIP_LEVELS = ("bronze", "silver", "gold", "platinum")
+    DISCOUNT_RATES = {
+        "bronze": 0.0,
+        "silver": 0.05,
+        "gold": 0.10,
+        "platinum": 0.15
+    }
 
     def is_valid(self) -> bool:
         """Validate the customer data."""
@@ -28,21 +37,14 @@ class Customer:
 
     def _is_valid_email(self, email: str) -> bool:
         """Check if email format is valid."""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, email))
+        return bool(EMAIL_PATTERN.match(email))
 
     def get_discount_rate(self) -> float:
         """Get discount rate based on membership level."""
-        discounts = {
-            "bronze": 0.0,
-            "silver": 0.05,
-            "gold": 0.10,
-            "platinum": 0.15
-        }
-        return discounts.get(self.membership_level, 0.0)
+        return self.DISCOUNT_RATES.get(self.membership_level, 0.0)
 
 
-@dataclass
+@dataclass(slots=True)
 class Product:
     id: str
     name: str
@@ -66,7 +68,7 @@ class Product:
         return self.in_stock and self.stock_quantity >= quantity
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderItem:
     product_id: str
     quantity: int
@@ -76,7 +78,7 @@ class OrderItem:
         return bool(self.product_id) and self.quantity > 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     id: str
     customer_id: str
@@ -0,0 +1,120 @@
+"""Secondary indexes over a collection of orders."""
+
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from models import Order
+
+
+class OrderIndex:
+    """
+    Indexed order store.
+
+    Keeps hash indexes on status and customer_id and a sorted index on
+    order_date so lookups and date-range queries do not rescan every order.
+    Status changes must go through update_status (or reindex, if the order
+    was mutated directly) to keep the indexes correct.
+    """
+
+    def __init__(self, orders: Iterable[Order] = ()):
+        self._orders: Dict[str, Order] = {}
+        self._by_status: Dict[str, Dict[str, Order]] = {}
+        self._by_customer: Dict[str, Dict[str, Order]] = {}
+        # Sorted (order_date, order_id) pairs plus the keys each order was indexed under
+        self._by_date: List[Tuple[str, str]] = []
+        self._keys: Dict[str, Tuple[str, str, str]] = {}
+        # Bulk build: fill the hash indexes, then sort the dates once
+        # instead of one insort per order
+        by_id = self._orders
+        for order in orders:
+            # A repeated ID replaces the earlier order and moves to the end, as add() does
+            by_id.pop(order.id, None)
+            by_id[order.id] = order
+        for order_id, order in by_id.items():
+            self._by_status.setdefault(order.status, {})[order_id] = order
+            self._by_customer.setdefault(order.customer_id, {})[order_id] = order
+            self._keys[order_id] = (order.status, order.customer_id, order.order_date)
+        self._by_date = sorted((order.order_date, order_id) for order_id, order in by_id.items())
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    def __iter__(self) -> Iterator[Order]:
+        return iter(self._orders.values())
+
+    def __contains__(self, order_id: str) -> bool:
+        return order_id in self._orders
+
+    def get(self, order_id: str) -> Optional[Order]:
+        """Retrieve an order by ID."""
+        return self._orders.get(order_id)
+
+    def add(self, order: Order) -> None:
+        """Add an order, replacing any existing order with the same ID."""
+        if order.id in self._orders:
+            self.remove(order.id)
+        self._orders[order.id] = order
+        self._by_status.setdefault(order.status, {})[order.id] = order
+        self._by_customer.setdefault(order.customer_id, {})[order.id] = order
+        insort(self._by_date, (order.order_date, order.id))
+        self._keys[order.id] = (order.status, order.customer_id, order.order_date)
+
+    def remove(self, order_id: str) -> Optional[Order]:
+        """Remove an order from the store and all indexes."""
+        order = self._orders.pop(order_id, None)
+        if order is None:
+            return None
+        status, customer_id, order_date = self._keys.pop(order_id)
+        self._discard(self._by_status, status, order_id)
+        self._discard(self._by_customer, customer_id, order_id)
+        pos = bisect_left(self._by_date, (order_date, order_id))
+        del self._by_date[pos]
+        return order
+
+    def update_status(self, order_id: str, status: str) -> None:
+        """Change an order's status and move it to the matching index bucket."""
+        order = self._orders[order_id]
+        order.status = status
+        self.reindex(order)
+
+    def reindex(self, order: Order) -> None:
+        """Refresh the index entries of an order whose fields were changed in place."""
+        old_status, old_customer, old_date = self._keys[order.id]
+        if order.status != old_status:
+            self._discard(self._by_status, old_status, order.id)
+            self._by_status.setdefault(order.status, {})[order.id] = order
+        if order.customer_id != old_customer:
+            self._discard(self._by_customer, old_customer, order.id)
+            self._by_customer.setdefault(order.customer_id, {})[order.id] = order
+        if order.order_date != old_date:
+            del self._by_date[bisect_left(self._by_date, (old_date, order.id))]
+            insort(self._by_date, (order.order_date, order.id))
+        self._keys[order.id] = (order.status, order.customer_id, order.order_date)
+
+    def by_status(self, status: str) -> List[Order]:
+        """Get all orders with the given status."""
+        return list(self._by_status.get(status, {}).values())
+
+    def by_customer(self, customer_id: str) -> List[Order]:
+        """Get all orders for a specific customer."""
+        return list(self._by_customer.get(customer_id, {}).values())
+
+    def between(self, start: Optional[str] = None, end: Optional[str] = None) -> List[Order]:
+        """
+        Get orders with start <= order_date < end, oldest first.
+
+        Dates compare as ISO strings, so either bound may be omitted or given
+        at a coarser precision than the stored dates (e.g. "2024-05").
+        """
+        dates = self._by_date
+        lo = 0 if start is None else bisect_left(dates, (start,))
+        hi = len(dates) if end is None else bisect_left(dates, (end,), lo)
+        orders = self._orders
+        return [orders[order_id] for _, order_id in dates[lo:hi]]
+
+    @staticmethod
+    def _discard(index: Dict[str, Dict[str, Order]], key: str, order_id: str) -> None:
+        bucket = index.get(key)
+        if bucket is not None:
+            bucket.pop(order_id, None)
+            if not bucket:
+                del index[key]
@@ -1,50 +1,311 @@
 """Order processing logic."""
 
-from typing import Dict, List, Optional, Tuple
+import contextlib
+import gc
+import os
+import pickle
+import struct
+import tempfile
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 from models import Customer, Product, Order, OrderItem
+from catalog import ProductCatalog
+from instrumentation import Instrumentation
+from order_index import OrderIndex
+from pricing_rules import CompiledRules, PricingRule
+from snapshot_cache import decode_customers, decode_products, encode_customers, encode_products
+from stock_index import StockLevelIndex
+from stock_ledger import StockLedger
+
+# Error kinds reported to instrumentation for rejected orders
+INVALID_STRUCTURE = "invalid_structure"
+CUSTOMER_NOT_FOUND = "customer_not_found"
+PRODUCT_NOT_FOUND = "product_not_found"
+INSUFFICIENT_STOCK = "insufficient_stock"
+
+# save_snapshot/load_snapshot file format: magic and version, then a pickle
+SNAPSHOT_MAGIC = b"TDORDPRC"
+SNAPSHOT_VERSION = 1
+_SNAPSHOT_HEADER = struct.Struct("<8sI")
+
+# Kinds of data change reported to change listeners: a product's price,
+# a product's stock level or availability, and a customer's membership
+PRODUCT_CHANGED = "product"
+STOCK_CHANGED = "stock"
+CUSTOMER_CHANGED = "customer"
+
+# Called as callback(kind, record_id) with one of the kinds above
+ChangeListener = Callable[[str, str], None]
+
+INVALID_STRUCTURE_MESSAGE = "Order has invalid structure"
+
+
+def customer_not_found_message(customer_id: str) -> str:
+    return f"Customer {customer_id} not found"
+
+
+def product_not_found_message(product_id: str) -> str:
+    return f"Product {product_id} not found"
+
+
+def insufficient_stock_message(product: Product, quantity: int) -> str:
+    return (
+        f"Product {product.name} has insufficient stock "
+        f"(requested: {quantity}, available: {product.stock_quantity})"
+    )
+
+
+def order_total(lines: Iterable[Tuple[Product, int]], customer: Optional[Customer]) -> float:
+    """Rounded total of (product, quantity) lines after the customer's membership discount."""
+    subtotal = 0.0
+    for product, quantity in lines:
+        subtotal += product.price * quantity
+    if customer:
+        subtotal *= (1 - customer.get_discount_rate())
+    return round(subtotal, 2)
+
+
+def order_errors(order: Order, customer: Optional[Customer],
+                 products: Sequence[Optional[Product]]) -> List[Tuple[str, str]]:
+    """
+    (kind, message) for every problem with a structurally valid order,
+    given its customer and the product for each item (None if missing).
+    """
+    errors = []
+
+    # Validate customer exists
+    if not customer:
+        errors.append((CUSTOMER_NOT_FOUND, customer_not_found_message(order.customer_id)))
+
+    # Validate each item
+    for item, product in zip(order.items, products):
+        if not product:
+            errors.append((PRODUCT_NOT_FOUND, product_not_found_message(item.product_id)))
+        elif not product.is_available(item.quantity):
+            errors.append((INSUFFICIENT_STOCK, insufficient_stock_message(product, item.quantity)))
+
+    return errors
+
+
+@dataclass
+class OrderResult:
+    """Structured outcome of processing a single order in a batch."""
+    order_id: str
+    success: bool
+    total: float = 0.0
+    errors: List[str] = field(default_factory=list)
 
 
 class OrderProcessor:
     """Handles order validation and processing."""
 
-    def __init__(self, customers: List[Customer], products: List[Product]):
+    def __init__(
+        self,
+        customers: List[Customer],
+        products: Union[List[Product], ProductCatalog],
+        concurrent: bool = False,
+        lock_stripes: int = 64,
+        instrumentation: Optional[Instrumentation] = None,
+        ledger: Optional[StockLedger] = None,
+        pricing_rules: Optional[Sequence[PricingRule]] = None,
+        track_stock: bool = False,
+    ):
+        """
+        With concurrent=True, stock for each order is reserved atomically
+        under per-product striped locks, so several threads can share one
+        processor without overselling. Passing an Instrumentation records
+        per-stage timings and counters for process_order/process_orders;
+        without one those methods skip all measurement. With a ledger,
+        stock levels it recorded before a restart are applied on top of the
+        given products and every later stock movement is appended to it.
+        pricing_rules are compiled once against the products and then used
+        to price every order; without them only membership discounts apply.
+        With track_stock=True a StockLevelIndex is kept in step with every
+        stock change made through this processor, so low-stock queries need
+        no scan; stock must then only be changed through process_order,
+        process_orders or update_product.
+
+        products may be a ProductCatalog to save memory on large catalogs.
+        get_product then returns a fresh ProductRecord view on every call
+        rather than a Product; it has the same attributes and methods, and
+        writes through it update the catalog.
+        """
+        self.instrumentation = instrumentation
+        self.ledger = ledger
         self.customers = {c.id: c for c in customers}
-        self.products = {p.id: p for p in products}
+        # A ProductCatalog already maps IDs to products, so use it as-is
+        if isinstance(products, ProductCatalog):
+            self.products = products
+        else:
+            self.products = {p.id: p for p in products}
+        if ledger is not None:
+            self._apply_stock_levels(ledger.levels(), ledger.availability())
+        self.pricing = (
+            CompiledRules(pricing_rules, self.products.values()) if pricing_rules else None
+        )
+        self.stock_index = StockLevelIndex(self.products.values()) if track_stock else None
+        self._stock_locks = (
+            [threading.Lock() for _ in range(lock_stripes)] if concurrent else None
+        )
+        self._change_listeners: List[ChangeListener] = []
+
+    def save_snapshot(self, path: str) -> None:
+        """
+        Write customers, products, the stock index and compiled pricing rules
+        to a versioned binary snapshot for load_snapshot. The file is
+        replaced atomically.
+        """
+        state = {
+            "customers": encode_customers(self.customers.values()),
+            "products": encode_products(self.products.values()),
+            "catalog": isinstance(self.products, ProductCatalog),
+            "stock_index": self.stock_index.entries() if self.stock_index is not None else None,
+            "pricing": self.pricing,
+        }
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION))
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    @classmethod
+    def load_snapshot(cls, path: str, **kwargs) -> "OrderProcessor":
+        """
+        Restore a processor written by save_snapshot. Keyword arguments are
+        passed to the constructor (concurrent, instrumentation, ledger, ...);
+        stock levels from a ledger are applied on top of the snapshot.
+        Raises ValueError for files that are not a snapshot of this version.
+        """
+        with open(path, "rb") as f:
+            header = f.read(_SNAPSHOT_HEADER.size)
+            if len(header) != _SNAPSHOT_HEADER.size:
+                raise ValueError(f"{path}: not an OrderProcessor snapshot")
+            magic, version = _SNAPSHOT_HEADER.unpack(header)
+            if magic != SNAPSHOT_MAGIC:
+                raise ValueError(f"{path}: not an OrderProcessor snapshot")
+            if version != SNAPSHOT_VERSION:
+                raise ValueError(f"{path}: unsupported snapshot version {version}")
+            # Only acyclic objects are created, so skip the collector's rescans
+            gc_was_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                state = pickle.load(f)
+                customers = decode_customers(state["customers"])
+                products = decode_products(state["products"])
+            finally:
+                if gc_was_enabled:
+                    gc.enable()
+
+        ledger = kwargs.pop("ledger", None)
+        pricing_rules = kwargs.pop("pricing_rules", None)
+        processor = cls([], [], **kwargs)
+        processor.customers = {c.id: c for c in customers}
+        processor.products = ProductCatalog(products) if state["catalog"] else {p.id: p for p in products}
+        processor.ledger = ledger
+        if ledger is not None:
+            processor._apply_stock_levels(ledger.levels(), ledger.availability())
+        if processor.stock_index is not None:
+            if ledger is None and state["stock_index"] is not None:
+                processor.stock_index = StockLevelIndex.from_entries(state["stock_index"])
+            else:
+                processor.stock_index = StockLevelIndex(processor.products.values())
+        if pricing_rules:
+            processor.pricing = CompiledRules(pricing_rules, processor.products.values())
+        else:
+            processor.pricing = state["pricing"]
+        return processor
 
     def get_customer(self, customer_id: str) -> Optional[Customer]:
         """Retrieve a customer by ID."""
         return self.customers.get(customer_id)
 
     def get_product(self, product_id: str) -> Optional[Product]:
-        """Retrieve a product by ID."""
+        """Retrieve a product by ID (a ProductRecord view when backed by a ProductCatalog)."""
         return self.products.get(product_id)
 
+    def update_product(self, product_id: str, price: Optional[float] = None,
+                       stock_quantity: Optional[int] = None,
+                       in_stock: Optional[bool] = None) -> None:
+        """
+        Change a product's price, stock or availability. Unless given,
+        in_stock follows whether any stock remains after a stock change.
+        Stock changes reach the stock index and ledger like sales do, and
+        in concurrent mode are made under the product's stock lock.
+        """
+        product = self.products[product_id]
+        if price is not None:
+            product.price = price
+            self._notify(PRODUCT_CHANGED, product_id)
+        if stock_quantity is not None or in_stock is not None:
+            with self._stock_lock(product_id):
+                self._set_stock(product, stock_quantity, in_stock)
+            self._notify(STOCK_CHANGED, product_id)
+
+    def _set_stock(self, product: Product, stock_quantity: Optional[int],
+                   in_stock: Optional[bool]) -> None:
+        """Apply a stock and/or availability edit, keeping the index and ledger in step."""
+        product_id = product.id
+        delta = 0
+        was_in_stock = product.in_stock
+        if stock_quantity is not None:
+            delta = stock_quantity - product.stock_quantity
+            product.stock_quantity = stock_quantity
+            if in_stock is None:
+                in_stock = stock_quantity > 0
+            if self.stock_index is not None:
+                self.stock_index.update(product_id, stock_quantity)
+        if in_stock is not None:
+            product.in_stock = in_stock
+        if self.ledger is not None and (delta or product.in_stock != was_in_stock):
+            self.ledger.record(product_id, delta, product.stock_quantity, product.in_stock)
+
+    def update_customer(self, customer_id: str, membership_level: str) -> None:
+        """Change a customer's membership level, and so their discount."""
+        self.customers[customer_id].membership_level = membership_level
+        self._notify(CUSTOMER_CHANGED, customer_id)
+
+    def subscribe_changes(self, callback: ChangeListener) -> Callable[[], None]:
+        """
+        Call callback(kind, record_id) after every product or customer change
+        made through this processor: PRODUCT_CHANGED for price edits,
+        STOCK_CHANGED for stock and availability, including stock taken by
+        orders, and CUSTOMER_CHANGED for membership edits. Returns a function
+        that cancels the subscription.
+        """
+        self._change_listeners.append(callback)
+
+        def unsubscribe() -> None:
+            if callback in self._change_listeners:
+                self._change_listeners.remove(callback)
+
+        return unsubscribe
+
+    def _stock_lock(self, product_id: str):
+        """The stripe lock guarding a product's stock, or a no-op outside concurrent mode."""
+        if self._stock_locks is None:
+            return contextlib.nullcontext()
+        return self._stock_locks[hash(product_id) % len(self._stock_locks)]
+
+    def _notify(self, kind: str, record_id: str) -> None:
+        for callback in list(self._change_listeners):
+            callback(kind, record_id)
+
     def validate_order(self, order: Order) -> Tuple[bool, List[str]]:
         """
         Validate an order and return validation result with error messages.
         """
-        errors = []
-
         if not order.is_valid():
-            errors.append("Order has invalid structure")
-            return False, errors
+            return False, [INVALID_STRUCTURE_MESSAGE]
 
-        # Validate customer exists
         customer = self.get_customer(order.customer_id)
-        if not customer:
-            errors.append(f"Customer {order.customer_id} not found")
-
-        # Validate each item
-        for item in order.items:
-            product = self.get_product(item.product_id)
-            if not product:
-                errors.append(f"Product {item.product_id} not found")
-            elif not product.is_available(item.quantity):
-                errors.append(
-                    f"Product {product.name} has insufficient stock "
-                    f"(requested: {item.quantity}, available: {product.stock_quantity})"
-                )
-
+        products = [self.get_product(item.product_id) for item in order.items]
+        errors = [message for _, message in order_errors(order, customer, products)]
         return len(errors) == 0, errors
 
     def calculate_order_total(self, order: Order) -> float:
@@ -52,51 +313,232 @@ class OrderProcessor:
         if not order.is_valid():
             return 0.0
 
-        subtotal = 0.0
+        lines = []
         for item in order.items:
             product = self.get_product(item.product_id)
             if product:
-                subtotal += product.price * item.quantity
-
-        # Apply customer discount
+                lines.append((product, item.quantity))
         customer = self.get_customer(order.customer_id)
-        if customer:
-            discount_rate = customer.get_discount_rate()
-            subtotal *= (1 - discount_rate)
+        if self.pricing is not None:
+            return self.pricing.total(order, customer, lines)
+        return order_total(lines, customer)
 
-        return round(subtotal, 2)
+    def price_orders(self, orders: Iterable[Order]) -> List[float]:
+        """Calculate totals for a batch of orders, as calculate_order_total would."""
+        if self.pricing is not None:
+            return self.pricing.price_orders(orders, self.customers, self.products)
+        return [self.calculate_order_total(order) for order in orders]
 
     def process_order(self, order: Order) -> Tuple[bool, str]:
         """
         Process an order: validate, calculate total, and update stock.
         Returns success status and message.
         """
+        if self.instrumentation is not None:
+            result = self._process_instrumented(order)
+            if not result.success:
+                return False, f"Order validation failed: {'; '.join(result.errors)}"
+            return True, f"Order processed successfully. Total: ${result.total:.2f}"
+
         is_valid, errors = self.validate_order(order)
         if not is_valid:
             return False, f"Order validation failed: {'; '.join(errors)}"
 
         # Update stock quantities
-        for item in order.items:
-            product = self.get_product(item.product_id)
-            if product:
-                product.stock_quantity -= item.quantity
-                if product.stock_quantity == 0:
-                    product.in_stock = False
+        if self._stock_locks is not None:
+            # Stock may have changed since validation; re-check under the locks
+            errors = self._reserve_stock(
+                [(self.get_product(item.product_id), item.quantity) for item in order.items]
+            )
+            if errors:
+                return False, f"Order validation failed: {'; '.join(errors)}"
+        else:
+            for item in order.items:
+                product = self.get_product(item.product_id)
+                if product:
+                    self._decrement_stock(product, item.quantity)
 
         total = self.calculate_order_total(order)
         return True, f"Order processed successfully. Total: ${total:.2f}"
 
-    def get_orders_by_status(self, orders: List[Order], status: str) -> List[Order]:
-        """Filter orders by status."""
+    def process_orders(self, orders: Iterable[Order]) -> List[OrderResult]:
+        """
+        Process a batch of orders in a single pass.
+
+        Each order is validated, priced and applied to stock exactly as if
+        process_order had been called on the orders one after another, but
+        lookups are done once per item and messages are only formatted for
+        rejected orders.
+        """
+        if self.instrumentation is not None:
+            results = [self._process_instrumented(order) for order in orders]
+            if self.ledger is not None:
+                self.ledger.commit()
+            return results
+
+        customers = self.customers
+        products = self.products
+        decrement = self._decrement_stock
+        concurrent = self._stock_locks is not None
+        pricing = self.pricing
+        results = []
+        append = results.append
+
+        for order in orders:
+            if not order.is_valid():
+                append(OrderResult(order.id, False, errors=[INVALID_STRUCTURE_MESSAGE]))
+                continue
+
+            customer = customers.get(order.customer_id)
+            lines = []
+            for item in order.items:
+                product = products.get(item.product_id)
+                if not product or not product.is_available(item.quantity):
+                    lines = None
+                    break
+                lines.append((product, item.quantity))
+
+            if not customer or lines is None:
+                found = [products.get(item.product_id) for item in order.items]
+                errors = [message for _, message in order_errors(order, customer, found)]
+                append(OrderResult(order.id, False, errors=errors))
+                continue
+
+            if concurrent:
+                errors = self._reserve_stock(lines)
+                if errors:
+                    append(OrderResult(order.id, False, errors=errors))
+                    continue
+
+            if not concurrent:
+                for product, quantity in lines:
+                    decrement(product, quantity)
+            if pricing is not None:
+                append(OrderResult(order.id, True, pricing.total(order, customer, lines)))
+            else:
+                append(OrderResult(order.id, True, order_total(lines, customer)))
+
+        # Make the whole batch's stock movements durable together
+        if self.ledger is not None:
+            self.ledger.commit()
+        return results
+
+    def _process_instrumented(self, order: Order) -> OrderResult:
+        """process_order with each stage timed and the outcome recorded."""
+        instrumentation = self.instrumentation
+        clock = instrumentation.clock
+
+        start = clock()
+        if not order.is_valid():
+            elapsed = clock() - start
+            instrumentation.record_order({"validate": elapsed}, elapsed, [INVALID_STRUCTURE])
+            return OrderResult(order.id, False, errors=[INVALID_STRUCTURE_MESSAGE])
+        structure_checked = clock()
+
+        customer = self.get_customer(order.customer_id)
+        products = [self.get_product(item.product_id) for item in order.items]
+        looked_up = clock()
+
+        problems = order_errors(order, customer, products)
+        validated = clock()
+
+        if not problems:
+            lines = [(product, item.quantity) for product, item in zip(products, order.items)]
+            if self._stock_locks is not None:
+                problems = [(INSUFFICIENT_STOCK, message) for message in self._reserve_stock(lines)]
+            else:
+                for product, quantity in lines:
+                    self._decrement_stock(product, quantity)
+        stocked = clock()
+
+        stages = {
+            "lookup": looked_up - structure_checked,
+            "validate": (structure_checked - start) + (validated - looked_up),
+            "stock": stocked - validated,
+        }
+        if problems:
+            instrumentation.record_order(stages, stocked - start, [kind for kind, _ in problems])
+            return OrderResult(order.id, False, errors=[message for _, message in problems])
+
+        if self.pricing is not None:
+            total = self.pricing.total(order, customer, lines)
+        else:
+            total = order_total(lines, customer)
+        priced = clock()
+
+        stages["price"] = priced - stocked
+        instrumentation.record_order(stages, priced - start, [])
+        return OrderResult(order.id, True, total)
+
+    def _reserve_stock(self, lines: List[Tuple[Product, int]]) -> List[str]:
+        """
+        Atomically check and take stock for every line of one order.
+
+        Quantities for the same product are combined, and only the lock
+        stripes covering the order's products are held, always acquired in
+        stripe order so orders over disjoint products never contend or
+        deadlock. Either every line is reserved or nothing changes.
+        """
+        wanted: Dict[str, Tuple[Product, int]] = {}
+        for product, quantity in lines:
+            previous = wanted.get(product.id)
+            wanted[product.id] = (product, quantity + previous[1] if previous else quantity)
+
+        locks = self._stock_locks
+        stripes = sorted({hash(product_id) % len(locks) for product_id in wanted})
+        for stripe in stripes:
+            locks[stripe].acquire()
+        try:
+            errors = [
+                insufficient_stock_message(product, quantity)
+                for product, quantity in wanted.values()
+                if not product.is_available(quantity)
+            ]
+            if not errors:
+                for product, quantity in wanted.values():
+                    self._decrement_stock(product, quantity)
+            return errors
+        finally:
+            for stripe in reversed(stripes):
+                locks[stripe].release()
+
+    def _decrement_stock(self, product: Product, quantity: int) -> None:
+        """Remove sold units from a product's stock."""
+        product.stock_quantity -= quantity
+        if product.stock_quantity == 0:
+            product.in_stock = False
+        if self.stock_index is not None:
+            self.stock_index.update(product.id, product.stock_quantity)
+        if self.ledger is not None:
+            self.ledger.record(product.id, -quantity, product.stock_quantity, product.in_stock)
+        if self._change_listeners:
+            self._notify(STOCK_CHANGED, product.id)
+
+    def _apply_stock_levels(self, levels: Dict[str, int], in_stock: Dict[str, bool]) -> None:
+        """Overwrite stock and availability with recovered ones."""
+        for product_id, level in levels.items():
+            product = self.products.get(product_id)
+            if product:
+                product.stock_quantity = level
+                product.in_stock = in_stock.get(product_id, level > 0)
+
+    def get_orders_by_status(self, orders: Union[List[Order], OrderIndex], status: str) -> List[Order]:
+        """Filter orders by status. Uses the status index when given an OrderIndex."""
+        if isinstance(orders, OrderIndex):
+            return orders.by_status(status)
         return [o for o in orders if o.status == status]
 
-    def get_customer_orders(self, orders: List[Order], customer_id: str) -> List[Order]:
-        """Get all orders for a specific customer."""
+    def get_customer_orders(self, orders: Union[List[Order], OrderIndex], customer_id: str) -> List[Order]:
+        """Get all orders for a specific customer. Uses the customer index when given an OrderIndex."""
+        if isinstance(orders, OrderIndex):
+            return orders.by_customer(customer_id)
         return [o for o in orders if o.customer_id == customer_id]
 
     def get_low_stock_products(self, threshold: int = 5) -> List[Product]:
-        """Get products with stock below the threshold."""
-        return [
-            p for p in self.products.values()
-            if p.stock_quantity <= threshold
-        ]
+        """Get products with stock at or below the threshold, lowest stock first."""
+        products = self.products
+        if self.stock_index is not None:
+            return [products[product_id] for product_id in self.stock_index.at_or_below(threshold)]
+        low = [p for p in products.values() if p.stock_quantity <= threshold]
+        low.sort(key=lambda p: (p.stock_quantity, p.id))
+        return low
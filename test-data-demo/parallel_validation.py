@@ -0,0 +1,97 @@
+"""Multi-process validation of large order backlogs."""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple
+from catalog import ProductCatalog
+from models import Order, OrderItem
+from order_processor import OrderProcessor
+
+# Per-worker processor, built once from the snapshot passed to the pool initializer
+_worker_processor: Optional[OrderProcessor] = None
+
+
+def _init_worker(customers, products) -> None:
+    global _worker_processor
+    _worker_processor = OrderProcessor(customers, products)
+
+
+# An order as plain tuples: (id, customer_id, [(product_id, quantity), ...], status, order_date)
+OrderRow = Tuple[str, str, List[Tuple[str, int]], str, str]
+
+
+def _validate_chunk(rows: List[OrderRow]) -> List[Tuple[bool, List[str]]]:
+    validate = _worker_processor.validate_order
+    return [
+        validate(Order(order_id, customer_id, [OrderItem(p, q) for p, q in items], status, order_date))
+        for order_id, customer_id, items, status, order_date in rows
+    ]
+
+
+def _chunks(orders: Iterable[Order], size: int) -> Iterator[List[OrderRow]]:
+    """
+    Split orders into chunks of plain tuples. Slotted dataclasses pickle
+    through Python-level __getstate__/__setstate__, which costs more per
+    order than validating it; tuples of strings and ints take the C paths.
+    """
+    it = iter(orders)
+    while True:
+        chunk = [
+            (o.id, o.customer_id, [(i.product_id, i.quantity) for i in o.items], o.status, o.order_date)
+            for o in islice(it, size)
+        ]
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_validate_orders_parallel(
+    processor: OrderProcessor,
+    orders: Iterable[Order],
+    workers: Optional[int] = None,
+    chunk_size: int = 5000,
+    mp_context=None,
+) -> Iterator[Tuple[bool, List[str]]]:
+    """
+    Validate orders across a process pool, yielding results as they finish.
+
+    The processor's customers and products are shipped to each worker once,
+    through the pool initializer, and treated as a read-only snapshot: stock
+    changes made after the pool starts are not seen. Orders are read from
+    the iterable in chunks, with at most two chunks per worker in flight,
+    so a lazy stream such as iter_orders is never held in memory whole.
+    The (is_valid, errors) results come out in input order.
+    """
+    customers = list(processor.customers.values())
+    products = processor.products
+    if not isinstance(products, ProductCatalog):
+        products = list(products.values())
+
+    workers = workers or os.cpu_count() or 1
+    chunks = _chunks(orders, chunk_size)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=mp_context,
+        initializer=_init_worker,
+        initargs=(customers, products),
+    ) as pool:
+        in_flight = deque(pool.submit(_validate_chunk, chunk) for chunk in islice(chunks, 2 * workers))
+        while in_flight:
+            chunk_results = in_flight.popleft().result()
+            # Refill before yielding so the workers stay busy while the caller runs
+            for chunk in islice(chunks, 1):
+                in_flight.append(pool.submit(_validate_chunk, chunk))
+            yield from chunk_results
+
+
+def validate_orders_parallel(
+    processor: OrderProcessor,
+    orders: Iterable[Order],
+    workers: Optional[int] = None,
+    chunk_size: int = 5000,
+    mp_context=None,
+) -> List[Tuple[bool, List[str]]]:
+    """Validate orders across a process pool; see iter_validate_orders_parallel."""
+    return list(iter_validate_orders_parallel(processor, orders, workers, chunk_size, mp_context))
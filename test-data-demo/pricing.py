@@ -0,0 +1,164 @@
+"""Fixed-point order pricing in integer cents."""
+
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Dict, Iterable, List, Mapping, Union
+from models import Customer, Product, Order
+
+BPS_PER_UNIT = 10_000
+
+# Rounding rules for discounted totals
+HALF_UP = "half_up"
+COMPATIBLE = "compatible"
+_VALID_STATUSES = frozenset(Order.VALID_STATUSES)
+
+
+def to_cents(amount: float) -> int:
+    """Convert a decimal amount to integer cents, rounding half up."""
+    return int(Decimal(str(amount)).scaleb(2).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+def to_basis_points(rate: float) -> int:
+    """Convert a fractional rate such as 0.05 to basis points (500)."""
+    return int(Decimal(str(rate)).scaleb(4).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+def apply_discount(subtotal_cents: int, discount_bps: int) -> int:
+    """
+    Discount a non-negative amount, rounding half a cent up:
+    floor((subtotal * (10000 - bps) + 5000) / 10000).
+    """
+    return (subtotal_cents * (BPS_PER_UNIT - discount_bps) + BPS_PER_UNIT // 2) // BPS_PER_UNIT
+
+
+class PricingEngine:
+    """
+    Order pricing over integer cents and basis points.
+
+    Product prices are held as cents and membership discounts as basis
+    points, so subtotals are exact integer sums no matter how many items an
+    order has, and the discounted total is the only value that is rounded.
+
+    With rounding=HALF_UP, totals ending in exactly half a cent round up.
+    The float path in OrderProcessor.calculate_order_total rounds those
+    ties either way, depending on how the float product happens to be
+    represented (39.90 less 5% gives 37.90 there), so the default
+    rounding=COMPATIBLE rounds half up everywhere except on exact ties,
+    which are resolved by redoing the float calculation for that order.
+    Totals then match calculate_order_total exactly; ties are a few
+    percent of orders at most.
+
+    Pricing semantics otherwise follow calculate_order_total: orders with
+    invalid structure cost 0, unknown products contribute nothing and
+    unknown customers get no discount. Call refresh_product or
+    refresh_customer after changing a price or membership level, or build
+    the engine with from_processor to follow the processor's changes.
+    """
+
+    def __init__(
+        self,
+        products: Union[Mapping[str, Product], Iterable[Product]],
+        customers: Union[Mapping[str, Customer], Iterable[Customer]],
+        rounding: str = COMPATIBLE,
+    ):
+        if rounding not in (HALF_UP, COMPATIBLE):
+            raise ValueError(f"Unknown rounding rule: {rounding!r}")
+        self.rounding = rounding
+        products = products.values() if isinstance(products, Mapping) else products
+        customers = customers.values() if isinstance(customers, Mapping) else customers
+        self.price_cents: Dict[str, int] = {p.id: to_cents(p.price) for p in products}
+        self.discount_bps: Dict[str, int] = {
+            c.id: to_basis_points(c.get_discount_rate()) for c in customers
+        }
+        self._unsubscribe = None
+
+    @classmethod
+    def from_processor(cls, processor, rounding: str = COMPATIBLE) -> "PricingEngine":
+        """
+        Build an engine that stays in step with an OrderProcessor's price and
+        membership updates. Stock movements do not affect prices, so it does
+        not listen to them.
+        """
+        from order_processor import CUSTOMER_CHANGED, PRODUCT_CHANGED
+
+        engine = cls(processor.products, processor.customers, rounding)
+
+        def on_change(kind: str, record_id: str) -> None:
+            if kind == PRODUCT_CHANGED:
+                engine.refresh_product(processor.get_product(record_id))
+            elif kind == CUSTOMER_CHANGED:
+                engine.refresh_customer(processor.get_customer(record_id))
+
+        engine._unsubscribe = processor.subscribe_changes(on_change)
+        return engine
+
+    def close(self) -> None:
+        """Stop following the processor, if any."""
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+
+    def refresh_product(self, product: Product) -> None:
+        """Pick up a product's current price."""
+        self.price_cents[product.id] = to_cents(product.price)
+
+    def refresh_customer(self, customer: Customer) -> None:
+        """Pick up a customer's current discount."""
+        self.discount_bps[customer.id] = to_basis_points(customer.get_discount_rate())
+
+    def order_total_cents(self, order: Order) -> int:
+        """Discounted total of one order in cents."""
+        return self.price_orders_cents((order,))[0]
+
+    def order_total(self, order: Order) -> float:
+        """Discounted total of one order, as calculate_order_total returns it."""
+        return self.order_total_cents(order) / 100
+
+    def price_orders_cents(self, orders: Iterable[Order]) -> List[int]:
+        """Discounted totals in cents for a batch of orders, in order."""
+        prices = self.price_cents
+        discounts = self.discount_bps
+        statuses = _VALID_STATUSES
+        compatible = self.rounding == COMPATIBLE
+        totals = []
+        append = totals.append
+
+        for order in orders:
+            # Same checks as Order.is_valid, folded into the pricing loop
+            if not (order.id and order.customer_id and order.items and order.status in statuses):
+                append(0)
+                continue
+            subtotal = 0
+            for item in order.items:
+                quantity = item.quantity
+                if not item.product_id or quantity <= 0:
+                    subtotal = None
+                    break
+                price = prices.get(item.product_id)
+                if price is not None:
+                    subtotal += price * quantity
+            if subtotal is None:
+                append(0)
+                continue
+            # apply_discount, inlined
+            bps = discounts.get(order.customer_id, 0)
+            scaled = subtotal * (BPS_PER_UNIT - bps)
+            if compatible and scaled % BPS_PER_UNIT == BPS_PER_UNIT // 2:
+                append(self._float_tie(order, bps))
+            else:
+                append((scaled + BPS_PER_UNIT // 2) // BPS_PER_UNIT)
+        return totals
+
+    def _float_tie(self, order: Order, discount_bps: int) -> int:
+        """Round an exact half-cent total the way the float path does."""
+        prices = self.price_cents
+        subtotal = 0.0
+        for item in order.items:
+            price = prices.get(item.product_id)
+            if price is not None:
+                subtotal += price / 100 * item.quantity
+        subtotal *= (1 - discount_bps / BPS_PER_UNIT)
+        return round(round(subtotal, 2) * 100)
+
+    def price_orders(self, orders: Iterable[Order]) -> List[float]:
+        """Discounted totals for a batch of orders, in order."""
+        return [cents / 100 for cents in self.price_orders_cents(orders)]
@@ -0,0 +1,271 @@
+"""Declarative pricing rules compiled into lookup tables."""
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple, Union
+from models import Customer, Product, Order
+
+
+@dataclass(frozen=True)
+class CategoryDiscount:
+    """Take rate off every line for a product in the category."""
+    category: str
+    rate: float
+    tiers: Optional[Tuple[str, ...]] = None
+
+
+@dataclass(frozen=True)
+class QuantityBreak:
+    """
+    Take rate off a line ordering at least min_quantity units, for one
+    product, one category, or (with neither given) every product.
+    """
+    min_quantity: int
+    rate: float
+    product_id: Optional[str] = None
+    category: Optional[str] = None
+    tiers: Optional[Tuple[str, ...]] = None
+
+
+@dataclass(frozen=True)
+class Promotion:
+    """
+    Take rate off lines for the listed products and categories (every
+    product if both are empty), for orders dated from start up to but not
+    including end. Dates compare as ISO strings, e.g. "2024-05-01".
+    """
+    rate: float
+    product_ids: Tuple[str, ...] = ()
+    categories: Tuple[str, ...] = ()
+    start: Optional[str] = None
+    end: Optional[str] = None
+    tiers: Optional[Tuple[str, ...]] = None
+
+
+@dataclass(frozen=True)
+class TierDiscount:
+    """Replace the order-level membership discount for a membership level."""
+    membership_level: str
+    rate: float
+
+
+PricingRule = Union[CategoryDiscount, QuantityBreak, Promotion, TierDiscount]
+
+# Ascending minimum quantities and the best rate from each on
+Steps = Tuple[Tuple[int, ...], Tuple[float, ...]]
+
+# Per date segment and tier: product overlay, category steps, every-product steps
+Context = Tuple[Dict[str, Steps], Dict[str, Steps], Optional[Steps]]
+
+
+def _add_step(steps: Dict[int, float], min_quantity: int, rate: float) -> None:
+    steps[min_quantity] = max(rate, steps.get(min_quantity, 0.0))
+
+
+def _to_steps(steps: Mapping[int, float]) -> Steps:
+    """Ascending thresholds and the best rate from each threshold on."""
+    thresholds = tuple(sorted(steps))
+    rates, best = [], 0.0
+    for threshold in thresholds:
+        best = max(best, steps[threshold])
+        rates.append(best)
+    return thresholds, tuple(rates)
+
+
+class CompiledRules:
+    """
+    Pricing rules compiled against a product list.
+
+    Line rules (category discounts, quantity breaks, promotions) do not
+    stack: each line gets the single best rate among the rules that apply
+    to it, then the order gets its membership discount, from a TierDiscount
+    if one is given for the level and Customer.get_discount_rate otherwise.
+    Unknown customers get neither tier-specific line rules nor a membership
+    discount, and rounding is the same round(total, 2) as the plain path,
+    so an empty rule list prices exactly like it.
+
+    Rules are compiled into quantity steps at three levels: per product ID
+    (rules naming products), per category, and one set for rules covering
+    every product; a line's rate is the best of the three. Rules that hold
+    on every date for every membership level go into a base table once.
+    The calendar is split at every promotion boundary, and for each date
+    segment and membership level that orders actually use, a context is
+    compiled on first use: category and every-product steps, plus steps
+    for just the products that rules limited to that date or level name.
+    Compile cost therefore follows the number of rules and the products
+    they name, not the size of the catalog. Pricing an order is a bisect
+    for its segment, one context fetch, and then per item a few dict
+    lookups and bisects, never a walk over the rules. Tables hold rates,
+    not prices, so price changes need no recompile; products added
+    afterwards get the category and every-product rules.
+    """
+
+    def __init__(self, rules: Iterable[PricingRule], products: Iterable[Product]):
+        rules = list(rules)
+        for rule in rules:
+            if not 0.0 <= rule.rate <= 1.0:
+                raise ValueError(f"Rate must be between 0 and 1: {rule!r}")
+            if isinstance(rule, QuantityBreak) and rule.min_quantity < 1:
+                raise ValueError(f"min_quantity must be positive: {rule!r}")
+
+        self.tier_rates: Dict[str, float] = {
+            r.membership_level: r.rate for r in rules if isinstance(r, TierDiscount)
+        }
+        line_rules = [r for r in rules if not isinstance(r, TierDiscount)]
+        categories = {p.id: p.category for p in products}
+
+        self.boundaries: List[str] = sorted(
+            {d for r in line_rules for d in (getattr(r, "start", None), getattr(r, "end", None)) if d}
+        )
+        self._tiers = frozenset(t for r in line_rules if r.tiers for t in r.tiers)
+
+        # Unconditional rules go straight into the base steps; rules limited
+        # by date or tier are kept with their targets for the contexts
+        self._base_products: Dict[str, Dict[int, float]] = {}
+        self._base_categories: Dict[str, Dict[int, float]] = {}
+        self._base_every: Dict[int, float] = {0: 0.0}
+        self._conditional: List[Tuple[PricingRule, Tuple[List[str], List[str], bool]]] = []
+        for rule in line_rules:
+            targets = self._targets(rule, categories)
+            if rule.tiers is not None or getattr(rule, "start", None) or getattr(rule, "end", None):
+                self._conditional.append((rule, targets))
+            else:
+                self._add(rule, targets, self._base_products, self._base_categories, self._base_every)
+        self.base: Dict[str, Steps] = {
+            product_id: _to_steps(steps) for product_id, steps in self._base_products.items()
+        }
+        # (segment, membership level or None) -> Context
+        self._contexts: Dict[Tuple[int, Optional[str]], Context] = {}
+
+    @staticmethod
+    def _targets(rule: PricingRule, categories: Mapping[str, str]) -> Tuple[List[str], List[str], bool]:
+        """(product IDs, categories, whether it covers every product) a line rule applies to."""
+        if isinstance(rule, CategoryDiscount):
+            return [], [rule.category], False
+        if isinstance(rule, QuantityBreak):
+            if rule.product_id is not None:
+                category = categories.get(rule.product_id)
+                if category is None or (rule.category is not None and rule.category != category):
+                    return [], [], False
+                return [rule.product_id], [], False
+            if rule.category is not None:
+                return [], [rule.category], False
+            return [], [], True
+        if not rule.product_ids and not rule.categories:
+            return [], [], True
+        return [pid for pid in rule.product_ids if pid in categories], list(rule.categories), False
+
+    @staticmethod
+    def _add(rule: PricingRule, targets: Tuple[List[str], List[str], bool],
+             products: Dict[str, Dict[int, float]], categories: Dict[str, Dict[int, float]],
+             every: Dict[int, float], base_products: Optional[Mapping[str, Dict[int, float]]] = None) -> None:
+        """Add a rule's step to every target; products new to products start from base_products."""
+        base_products = base_products or {}
+        min_quantity = getattr(rule, "min_quantity", 1)
+        product_ids, category_names, everything = targets
+        for product_id in product_ids:
+            steps = products.get(product_id)
+            if steps is None:
+                steps = products[product_id] = dict(base_products.get(product_id, {0: 0.0}))
+            _add_step(steps, min_quantity, rule.rate)
+        for category in category_names:
+            _add_step(categories.setdefault(category, {0: 0.0}), min_quantity, rule.rate)
+        if everything:
+            _add_step(every, min_quantity, rule.rate)
+
+    @staticmethod
+    def _covers(start: Optional[str], end: Optional[str],
+                seg_start: Optional[str], seg_end: Optional[str]) -> bool:
+        """Whether [start, end) contains the whole segment [seg_start, seg_end)."""
+        if start is not None and (seg_start is None or seg_start < start):
+            return False
+        if end is not None and (seg_end is None or seg_end > end):
+            return False
+        return True
+
+    def _context(self, order_date: str, membership_level: Optional[str]) -> Context:
+        segment = bisect_right(self.boundaries, order_date)
+        tier = membership_level if membership_level in self._tiers else None
+        context = self._contexts.get((segment, tier))
+        if context is None:
+            context = self._contexts[(segment, tier)] = self._compile_context(segment, tier)
+        return context
+
+    def _compile_context(self, segment: int, tier: Optional[str]) -> Context:
+        seg_start = self.boundaries[segment - 1] if segment else None
+        seg_end = self.boundaries[segment] if segment < len(self.boundaries) else None
+        products: Dict[str, Dict[int, float]] = {}
+        categories = {category: dict(steps) for category, steps in self._base_categories.items()}
+        every = dict(self._base_every)
+        for rule, targets in self._conditional:
+            if rule.tiers is not None and tier not in rule.tiers:
+                continue
+            if self._covers(getattr(rule, "start", None), getattr(rule, "end", None), seg_start, seg_end):
+                self._add(rule, targets, products, categories, every, self._base_products)
+        return ({product_id: _to_steps(steps) for product_id, steps in products.items()},
+                {category: _to_steps(steps) for category, steps in categories.items()},
+                _to_steps(every) if len(every) > 1 else None)
+
+    def line_steps(self, product: Product, order_date: str,
+                   membership_level: Optional[str]) -> Optional[Steps]:
+        """A product's quantity steps for an order date and level, None if no rule applies."""
+        overlay, categories, every = self._context(order_date, membership_level)
+        layers = [overlay.get(product.id) or self.base.get(product.id), categories.get(product.category), every]
+        merged: Dict[int, float] = {}
+        for layer in layers:
+            if layer is not None:
+                for threshold, rate in zip(*layer):
+                    _add_step(merged, threshold, rate)
+        return _to_steps(merged) if merged else None
+
+    def tier_rate(self, customer: Optional[Customer]) -> float:
+        """Order-level discount rate for a customer, 0 if unknown."""
+        if customer is None:
+            return 0.0
+        rate = self.tier_rates.get(customer.membership_level)
+        return customer.get_discount_rate() if rate is None else rate
+
+    def total(self, order: Order, customer: Optional[Customer],
+              lines: Iterable[Tuple[Product, int]]) -> float:
+        """Rounded total of an order's priced lines (known products only)."""
+        overlay, categories, every = self._context(
+            order.order_date, customer.membership_level if customer else None)
+        base = self.base
+        subtotal = 0.0
+        for product, quantity in lines:
+            line = product.price * quantity
+            rate = 0.0
+            steps = overlay.get(product.id) or base.get(product.id)
+            if steps is not None:
+                thresholds, rates = steps
+                rate = rates[bisect_right(thresholds, quantity) - 1]
+            steps = categories.get(product.category)
+            if steps is not None:
+                thresholds, rates = steps
+                rate = max(rate, rates[bisect_right(thresholds, quantity) - 1])
+            if every is not None:
+                thresholds, rates = every
+                rate = max(rate, rates[bisect_right(thresholds, quantity) - 1])
+            if rate:
+                line *= (1 - rate)
+            subtotal += line
+        subtotal *= (1 - self.tier_rate(customer))
+        return round(subtotal, 2)
+
+    def price_orders(self, orders: Iterable[Order], customers: Mapping[str, Customer],
+                     products: Mapping[str, Product]) -> List[float]:
+        """Totals for a batch of orders, 0 for orders with invalid structure."""
+        totals = []
+        append = totals.append
+        for order in orders:
+            if not order.is_valid():
+                append(0.0)
+                continue
+            lines = []
+            for item in order.items:
+                product = products.get(item.product_id)
+                if product:
+                    lines.append((product, item.quantity))
+            append(self.total(order, customers.get(order.customer_id), lines))
+        return totals
+
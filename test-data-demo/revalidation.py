@@ -0,0 +1,150 @@
+"""Incremental revalidation of open orders as products and customers change."""
+
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from models import Order
+from order_processor import CUSTOMER_CHANGED, OrderProcessor, PRODUCT_CHANGED, STOCK_CHANGED
+
+
+@dataclass(frozen=True)
+class RevalidationResult:
+    """Validation outcome and price of one order at a point in time."""
+    valid: bool
+    errors: Tuple[str, ...]
+    total: float
+
+
+@dataclass(frozen=True)
+class RevalidationChange:
+    """An order whose validation outcome or total changed."""
+    order_id: str
+    previous: RevalidationResult
+    current: RevalidationResult
+
+
+class IncrementalRevalidator:
+    """
+    Cached validate_order/calculate_order_total results for open orders.
+
+    Tracked orders (pending or confirmed by default) are indexed by the
+    products and customer they reference. Subscribed to an OrderProcessor,
+    every product or customer change marks just the orders that reference
+    it as dirty; refresh() re-runs validation and pricing for those orders
+    only and returns the ones whose result changed. Work per refresh is
+    proportional to the orders touched by the changes, not to how many
+    orders are tracked. Changes made to products or customers outside the
+    processor can be reported with mark_product_changed and
+    mark_customer_changed.
+    """
+
+    TRACKED_STATUSES = frozenset({"pending", "confirmed"})
+
+    def __init__(self, processor: OrderProcessor, orders: Iterable[Order] = ()):
+        self.processor = processor
+        self._lock = threading.Lock()
+        self._orders: Dict[str, Order] = {}
+        self._results: Dict[str, RevalidationResult] = {}
+        self._by_product: Dict[str, Set[str]] = {}
+        self._by_customer: Dict[str, Set[str]] = {}
+        # Insertion-ordered set of order IDs awaiting revalidation
+        self._dirty: Dict[str, None] = {}
+        for order in orders:
+            self.track(order)
+        self._unsubscribe = processor.subscribe_changes(self._on_change)
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    def close(self) -> None:
+        """Stop following the processor's changes."""
+        self._unsubscribe()
+
+    def track(self, order: Order) -> None:
+        """
+        Start (or, after an edit or status change, refresh) tracking an order.
+        Orders whose status is not tracked are dropped instead.
+        """
+        self.untrack(order.id)
+        if order.status not in self.TRACKED_STATUSES:
+            return
+        result = self._evaluate(order)
+        with self._lock:
+            self._orders[order.id] = order
+            self._results[order.id] = result
+            for item in order.items:
+                self._by_product.setdefault(item.product_id, set()).add(order.id)
+            self._by_customer.setdefault(order.customer_id, set()).add(order.id)
+
+    def untrack(self, order_id: str) -> None:
+        """Stop tracking an order, e.g. once it has been processed."""
+        with self._lock:
+            order = self._orders.pop(order_id, None)
+            if order is None:
+                return
+            del self._results[order_id]
+            self._dirty.pop(order_id, None)
+            for item in order.items:
+                self._discard(self._by_product, item.product_id, order_id)
+            self._discard(self._by_customer, order.customer_id, order_id)
+
+    def result(self, order_id: str) -> Optional[RevalidationResult]:
+        """Latest result for a tracked order, as of the last refresh."""
+        return self._results.get(order_id)
+
+    def orders_for_product(self, product_id: str) -> Set[str]:
+        """IDs of tracked orders with an item for the product."""
+        with self._lock:
+            return set(self._by_product.get(product_id, ()))
+
+    def orders_for_customer(self, customer_id: str) -> Set[str]:
+        """IDs of tracked orders placed by the customer."""
+        with self._lock:
+            return set(self._by_customer.get(customer_id, ()))
+
+    def mark_product_changed(self, product_id: str) -> None:
+        """Queue every tracked order referencing the product for revalidation."""
+        with self._lock:
+            self._dirty.update(dict.fromkeys(self._by_product.get(product_id, ())))
+
+    def mark_customer_changed(self, customer_id: str) -> None:
+        """Queue every tracked order of the customer for revalidation."""
+        with self._lock:
+            self._dirty.update(dict.fromkeys(self._by_customer.get(customer_id, ())))
+
+    def refresh(self) -> List[RevalidationChange]:
+        """Revalidate and reprice queued orders; return those whose result changed."""
+        with self._lock:
+            dirty = [self._orders[order_id] for order_id in self._dirty]
+            self._dirty.clear()
+
+        changes = []
+        for order in dirty:
+            current = self._evaluate(order)
+            with self._lock:
+                previous = self._results.get(order.id)
+                # Skip orders untracked while being re-evaluated
+                if previous is None:
+                    continue
+                self._results[order.id] = current
+            if current != previous:
+                changes.append(RevalidationChange(order.id, previous, current))
+        return changes
+
+    def _on_change(self, kind: str, record_id: str) -> None:
+        if kind == PRODUCT_CHANGED or kind == STOCK_CHANGED:
+            self.mark_product_changed(record_id)
+        elif kind == CUSTOMER_CHANGED:
+            self.mark_customer_changed(record_id)
+
+    def _evaluate(self, order: Order) -> RevalidationResult:
+        valid, errors = self.processor.validate_order(order)
+        return RevalidationResult(valid, tuple(errors), self.processor.calculate_order_total(order))
+
+    @staticmethod
+    def _discard(index: Dict[str, Set[str]], key: str, order_id: str) -> None:
+        ids = index.get(key)
+        if ids is not None:
+            ids.discard(order_id)
+            if not ids:
+                del index[key]
@@ -0,0 +1,141 @@
+"""Binary snapshot cache for parsed fixture files."""
+
+import hashlib
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+from typing import Callable, List, Optional, Tuple
+from models import Customer, Product, Order, OrderItem
+from data_loader import FIXTURES_DIR, load_customers, load_products, load_orders
+
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".snapshot_cache")
+
+MAGIC = b"TDSNAP01"
+# magic, source size, source mtime_ns, length of the source path that follows
+_HEADER = struct.Struct("<8sQqI")
+
+
+def encode_customers(customers: List[Customer]) -> list:
+    return [(c.id, c.name, c.email, c.membership_level, c.created_at) for c in customers]
+
+
+def decode_customers(rows: list) -> List[Customer]:
+    return [Customer(*row) for row in rows]
+
+
+def encode_products(products: List[Product]) -> list:
+    return [(p.id, p.name, p.price, p.category, p.in_stock, p.stock_quantity) for p in products]
+
+
+def decode_products(rows: list) -> List[Product]:
+    return [Product(*row) for row in rows]
+
+
+def encode_orders(orders: List[Order]) -> list:
+    return [
+        (o.id, o.customer_id, tuple((i.product_id, i.quantity) for i in o.items),
+         o.status, o.order_date)
+        for o in orders
+    ]
+
+
+def decode_orders(rows: list) -> List[Order]:
+    return [
+        Order(order_id, customer_id, [OrderItem(p, q) for p, q in items], status, order_date)
+        for order_id, customer_id, items, status, order_date in rows
+    ]
+
+
+class SnapshotCache:
+    """
+    Caches parsed customers, products and orders as compact binary snapshots.
+
+    A snapshot holds the records as plain tuples, keyed on the source file's
+    absolute path, mtime and size. Loads read the snapshot through a
+    read-only memory map when the key still matches and fall back to parsing
+    the JSON (and rewriting the snapshot) when the source has changed or the
+    snapshot is missing or unreadable.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+
+    def load_customers(self, filepath: str = None) -> List[Customer]:
+        """Load customers, from the snapshot when it is current."""
+        if filepath is None:
+            filepath = os.path.join(FIXTURES_DIR, "sample_customers.json")
+        return self._load(filepath, "customers", load_customers, encode_customers, decode_customers)
+
+    def load_products(self, filepath: str = None) -> List[Product]:
+        """Load products, from the snapshot when it is current."""
+        if filepath is None:
+            filepath = os.path.join(FIXTURES_DIR, "sample_products.json")
+        return self._load(filepath, "products", load_products, encode_products, decode_products)
+
+    def load_orders(self, filepath: str = None) -> List[Order]:
+        """Load orders, from the snapshot when it is current."""
+        if filepath is None:
+            filepath = os.path.join(FIXTURES_DIR, "sample_orders.json")
+        return self._load(filepath, "orders", load_orders, encode_orders, decode_orders)
+
+    def snapshot_path(self, filepath: str, kind: str) -> str:
+        """Where the snapshot for a source file is stored."""
+        digest = hashlib.sha1(os.path.abspath(filepath).encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"{kind}-{digest}.snap")
+
+    def _load(self, filepath: str, kind: str, parse: Callable, encode: Callable, decode: Callable):
+        source = os.path.abspath(filepath)
+        stat = os.stat(source)
+        key = (stat.st_size, stat.st_mtime_ns, source)
+        snapshot = self.snapshot_path(source, kind)
+
+        rows = _read_snapshot(snapshot, key)
+        if rows is not None:
+            self.hits += 1
+            return decode(rows)
+
+        self.misses += 1
+        records = parse(source)
+        _write_snapshot(snapshot, key, encode(records))
+        return records
+
+
+def _read_snapshot(path: str, key: Tuple[int, int, str]) -> Optional[list]:
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            magic, size, mtime_ns, path_len = _HEADER.unpack_from(mm, 0)
+            start = _HEADER.size + path_len
+            if (magic, size, mtime_ns) != (MAGIC, key[0], key[1]):
+                return None
+            if mm[_HEADER.size:start].decode("utf-8") != key[2]:
+                return None
+            with memoryview(mm) as view, view[start:] as payload:
+                return pickle.loads(payload)
+    except (OSError, ValueError, struct.error, pickle.UnpicklingError, EOFError):
+        # Missing, truncated or corrupt snapshots are treated as a cache miss
+        return None
+
+
+def _write_snapshot(path: str, key: Tuple[int, int, str], rows: list) -> None:
+    size, mtime_ns, source = key
+    encoded_source = source.encode("utf-8")
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_HEADER.pack(MAGIC, size, mtime_ns, len(encoded_source)))
+                f.write(encoded_source)
+                pickle.dump(rows, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        # A read-only cache directory only costs the speedup, not the load
+        pass
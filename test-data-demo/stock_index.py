@@ -0,0 +1,128 @@
+"""Ordered index of product stock levels."""
+
+import threading
+from bisect import bisect_left, bisect_right, insort
+from typing import Callable, Dict, Iterable, List, Set, Tuple
+from models import Product
+
+# Called as callback(product_id, old_quantity, new_quantity)
+StockListener = Callable[[str, int, int], None]
+
+
+class StockLevelIndex:
+    """
+    Products bucketed by stock_quantity.
+
+    Each distinct level maps to the set of products at it, and the levels
+    themselves are kept sorted. A sale usually moves a product between two
+    existing buckets, which is a pair of set operations; the sorted list of
+    levels only changes when a level gains its first or loses its last
+    product. Low-stock queries walk the levels up to the threshold, so they
+    cost O(k log k) for k results. Subscribers are notified whenever an
+    update moves a product's stock across their threshold, in either
+    direction, so callers do not need to poll. Updates are serialized by an
+    internal lock.
+    """
+
+    def __init__(self, products: Iterable[Product] = ()):
+        self._levels: Dict[str, int] = {}
+        self._buckets: Dict[int, Set[str]] = {}
+        # Sorted distinct stock levels, the keys of _buckets
+        self._quantities: List[int] = []
+        self._thresholds: List[int] = []
+        self._listeners: List[Tuple[int, StockListener]] = []
+        self._lock = threading.Lock()
+        for product in products:
+            self._levels[product.id] = product.stock_quantity
+            self._buckets.setdefault(product.stock_quantity, set()).add(product.id)
+        self._quantities = sorted(self._buckets)
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[Tuple[int, str]]) -> "StockLevelIndex":
+        """Rebuild an index from entries() output."""
+        index = cls()
+        for quantity, product_id in entries:
+            index._levels[product_id] = quantity
+            index._buckets.setdefault(quantity, set()).add(product_id)
+        index._quantities = sorted(index._buckets)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._levels)
+
+    def entries(self) -> List[Tuple[int, str]]:
+        """(stock_quantity, product_id) pairs, lowest stock first."""
+        with self._lock:
+            return [(quantity, product_id) for quantity in self._quantities
+                    for product_id in sorted(self._buckets[quantity])]
+
+    def level(self, product_id: str) -> int:
+        """Get the indexed stock level of a product."""
+        return self._levels[product_id]
+
+    def update(self, product_id: str, stock_quantity: int) -> None:
+        """Record a product's new stock level, adding the product if it is new."""
+        with self._lock:
+            old = self._levels.get(product_id)
+            if old == stock_quantity:
+                return
+            self._levels[product_id] = stock_quantity
+            if old is not None:
+                self._discard(product_id, old)
+            bucket = self._buckets.get(stock_quantity)
+            if bucket is None:
+                self._buckets[stock_quantity] = {product_id}
+                insort(self._quantities, stock_quantity)
+            else:
+                bucket.add(product_id)
+            if old is None or not self._thresholds:
+                return
+            lo, hi = min(old, stock_quantity), max(old, stock_quantity)
+            start = bisect_left(self._thresholds, lo)
+            end = bisect_left(self._thresholds, hi, start)
+            crossed = [callback for _, callback in self._listeners[start:end]]
+        for callback in crossed:
+            callback(product_id, old, stock_quantity)
+
+    def _discard(self, product_id: str, quantity: int) -> None:
+        bucket = self._buckets[quantity]
+        bucket.discard(product_id)
+        if not bucket:
+            del self._buckets[quantity]
+            del self._quantities[bisect_left(self._quantities, quantity)]
+
+    def remove(self, product_id: str) -> None:
+        """Drop a product from the index."""
+        with self._lock:
+            old = self._levels.pop(product_id, None)
+            if old is not None:
+                self._discard(product_id, old)
+
+    def at_or_below(self, threshold: int) -> List[str]:
+        """Get IDs of products with stock <= threshold, lowest stock first."""
+        with self._lock:
+            end = bisect_right(self._quantities, threshold)
+            return [product_id for quantity in self._quantities[:end]
+                    for product_id in sorted(self._buckets[quantity])]
+
+    def subscribe(self, threshold: int, callback: StockListener) -> Callable[[], None]:
+        """
+        Call callback(product_id, old, new) whenever a product's stock moves
+        from above threshold to at-or-below it, or back. Returns a function
+        that cancels the subscription.
+        """
+        entry = (threshold, callback)
+        with self._lock:
+            pos = bisect_left(self._thresholds, threshold)
+            self._thresholds.insert(pos, threshold)
+            self._listeners.insert(pos, entry)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                for pos, listener in enumerate(self._listeners):
+                    if listener is entry:
+                        del self._listeners[pos]
+                        del self._thresholds[pos]
+                        break
+
+        return unsubscribe
@@ -0,0 +1,151 @@
+"""Durable append-only ledger of stock movements."""
+
+import json
+import os
+import tempfile
+import threading
+from typing import Dict, List, Optional, Tuple
+
+LOG_NAME = "stock.log"
+CHECKPOINT_NAME = "checkpoint.json"
+
+
+class StockLedger:
+    """
+    Append-only log of stock movements with group commit and checkpoints.
+
+    Each movement is one JSON line [seq, product_id, delta, level, in_stock]
+    holding the product's resulting stock level and availability, so replay
+    only needs the last record per product. Changes of availability alone
+    are recorded with a delta of 0. Records are buffered and written,
+    flushed and fsynced together once group_size are pending or commit()
+    is called; a crash loses at most the uncommitted group. Every
+    checkpoint_every committed records the current levels and availability
+    are written to a checkpoint and the log is truncated, so opening a
+    ledger costs one checkpoint load plus a short tail replay. A torn final
+    line from a crash mid-write is ignored and cut off on open.
+    """
+
+    def __init__(self, directory: str, group_size: int = 256,
+                 checkpoint_every: int = 100_000, fsync: bool = True):
+        self.directory = directory
+        self.group_size = group_size
+        self.checkpoint_every = checkpoint_every
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        self._pending: List[str] = []
+        os.makedirs(directory, exist_ok=True)
+        self._levels, self._available, self._seq, self._logged = self._recover()
+        self._log = open(self._log_path, "a", encoding="utf-8")
+
+    @property
+    def _log_path(self) -> str:
+        return os.path.join(self.directory, LOG_NAME)
+
+    @property
+    def _checkpoint_path(self) -> str:
+        return os.path.join(self.directory, CHECKPOINT_NAME)
+
+    def levels(self) -> Dict[str, int]:
+        """Latest stock level of every product that has moved."""
+        with self._lock:
+            return dict(self._levels)
+
+    def availability(self) -> Dict[str, bool]:
+        """Latest in_stock flag of every product that has moved."""
+        with self._lock:
+            return dict(self._available)
+
+    def record(self, product_id: str, delta: int, level: int, in_stock: Optional[bool] = None) -> None:
+        """
+        Append a stock movement; it becomes durable at the next commit.
+        in_stock defaults to whether any stock remains.
+        """
+        if in_stock is None:
+            in_stock = level > 0
+        with self._lock:
+            self._seq += 1
+            self._levels[product_id] = level
+            self._available[product_id] = in_stock
+            self._pending.append(json.dumps([self._seq, product_id, delta, level, in_stock]) + "\n")
+            if len(self._pending) >= self.group_size:
+                self._commit()
+
+    def commit(self) -> None:
+        """Write and sync every pending movement."""
+        with self._lock:
+            self._commit()
+
+    def checkpoint(self) -> None:
+        """Commit, write current levels to a checkpoint and truncate the log."""
+        with self._lock:
+            self._commit(allow_checkpoint=False)
+            self._checkpoint()
+
+    def close(self) -> None:
+        """Commit pending movements and close the log."""
+        with self._lock:
+            self._commit()
+            self._log.close()
+
+    def __enter__(self) -> "StockLedger":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _commit(self, allow_checkpoint: bool = True) -> None:
+        if self._pending:
+            self._log.write("".join(self._pending))
+            self._log.flush()
+            if self.fsync:
+                os.fsync(self._log.fileno())
+            self._logged += len(self._pending)
+            self._pending.clear()
+        if allow_checkpoint and self._logged >= self.checkpoint_every:
+            self._checkpoint()
+
+    def _checkpoint(self) -> None:
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"seq": self._seq, "levels": self._levels, "in_stock": self._available}, f)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        os.replace(tmp, self._checkpoint_path)
+        # Records up to seq are now covered by the checkpoint; if we crash
+        # before this truncate, replay skips them by sequence number
+        self._log.close()
+        self._log = open(self._log_path, "w", encoding="utf-8")
+        self._logged = 0
+
+    def _recover(self) -> Tuple[Dict[str, int], Dict[str, bool], int, int]:
+        levels: Dict[str, int] = {}
+        available: Dict[str, bool] = {}
+        seq = 0
+        if os.path.exists(self._checkpoint_path):
+            with open(self._checkpoint_path, encoding="utf-8") as f:
+                checkpoint = json.load(f)
+            levels, available, seq = checkpoint["levels"], checkpoint["in_stock"], checkpoint["seq"]
+
+        replayed = 0
+        good_bytes = 0
+        if os.path.exists(self._log_path):
+            with open(self._log_path, "rb") as f:
+                for raw in f:
+                    if not raw.endswith(b"\n"):
+                        break
+                    try:
+                        record_seq, product_id, _, level, in_stock = json.loads(raw)
+                    except ValueError:
+                        break
+                    good_bytes += len(raw)
+                    replayed += 1
+                    if record_seq > seq:
+                        levels[product_id] = level
+                        available[product_id] = in_stock
+                        seq = record_seq
+            if good_bytes != os.path.getsize(self._log_path):
+                with open(self._log_path, "r+b") as f:
+                    f.truncate(good_bytes)
+        return levels, available, seq, replayed
@@ -33,3 +33,50 @@ def order_processor(sample_customers, sample_products):
     """Create an OrderProcessor with sample data."""
     from order_processor import OrderProcessor
     return OrderProcessor(sample_customers, sample_products)
+
+
+@pytest.fixture
+def demo_customers():
+    """A small in-memory customer set covering every membership level."""
+    from models import Customer
+    return [
+        Customer("c1", "Ada Lovelace", "ada@example.com", "bronze", "2024-01-02"),
+        Customer("c2", "Alan Turing", "alan@example.com", "silver", "2024-02-03"),
+        Customer("c3", "Grace Hopper", "grace@example.com", "gold", "2024-03-04"),
+        Customer("c4", "Edsger Dijkstra", "edsger@example.com", "platinum", "2024-04-05"),
+    ]
+
+
+@pytest.fixture
+def demo_products():
+    """A small in-memory product catalog with mixed stock levels."""
+    from models import Product
+    return [
+        Product("p1", "Keyboard", 49.99, "electronics", True, 10),
+        Product("p2", "Mouse", 19.95, "electronics", True, 3),
+        Product("p3", "Desk Lamp", 34.50, "home", True, 1),
+        Product("p4", "Notebook", 4.25, "stationery", True, 100),
+        Product("p5", "Monitor", 189.00, "electronics", False, 0),
+    ]
+
+
+@pytest.fixture
+def demo_orders():
+    """In-memory orders that exercise success and each rejection path."""
+    from models import Order, OrderItem
+    return [
+        Order("o1", "c1", [OrderItem("p1", 2), OrderItem("p4", 5)], "pending", "2024-05-01"),
+        Order("o2", "c4", [OrderItem("p2", 2)], "confirmed", "2024-05-02"),
+        Order("o3", "c2", [OrderItem("p2", 2)], "pending", "2024-05-03"),
+        Order("o4", "c9", [OrderItem("p1", 1)], "pending", "2024-05-04"),
+        Order("o5", "c3", [OrderItem("p5", 1), OrderItem("p0", 1)], "pending", "2024-05-05"),
+        Order("o6", "c3", [], "pending", "2024-05-06"),
+        Order("o7", "c3", [OrderItem("p3", 1), OrderItem("p1", 3)], "shipped", "2024-05-07"),
+    ]
+
+
+@pytest.fixture
+def demo_processor(demo_customers, demo_products):
+    """Create an OrderProcessor over the in-memory demo data."""
+    from order_processor import OrderProcessor
+    return OrderProcessor(demo_customers, demo_products)
@@ -0,0 +1,97 @@
+"""Tests for the columnar NumPy analytics engine."""
+
+import os
+import sys
+from collections import defaultdict
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+np = pytest.importorskip("numpy")
+
+from analytics import OrderFrame, round_cents
+from order_processor import OrderProcessor
+from pricing_rules import CategoryDiscount
+from synthetic import Scale, generate_customers, generate_orders, generate_products
+
+
+@pytest.fixture
+def synthetic_processor_and_orders():
+    """A processor and orders from the seeded synthetic generator."""
+    scale = Scale.for_orders(5000)
+    processor = OrderProcessor(list(generate_customers(scale.customers, seed=7)),
+                               list(generate_products(scale.products, seed=7)))
+    orders = list(generate_orders(scale.orders, scale.customers, scale.products, seed=7))
+    return processor, orders
+
+
+class TestOrderTotals:
+    """Vectorized totals should match calculate_order_total exactly."""
+
+    def test_matches_on_synthetic_orders(self, synthetic_processor_and_orders):
+        """Every order total should equal the scalar path to the cent."""
+        processor, orders = synthetic_processor_and_orders
+        totals = OrderFrame.from_processor(processor, orders).order_totals()
+        assert totals.tolist() == [processor.calculate_order_total(o) for o in orders]
+
+    def test_matches_on_edge_cases(self, demo_processor, demo_orders):
+        """Unknown customers, unknown products and invalid orders should match too."""
+        totals = OrderFrame.from_processor(demo_processor, demo_orders).order_totals()
+        assert totals.tolist() == [demo_processor.calculate_order_total(o) for o in demo_orders]
+
+    def test_processor_with_pricing_rules_is_rejected(self, demo_customers, demo_products, demo_orders):
+        """Totals would not match a processor priced by rules, so building the frame should fail."""
+        processor = OrderProcessor(demo_customers, demo_products,
+                                   pricing_rules=[CategoryDiscount("electronics", 0.1)])
+        with pytest.raises(ValueError):
+            OrderFrame.from_processor(processor, demo_orders)
+
+    def test_round_cents_matches_round(self):
+        """round_cents should agree with round() including half-cent ties."""
+        values = np.array([0.125, 0.135, 2.675, 1.005, 9.5475, 10.0, 123456.785, 0.0])
+        assert round_cents(values).tolist() == [round(float(v), 2) for v in values]
+
+
+class TestGroupBy:
+    """Grouped revenue should match summing scalar totals."""
+
+    def test_revenue_by_customer_and_day(self, synthetic_processor_and_orders):
+        """Per-customer and per-day sums should match summed scalar totals."""
+        processor, orders = synthetic_processor_and_orders
+        by_customer, by_day = defaultdict(float), defaultdict(float)
+        for order in orders:
+            if order.status in ("shipped", "delivered"):
+                total = processor.calculate_order_total(order)
+                by_customer[order.customer_id] += total
+                by_day[order.order_date[:10]] += total
+
+        frame = OrderFrame.from_processor(processor, orders)
+        customers = frame.revenue_by_customer(statuses=["shipped", "delivered"])
+        days = frame.revenue_by_day(statuses=["shipped", "delivered"])
+        assert customers.keys() == by_customer.keys()
+        assert days.keys() == by_day.keys()
+        for key, value in by_customer.items():
+            assert customers[key] == pytest.approx(value, abs=0.005)
+        for key, value in by_day.items():
+            assert days[key] == pytest.approx(value, abs=0.005)
+
+    def test_revenue_by_category(self, demo_processor, demo_orders):
+        """Per-category sums should match discounted line revenue."""
+        expected = defaultdict(float)
+        for order in demo_orders:
+            if not order.is_valid():
+                continue
+            customer = demo_processor.get_customer(order.customer_id)
+            rate = customer.get_discount_rate() if customer else 0.0
+            for item in order.items:
+                product = demo_processor.get_product(item.product_id)
+                if product:
+                    expected[product.category] += product.price * item.quantity * (1 - rate)
+
+        actual = OrderFrame.from_processor(demo_processor, demo_orders).revenue_by_category()
+        assert actual.keys() == expected.keys()
+        for category, value in expected.items():
+            assert actual[category] == pytest.approx(value, abs=0.005)
@@ -0,0 +1,111 @@
+"""Tests for the asyncio order processor."""
+
+import asyncio
+import copy
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from async_processor import AsyncOrderProcessor, InMemoryCustomerRepository, InMemoryProductRepository
+from models import Customer, Order, OrderItem, Product
+from order_processor import OrderProcessor
+
+
+def _async_processor(customers, products):
+    return AsyncOrderProcessor(InMemoryCustomerRepository(customers), InMemoryProductRepository(products))
+
+
+class SlowProductRepository(InMemoryProductRepository):
+    """Product repository that records how many lookups overlap."""
+
+    def __init__(self, products):
+        super().__init__(products)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get(self, product_id):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return await super().get(product_id)
+
+
+class TestAsyncOrderProcessor:
+    """Test the async validate/total/process API."""
+
+    def test_matches_sync_processor(self, demo_customers, demo_products, demo_orders):
+        """validate_order and calculate_order_total should agree with OrderProcessor."""
+        sync = OrderProcessor(demo_customers, demo_products)
+        processor = _async_processor(demo_customers, demo_products)
+
+        async def run():
+            for order in demo_orders:
+                assert await processor.validate_order(order) == sync.validate_order(order)
+                assert await processor.calculate_order_total(order) == sync.calculate_order_total(order)
+
+        asyncio.run(run())
+
+    def test_process_orders_matches_serial(self, demo_customers, demo_products, demo_orders):
+        """Batch results and final stock should match serial sync processing."""
+        sync = OrderProcessor(copy.deepcopy(demo_customers), copy.deepcopy(demo_products))
+        expected = sync.process_orders(demo_orders)
+        processor = _async_processor(demo_customers, demo_products)
+
+        results = asyncio.run(processor.process_orders(demo_orders, concurrency=1))
+        assert results == expected
+        for product in demo_products:
+            assert product.stock_quantity == sync.get_product(product.id).stock_quantity
+
+    def test_item_lookups_run_concurrently(self, demo_customers, demo_products):
+        """All product lookups for one order should be in flight together."""
+        repo = SlowProductRepository(demo_products)
+        processor = AsyncOrderProcessor(InMemoryCustomerRepository(demo_customers), repo)
+        order = Order("o1", "c1", [OrderItem("p1", 1), OrderItem("p2", 1), OrderItem("p4", 1)],
+                      "pending", "2024-05-01")
+        assert asyncio.run(processor.validate_order(order)) == (True, [])
+        assert repo.max_in_flight == 3
+
+    def test_concurrent_batch_never_oversells(self):
+        """Interleaved orders should not sell more than the available stock."""
+        customers = [Customer("c1", "Ada Lovelace", "ada@example.com", "silver", "2024-01-02")]
+        product = Product("p1", "Widget", 3.0, "misc", True, 10)
+        repo = SlowProductRepository([product])
+        processor = AsyncOrderProcessor(InMemoryCustomerRepository(customers), repo)
+        orders = [Order(f"o{n}", "c1", [OrderItem("p1", 1)], "pending", "2024-05-01") for n in range(25)]
+
+        results = asyncio.run(processor.process_orders(orders, concurrency=8))
+        assert sum(r.success for r in results) == 10
+        assert product.stock_quantity == 0
+        assert repo.max_in_flight == 8
+
+    def test_batch_runs_a_fixed_number_of_tasks(self, demo_customers, demo_products, demo_orders):
+        """A large batch should not create a task per order."""
+        processor = _async_processor(demo_customers, demo_products)
+        orders = [Order(f"o{n}", "c1", [OrderItem("p2", 1)], "pending", "2024-05-01") for n in range(2000)]
+        peak_tasks = 0
+
+        async def run():
+            nonlocal peak_tasks
+            original = processor._process
+
+            async def counting(order):
+                nonlocal peak_tasks
+                peak_tasks = max(peak_tasks, len(asyncio.all_tasks()))
+                return await original(order)
+
+            processor._process = counting
+            return await processor.process_orders(orders, concurrency=4)
+
+        results = asyncio.run(run())
+        assert [r.order_id for r in results] == [o.id for o in orders]
+        # The main task plus, per worker, itself and its customer and product lookups
+        assert peak_tasks <= 1 + 4 * 3
+
+    def test_process_order_message(self, demo_customers, demo_products, demo_orders):
+        """process_order should format messages like the sync processor."""
+        processor = _async_processor(demo_customers, demo_products)
+        success, message = asyncio.run(processor.process_order(demo_orders[0]))
+        assert success
+        assert message == "Order processed successfully. Total: $121.23"
@@ -0,0 +1,61 @@
+"""Tests for batch order processing."""
+
+import copy
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from order_processor import OrderProcessor, OrderResult
+
+
+def _serial_results(customers, products, orders):
+    processor = OrderProcessor(copy.deepcopy(customers), copy.deepcopy(products))
+    return processor, [processor.process_order(o) for o in orders]
+
+
+class TestProcessOrders:
+    """Test OrderProcessor.process_orders."""
+
+    def test_returns_one_result_per_order(self, demo_processor, demo_orders):
+        """Results should line up with the input orders."""
+        results = demo_processor.process_orders(demo_orders)
+        assert [r.order_id for r in results] == [o.id for o in demo_orders]
+        assert all(isinstance(r, OrderResult) for r in results)
+
+    def test_matches_serial_processing(self, demo_customers, demo_products, demo_orders):
+        """Batch and serial processing should agree on outcome, total and stock."""
+        serial, expected = _serial_results(demo_customers, demo_products, demo_orders)
+        batch = OrderProcessor(demo_customers, demo_products)
+        results = batch.process_orders(demo_orders)
+
+        for result, (success, message) in zip(results, expected):
+            assert result.success == success
+            if success:
+                assert message == f"Order processed successfully. Total: ${result.total:.2f}"
+            else:
+                assert message == f"Order validation failed: {'; '.join(result.errors)}"
+
+        for product_id, product in serial.products.items():
+            assert batch.get_product(product_id).stock_quantity == product.stock_quantity
+            assert batch.get_product(product_id).in_stock == product.in_stock
+
+    def test_later_orders_see_earlier_stock_changes(self, demo_processor, demo_orders):
+        """Stock consumed by one order should not be available to the next."""
+        o2, o3 = demo_orders[1], demo_orders[2]
+        first, second = demo_processor.process_orders([o2, o3])
+        assert first.success
+        assert not second.success
+        assert "insufficient stock" in second.errors[0]
+
+    def test_rejections_report_every_error(self, demo_processor, demo_orders):
+        """A rejected order should carry all of its validation errors."""
+        result = demo_processor.process_orders([demo_orders[4]])[0]
+        assert not result.success
+        assert result.total == 0.0
+        assert len(result.errors) == 2
+
+    def test_invalid_structure_is_rejected(self, demo_processor, demo_orders):
+        """Structurally invalid orders should be rejected without stock changes."""
+        result = demo_processor.process_orders([demo_orders[5]])[0]
+        assert result.errors == ["Order has invalid structure"]
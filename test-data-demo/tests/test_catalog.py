@@ -0,0 +1,90 @@
+"""Tests for the columnar ProductCatalog."""
+
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from catalog import ProductCatalog, ProductRecord
+from models import Product
+from order_processor import OrderProcessor
+
+
+class TestProductCatalog:
+    """Test catalog storage and lookups."""
+
+    def test_records_match_source_products(self, demo_products):
+        """Every record should compare equal to the product it was built from."""
+        catalog = ProductCatalog(demo_products)
+        assert len(catalog) == len(demo_products)
+        for product in demo_products:
+            assert catalog[product.id] == product
+            assert catalog.get(product.id).to_product() == product
+
+    def test_missing_product(self, demo_products):
+        """Unknown IDs should behave like a dict miss."""
+        catalog = ProductCatalog(demo_products)
+        assert catalog.get("nope") is None
+        assert "nope" not in catalog
+
+    def test_rows_are_dense(self, demo_products):
+        """Row ids should be assigned in insertion order starting at zero."""
+        catalog = ProductCatalog(demo_products)
+        assert [catalog.row_of(p.id) for p in demo_products] == list(range(len(demo_products)))
+
+    def test_writes_go_to_columns(self, demo_products):
+        """Stock changes through one record should be seen by later lookups."""
+        catalog = ProductCatalog(demo_products)
+        catalog["p2"].stock_quantity = 0
+        catalog["p2"].in_stock = False
+        assert catalog.get("p2").stock_quantity == 0
+        assert catalog.get("p2").in_stock is False
+        assert not catalog["p2"].is_available(1)
+
+    def test_smaller_than_product_dict(self):
+        """The catalog should use less memory than a dict of Products."""
+        products = [Product(f"sku-{n}", f"Product {n}", n / 100 + 1, "misc", True, n)
+                    for n in range(5000)]
+
+        tracemalloc.start()
+        as_dict = {p.id: Product(p.id, p.name, p.price + 0.5, p.category, p.in_stock, p.stock_quantity + 1000)
+                   for p in products}
+        dict_size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        tracemalloc.start()
+        catalog = ProductCatalog(products)
+        catalog_size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert len(as_dict) == len(catalog)
+        assert catalog_size < dict_size
+
+    def test_more_categories_than_fit_in_16_bits(self):
+        """Category codes should not overflow past 65,535 distinct categories."""
+        products = [Product(f"p{n}", f"Product {n}", 1.0, f"cat-{n}", True, 1) for n in range(70_000)]
+        catalog = ProductCatalog(products)
+        assert catalog["p69999"].category == "cat-69999"
+        assert catalog["p0"].category == "cat-0"
+
+
+class TestProcessorWithCatalog:
+    """Test OrderProcessor running on a ProductCatalog."""
+
+    def test_get_product_returns_product_view(self, demo_customers, demo_products):
+        """get_product should expose the same data as with a product list."""
+        processor = OrderProcessor(demo_customers, ProductCatalog(demo_products))
+        product = processor.get_product("p1")
+        assert isinstance(product, ProductRecord)
+        assert product == demo_products[0]
+        assert processor.get_product("nope") is None
+
+    def test_processing_matches_product_list(self, demo_customers, demo_products, demo_orders):
+        """Processing on a catalog should give the same results and stock as on a list."""
+        catalog = ProductCatalog(demo_products)
+        expected = OrderProcessor(demo_customers, demo_products).process_orders(demo_orders)
+        actual = OrderProcessor(demo_customers, catalog).process_orders(demo_orders)
+        assert actual == expected
+        for product in demo_products:
+            assert catalog[product.id] == product
@@ -0,0 +1,99 @@
+"""Tests for concurrent stock reservation in OrderProcessor."""
+
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from catalog import ProductCatalog
+from models import Customer, Order, OrderItem, Product
+from order_processor import OrderProcessor
+
+
+CUSTOMERS = [Customer("c1", "Ada Lovelace", "ada@example.com", "gold", "2024-01-02")]
+
+
+def _run_threads(target, count):
+    threads = [threading.Thread(target=target, args=(n,)) for n in range(count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+
+class TestConcurrentReservation:
+    """Test that concurrent mode never oversells stock."""
+
+    def test_contended_product_is_never_oversold(self):
+        """Many threads buying the same product should sell exactly the stock."""
+        product = Product("p1", "Widget", 2.5, "misc", True, 500)
+        processor = OrderProcessor(CUSTOMERS, [product], concurrent=True)
+        sold = []
+
+        def worker(n):
+            for i in range(100):
+                order = Order(f"o{n}-{i}", "c1", [OrderItem("p1", 1)], "pending", "2024-05-01")
+                if processor.process_order(order)[0]:
+                    sold.append(1)
+
+        _run_threads(worker, 8)
+        assert len(sold) == 500
+        assert product.stock_quantity == 0
+        assert product.in_stock is False
+
+    def test_order_is_all_or_nothing(self):
+        """An order that cannot be fully reserved should leave stock untouched."""
+        products = [Product("p1", "Widget", 2.5, "misc", True, 5),
+                    Product("p2", "Gadget", 4.0, "misc", True, 1)]
+        processor = OrderProcessor(CUSTOMERS, products, concurrent=True)
+        errors = processor._reserve_stock([(products[0], 2), (products[1], 2)])
+        assert len(errors) == 1
+        assert products[0].stock_quantity == 5
+        assert products[1].stock_quantity == 1
+
+    def test_duplicate_lines_are_combined(self):
+        """Repeated lines for one product should be checked against their total."""
+        product = Product("p1", "Widget", 2.5, "misc", True, 3)
+        processor = OrderProcessor(CUSTOMERS, [product], concurrent=True)
+        order = Order("o1", "c1", [OrderItem("p1", 2), OrderItem("p1", 2)], "pending", "2024-05-01")
+        success, message = processor.process_order(order)
+        assert not success
+        assert "insufficient stock" in message
+        assert product.stock_quantity == 3
+
+    def test_update_product_takes_the_stock_lock(self):
+        """Stock edits should wait for a reservation holding the product's stripe."""
+        product = Product("p1", "Widget", 2.5, "misc", True, 5)
+        processor = OrderProcessor(CUSTOMERS, [product], concurrent=True)
+        lock = processor._stock_lock("p1")
+        with lock:
+            editor = threading.Thread(target=processor.update_product, args=("p1",),
+                                      kwargs={"stock_quantity": 20})
+            editor.start()
+            editor.join(0.1)
+            assert editor.is_alive()
+            assert product.stock_quantity == 5
+        editor.join()
+        assert product.stock_quantity == 20
+
+    def test_batch_mode_with_catalog(self):
+        """process_orders from several threads should respect stock on a catalog."""
+        catalog = ProductCatalog(
+            Product(f"p{n}", f"Item {n}", 1.0 + n, "misc", True, 50) for n in range(4)
+        )
+        processor = OrderProcessor(CUSTOMERS, catalog, concurrent=True)
+        successes = []
+
+        def worker(n):
+            orders = [
+                Order(f"o{n}-{i}", "c1", [OrderItem(f"p{i % 4}", 1), OrderItem(f"p{(i + 1) % 4}", 2)],
+                      "pending", "2024-05-01")
+                for i in range(60)
+            ]
+            successes.extend(r for r in processor.process_orders(orders) if r.success)
+
+        _run_threads(worker, 6)
+        for product_id in catalog:
+            assert catalog[product_id].stock_quantity >= 0
+        assert len(successes) * 3 == 200 - sum(catalog[p].stock_quantity for p in catalog)
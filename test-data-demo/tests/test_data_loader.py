@@ -0,0 +1,190 @@
+"""Tests for the streaming data loaders."""
+
+import json
+import os
+import sys
+import tracemalloc
+from dataclasses import asdict
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import data_loader
+from data_loader import LoadReject, iter_customers, iter_orders, iter_products, load_all, load_orders
+
+
+def _order_dicts(count):
+    return [
+        {
+            "id": f"o{n}",
+            "customer_id": f"c{n % 7}",
+            "items": [{"product_id": f"p{n % 11}", "quantity": n % 5 + 1}],
+            "status": "pending",
+            "order_date": "2024-05-01",
+        }
+        for n in range(count)
+    ]
+
+
+def _write_array(path, records):
+    path.write_text(json.dumps(records, indent=2))
+    return str(path)
+
+
+def _write_lines(path, records):
+    path.write_text("".join(json.dumps(r) + "\n" for r in records))
+    return str(path)
+
+
+class TestIterRecords:
+    """Test format detection and incremental parsing."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 16])
+    def test_array_matches_json_load(self, tmp_path, monkeypatch, chunk_size):
+        """Array parsing should be correct for any chunk boundary."""
+        monkeypatch.setattr(data_loader, "READ_CHUNK_SIZE", chunk_size)
+        records = _order_dicts(25)
+        path = _write_array(tmp_path / "orders.json", records)
+        assert list(data_loader.iter_records(path)) == records
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+    def test_json_lines_matches_input(self, tmp_path, monkeypatch, chunk_size):
+        """JSON Lines parsing should skip blank lines and handle a missing final newline."""
+        monkeypatch.setattr(data_loader, "READ_CHUNK_SIZE", chunk_size)
+        records = _order_dicts(10)
+        path = tmp_path / "orders.jsonl"
+        path.write_text("\n".join(json.dumps(r) for r in records[:5]) + "\n\n" +
+                        "\n".join(json.dumps(r) for r in records[5:]))
+        assert list(data_loader.iter_records(str(path))) == records
+
+    @pytest.mark.parametrize("writer", [_write_array, _write_lines])
+    def test_leading_whitespace_longer_than_chunk(self, tmp_path, monkeypatch, writer):
+        """Format detection should look past chunks that are only whitespace."""
+        monkeypatch.setattr(data_loader, "READ_CHUNK_SIZE", 4)
+        records = _order_dicts(5)
+        path = writer(tmp_path / "orders.json", records)
+        with open(path) as f:
+            content = f.read()
+        with open(path, "w") as f:
+            f.write(" \n\t\n" * 10 + content)
+        assert list(data_loader.iter_records(path)) == records
+
+    @pytest.mark.parametrize("text", ['[{"id": 1} {"id": 2}]', "[1,,,2]", "[,1]", "[1,]", "[1 2]", "[1,\n ,2]"])
+    @pytest.mark.parametrize("chunk_size", [1, 1 << 16])
+    def test_missing_or_extra_commas_raise(self, tmp_path, monkeypatch, text, chunk_size):
+        """Elements must be separated by exactly one comma."""
+        monkeypatch.setattr(data_loader, "READ_CHUNK_SIZE", chunk_size)
+        path = tmp_path / "broken.json"
+        path.write_text(text)
+        with pytest.raises(ValueError):
+            list(data_loader.iter_records(str(path)))
+
+    def test_empty_array(self, tmp_path):
+        """An empty array should yield nothing."""
+        path = tmp_path / "empty.json"
+        path.write_text("  [ ]  ")
+        assert list(data_loader.iter_records(str(path))) == []
+
+    def test_truncated_array_raises(self, tmp_path):
+        """A truncated array should raise instead of silently stopping."""
+        path = tmp_path / "broken.json"
+        path.write_text(json.dumps(_order_dicts(3))[:-20])
+        with pytest.raises(ValueError):
+            list(data_loader.iter_records(str(path)))
+
+
+class TestIterModels:
+    """Test the model-level generators."""
+
+    def test_iter_orders_matches_load_orders(self, tmp_path):
+        """iter_orders should build the same orders as load_orders."""
+        path = _write_array(tmp_path / "orders.json", _order_dicts(20))
+        assert list(iter_orders(path)) == load_orders(path)
+
+    def test_iter_customers_and_products(self, tmp_path, demo_customers, demo_products):
+        """Customers and products should round-trip through JSON Lines."""
+        customers = _write_lines(tmp_path / "customers.jsonl", [asdict(c) for c in demo_customers])
+        products = _write_lines(tmp_path / "products.jsonl", [asdict(p) for p in demo_products])
+        assert list(iter_customers(customers)) == demo_customers
+        assert list(iter_products(products)) == demo_products
+
+    def test_memory_stays_flat(self, tmp_path):
+        """Streaming should not hold the whole file in memory."""
+        path = _write_lines(tmp_path / "orders.jsonl", _order_dicts(20000))
+        file_size = os.path.getsize(path)
+
+        tracemalloc.start()
+        count = sum(1 for _ in iter_orders(path))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert count == 20000
+        assert peak < file_size / 4
+
+
+class TestLoadAll:
+    """Test concurrent loading with load-time validation."""
+
+    def _paths(self, tmp_path, customers, products, orders):
+        return (_write_array(tmp_path / "customers.json", customers),
+                _write_array(tmp_path / "products.json", products),
+                _write_lines(tmp_path / "orders.jsonl", orders))
+
+    def test_clean_data_loads_everything(self, tmp_path, demo_customers, demo_products, demo_orders):
+        """Valid records of all three kinds should come back unchanged."""
+        paths = self._paths(tmp_path, [asdict(c) for c in demo_customers],
+                            [asdict(p) for p in demo_products], [asdict(o) for o in demo_orders[:5]])
+        result = load_all(*paths)
+        assert result.ok
+        assert (result.customers, result.products, result.orders) == \
+            (demo_customers, demo_products, demo_orders[:5])
+
+    def test_rejects_report_file_index_and_reason(self, tmp_path, demo_customers, demo_products, demo_orders):
+        """Invalid and incomplete records should be left out and reported."""
+        customers = [asdict(c) for c in demo_customers]
+        customers[1]["email"] = "not-an-email"
+        products = [asdict(p) for p in demo_products]
+        del products[2]["price"]
+        orders = [asdict(o) for o in demo_orders]
+        paths = self._paths(tmp_path, customers, products, orders)
+
+        result = load_all(*paths)
+        assert [c.id for c in result.customers] == ["c1", "c3", "c4"]
+        assert [p.id for p in result.products] == ["p1", "p2", "p4", "p5"]
+        assert [o.id for o in result.orders] == ["o1", "o2", "o3", "o4", "o5", "o7"]
+        assert result.rejects == [
+            LoadReject(paths[0], 1, "c2", ["invalid email 'not-an-email'"]),
+            LoadReject(paths[1], 2, "p3", ["missing field 'price'"]),
+            LoadReject(paths[2], 5, "o6", ["no items"]),
+        ]
+
+    def test_wrong_typed_fields_are_rejected(self, tmp_path, demo_customers, demo_products, demo_orders):
+        """Null or mistyped fields should be reported instead of failing the load."""
+        customers = [asdict(c) for c in demo_customers]
+        customers[0]["email"] = None
+        products = [asdict(p) for p in demo_products]
+        products[0]["price"] = None
+        products[3]["stock_quantity"] = "7"
+        orders = [asdict(o) for o in demo_orders[:3]]
+        orders[1]["items"][0]["quantity"] = "2"
+        paths = self._paths(tmp_path, customers, products, orders)
+
+        result = load_all(*paths)
+        assert [c.id for c in result.customers] == ["c2", "c3", "c4"]
+        assert [p.id for p in result.products] == ["p2", "p3", "p5"]
+        assert [o.id for o in result.orders] == ["o1", "o3"]
+        assert result.rejects == [
+            LoadReject(paths[0], 0, "c1", ["wrong type for field 'email'"]),
+            LoadReject(paths[1], 0, "p1", ["wrong type for field 'price'"]),
+            LoadReject(paths[1], 3, "p4", ["wrong type for field 'stock_quantity'"]),
+            LoadReject(paths[2], 1, "o2", ["wrong type for field 'quantity'"]),
+        ]
+
+    def test_malformed_file_raises(self, tmp_path, demo_customers, demo_products):
+        """A file that is not valid JSON should fail the load."""
+        paths = self._paths(tmp_path, [asdict(c) for c in demo_customers],
+                            [asdict(p) for p in demo_products], [])
+        (tmp_path / "orders.jsonl").write_text('{"id": "o1"\n')
+        with pytest.raises(ValueError):
+            load_all(*paths)
@@ -0,0 +1,115 @@
+"""Tests for OrderProcessor instrumentation."""
+
+import copy
+import json
+import logging
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from instrumentation import InMemorySink, Instrumentation, LatencyHistogram, LoggingSink, STAGES
+from order_processor import OrderProcessor
+
+
+class FakeClock:
+    """Clock that advances one microsecond per reading."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        self.now += 1e-6
+        return self.now
+
+
+class TestInstrumentedProcessing:
+    """Test that instrumentation records without changing results."""
+
+    def test_results_unchanged(self, demo_customers, demo_products, demo_orders):
+        """Instrumented processing should give the same results as plain processing."""
+        plain = OrderProcessor(copy.deepcopy(demo_customers), copy.deepcopy(demo_products))
+        expected = [plain.process_order(o) for o in demo_orders]
+        instrumented = OrderProcessor(demo_customers, demo_products, instrumentation=Instrumentation())
+        assert [instrumented.process_order(o) for o in demo_orders] == expected
+
+    def test_batch_results_unchanged(self, demo_customers, demo_products, demo_orders):
+        """process_orders should also be unaffected by instrumentation."""
+        plain = OrderProcessor(copy.deepcopy(demo_customers), copy.deepcopy(demo_products))
+        instrumented = OrderProcessor(demo_customers, demo_products, instrumentation=Instrumentation())
+        assert instrumented.process_orders(demo_orders) == plain.process_orders(demo_orders)
+
+    def test_counters_by_error_kind(self, demo_customers, demo_products, demo_orders):
+        """Accepted and rejected orders should be counted, with rejections by kind."""
+        instrumentation = Instrumentation()
+        processor = OrderProcessor(demo_customers, demo_products, instrumentation=instrumentation)
+        processor.process_orders(demo_orders)
+
+        snapshot = instrumentation.snapshot()
+        assert snapshot["orders_processed"] == 3
+        assert snapshot["orders_rejected"] == 4
+        assert snapshot["rejections_by_kind"] == {
+            "insufficient_stock": 2,
+            "customer_not_found": 1,
+            "product_not_found": 1,
+            "invalid_structure": 1,
+        }
+        assert snapshot["order_latency"]["count"] == len(demo_orders)
+
+    def test_stage_timers(self, demo_customers, demo_products, demo_orders):
+        """Every stage of an accepted order should be timed."""
+        instrumentation = Instrumentation(clock=FakeClock())
+        processor = OrderProcessor(demo_customers, demo_products, instrumentation=instrumentation)
+        processor.process_order(demo_orders[0])
+
+        stages = instrumentation.snapshot()["stage_latency"]
+        assert set(stages) == set(STAGES)
+        assert all(stages[stage]["count"] == 1 for stage in STAGES)
+        assert instrumentation.orders.total > 0
+
+    def test_concurrent_mode_is_instrumented(self, demo_customers, demo_products, demo_orders):
+        """Reservation failures in concurrent mode should count as insufficient stock."""
+        instrumentation = Instrumentation()
+        processor = OrderProcessor(demo_customers, demo_products, concurrent=True,
+                                   instrumentation=instrumentation)
+        processor.process_orders(demo_orders[1:3])
+        assert instrumentation.snapshot()["rejections_by_kind"] == {"insufficient_stock": 1}
+
+
+class TestSinksAndHistograms:
+    """Test the snapshot sinks and histogram summaries."""
+
+    def test_flush_sends_snapshot_to_sink(self, demo_processor, demo_orders):
+        """flush should hand the current snapshot to the sink."""
+        sink = InMemorySink()
+        instrumentation = Instrumentation(sink=sink)
+        demo_processor.instrumentation = instrumentation
+        demo_processor.process_order(demo_orders[0])
+        assert instrumentation.flush() == sink.snapshots[0]
+        assert sink.snapshots[0]["orders_processed"] == 1
+
+    def test_logging_sink_writes_json(self, caplog):
+        """LoggingSink should log each snapshot as JSON."""
+        with caplog.at_level(logging.INFO):
+            LoggingSink().emit({"orders_processed": 2})
+        assert json.loads(caplog.records[0].getMessage()) == {"orders_processed": 2}
+
+    def test_histogram_quantiles(self):
+        """Quantiles should report the upper bound of the matching bucket."""
+        histogram = LatencyHistogram()
+        for _ in range(99):
+            histogram.record(3e-6)
+        histogram.record(0.5)
+        snapshot = histogram.snapshot()
+        assert snapshot["count"] == 100
+        assert snapshot["p50_seconds"] == 4e-6
+        assert snapshot["p99_seconds"] == 4e-6
+        assert snapshot["max_seconds"] == 0.5
+        assert snapshot["buckets"] == {"le_4us": 99, "le_524288us": 1}
+
+    def test_reset(self):
+        """reset should clear all counters."""
+        instrumentation = Instrumentation()
+        instrumentation.record_order({"lookup": 1e-6}, 1e-6, ["customer_not_found"])
+        instrumentation.reset()
+        assert instrumentation.snapshot()["orders_rejected"] == 0
@@ -0,0 +1,77 @@
+"""Tests for the offset-indexed lazy order store."""
+
+import json
+import os
+import sys
+from dataclasses import asdict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import lazy_store
+from lazy_store import LazyOrderStore
+
+
+def _write_lines(path, orders):
+    path.write_text("".join(json.dumps(asdict(o)) + "\n" for o in orders))
+    return str(path)
+
+
+class TestLazyOrderStore:
+    """Test lookups, caching and index maintenance."""
+
+    def test_lookup_decodes_matching_order(self, tmp_path, demo_orders):
+        """Every order should be retrievable by id and equal the original."""
+        source = _write_lines(tmp_path / "orders.jsonl", demo_orders)
+        with LazyOrderStore(source) as store:
+            assert len(store) == len(demo_orders)
+            for order in demo_orders:
+                assert store[order.id] == order
+            assert store.get("missing") is None
+            assert "missing" not in store
+        assert os.path.exists(source + ".idx")
+
+    def test_repeat_lookup_hits_cache(self, tmp_path, demo_orders):
+        """A second lookup should return the cached object."""
+        source = _write_lines(tmp_path / "orders.jsonl", demo_orders)
+        with LazyOrderStore(source, cache_size=2) as store:
+            first = store.get("o1")
+            assert store.get("o1") is first
+            assert store.cache_info().hits == 1
+
+    def test_index_is_reused_until_source_changes(self, tmp_path, demo_orders):
+        """The index should be built once and rebuilt after an edit."""
+        source = _write_lines(tmp_path / "orders.jsonl", demo_orders)
+        LazyOrderStore(source).close()
+        built = os.stat(source + ".idx").st_mtime_ns
+
+        with LazyOrderStore(source) as store:
+            assert os.stat(source + ".idx").st_mtime_ns == built
+            assert len(store) == len(demo_orders)
+
+        _write_lines(tmp_path / "orders.jsonl", demo_orders[:2])
+        stat = os.stat(source)
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        with LazyOrderStore(source) as store:
+            assert len(store) == 2
+            assert store.get("o7") is None
+
+    def test_hash_collisions_are_resolved_by_id(self, tmp_path, demo_orders, monkeypatch):
+        """Orders sharing a hash should still be told apart."""
+        monkeypatch.setattr(lazy_store, "key_hash", lambda order_id: 42)
+        source = _write_lines(tmp_path / "orders.jsonl", demo_orders)
+        with LazyOrderStore(source) as store:
+            assert store["o5"] == demo_orders[4]
+            assert store.get("o99") is None
+
+    def test_blank_lines_and_empty_file(self, tmp_path, demo_orders):
+        """Blank lines should be skipped and an empty file should be empty."""
+        source = tmp_path / "orders.jsonl"
+        source.write_text("\n" + json.dumps(asdict(demo_orders[0])) + "\n\n")
+        with LazyOrderStore(str(source)) as store:
+            assert store["o1"] == demo_orders[0]
+
+        empty = tmp_path / "empty.jsonl"
+        empty.write_text("")
+        with LazyOrderStore(str(empty)) as store:
+            assert len(store) == 0
+            assert store.get("o1") is None
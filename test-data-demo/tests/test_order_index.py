@@ -0,0 +1,131 @@
+"""Tests for the OrderIndex secondary indexes."""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import Order, OrderItem
+from order_index import OrderIndex
+
+
+class TestOrderIndexLookups:
+    """Test hash index lookups."""
+
+    def test_by_status_matches_linear_scan(self, demo_orders):
+        """Status lookups should return the same orders as a scan."""
+        index = OrderIndex(demo_orders)
+        for status in Order.VALID_STATUSES:
+            expected = [o.id for o in demo_orders if o.status == status]
+            assert [o.id for o in index.by_status(status)] == expected
+
+    def test_by_customer_matches_linear_scan(self, demo_orders, demo_customers):
+        """Customer lookups should return the same orders as a scan."""
+        index = OrderIndex(demo_orders)
+        for customer in demo_customers:
+            expected = [o.id for o in demo_orders if o.customer_id == customer.id]
+            assert [o.id for o in index.by_customer(customer.id)] == expected
+
+    def test_processor_uses_index(self, demo_processor, demo_orders):
+        """OrderProcessor filters should accept an OrderIndex."""
+        index = OrderIndex(demo_orders)
+        assert demo_processor.get_orders_by_status(index, "pending") == \
+            demo_processor.get_orders_by_status(demo_orders, "pending")
+        assert demo_processor.get_customer_orders(index, "c3") == \
+            demo_processor.get_customer_orders(demo_orders, "c3")
+
+
+class TestOrderIndexUpdates:
+    """Test that indexes stay correct as orders change."""
+
+    def test_update_status_moves_order(self, demo_orders):
+        """An order should move between status buckets when its status changes."""
+        index = OrderIndex(demo_orders)
+        index.update_status("o1", "shipped")
+        assert "o1" not in [o.id for o in index.by_status("pending")]
+        assert "o1" in [o.id for o in index.by_status("shipped")]
+        assert index.get("o1").status == "shipped"
+
+    def test_reindex_after_in_place_change(self, demo_orders):
+        """reindex should pick up fields changed directly on the order."""
+        index = OrderIndex(demo_orders)
+        order = index.get("o2")
+        order.status = "cancelled"
+        order.order_date = "2023-12-31"
+        index.reindex(order)
+        assert [o.id for o in index.by_status("cancelled")] == ["o2"]
+        assert index.between(end="2024-01-01")[0].id == "o2"
+
+    def test_remove_drops_order_everywhere(self, demo_orders):
+        """Removed orders should not be returned by any query."""
+        index = OrderIndex(demo_orders)
+        index.remove("o7")
+        assert "o7" not in index
+        assert index.by_status("shipped") == []
+        assert all(o.id != "o7" for o in index.between())
+
+    def test_re_adding_replaces_order(self, demo_orders):
+        """Adding an order with an existing ID should replace the old entry."""
+        index = OrderIndex(demo_orders)
+        index.add(Order("o1", "c2", [OrderItem("p1", 1)], "delivered", "2024-06-01"))
+        assert len(index) == len(demo_orders)
+        assert [o.id for o in index.by_customer("c1")] == []
+
+
+class TestOrderIndexDateRange:
+    """Test the sorted order_date index."""
+
+    def test_between_is_half_open(self, demo_orders):
+        """Range queries should include start and exclude end."""
+        index = OrderIndex(demo_orders)
+        assert [o.id for o in index.between("2024-05-02", "2024-05-05")] == ["o2", "o3", "o4"]
+
+    def test_between_accepts_coarse_bounds(self, demo_orders):
+        """Month-level bounds should match every date within the month."""
+        index = OrderIndex(demo_orders)
+        assert len(index.between("2024-05", "2024-06")) == len(demo_orders)
+        assert index.between("2024-06") == []
+
+
+class TestOrderIndexBulkBuild:
+    """Test building an index from many orders at once."""
+
+    @staticmethod
+    def _orders(count):
+        statuses = Order.VALID_STATUSES
+        return [
+            Order(f"o{n}", f"c{n % 1000}", [OrderItem("p1", 1)], statuses[n % len(statuses)],
+                  f"2024-{n % 12 + 1:02d}-{n % 28 + 1:02d}")
+            for n in range(count)
+        ]
+
+    def test_bulk_build_matches_incremental_adds(self):
+        """The constructor should index exactly what one add() per order would, repeated IDs included."""
+        orders = self._orders(3000)
+        orders += [Order("o5", "c9", [OrderItem("p2", 2)], "shipped", "2023-01-01"),
+                   Order("o7", "c7", [OrderItem("p2", 2)], "pending", "2025-01-01")]
+        built = OrderIndex(orders)
+        added = OrderIndex()
+        for order in orders:
+            added.add(order)
+
+        assert [o.id for o in built] == [o.id for o in added]
+        assert [o.id for o in built.between()] == [o.id for o in added.between()]
+        for status in Order.VALID_STATUSES:
+            assert [o.id for o in built.by_status(status)] == [o.id for o in added.by_status(status)]
+        assert [o.id for o in built.by_customer("c9")] == [o.id for o in added.by_customer("c9")]
+        assert built.get("o5").order_date == "2023-01-01"
+
+    def test_large_index_builds_in_one_sort(self):
+        """Building a 300k-order index should not insort order by order."""
+        orders = self._orders(300_000)
+        start = time.perf_counter()
+        index = OrderIndex(orders)
+        seconds = time.perf_counter() - start
+
+        assert len(index) == 300_000
+        dates = [o.order_date for o in index.between("2024-03", "2024-06")]
+        assert dates == sorted(dates) and len(dates) == 75_000
+        # One insort per order takes tens of seconds at this size
+        assert seconds < 10
@@ -0,0 +1,67 @@
+"""Tests for multi-process order validation."""
+
+import multiprocessing
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from catalog import ProductCatalog
+from models import Order
+from order_processor import OrderProcessor
+from parallel_validation import iter_validate_orders_parallel, validate_orders_parallel
+
+
+def _backlog(demo_orders, copies):
+    return [
+        Order(f"{o.id}-{n}", o.customer_id, list(o.items), o.status, o.order_date)
+        for n in range(copies) for o in demo_orders
+    ]
+
+
+class TestParallelValidation:
+    """Test validate_orders_parallel against serial validation."""
+
+    @pytest.mark.parametrize("start_method", ["fork", "spawn"])
+    def test_matches_serial_in_order(self, demo_processor, demo_orders, start_method):
+        """Results should equal serial validate_order, in input order."""
+        if start_method not in multiprocessing.get_all_start_methods():
+            pytest.skip(f"{start_method} not available")
+        orders = _backlog(demo_orders, 20)
+        expected = [demo_processor.validate_order(o) for o in orders]
+        actual = validate_orders_parallel(
+            demo_processor, orders, workers=2, chunk_size=9,
+            mp_context=multiprocessing.get_context(start_method),
+        )
+        assert actual == expected
+
+    def test_works_with_catalog_and_generators(self, demo_customers, demo_products, demo_orders):
+        """A ProductCatalog snapshot and a lazy order stream should both work."""
+        processor = OrderProcessor(demo_customers, ProductCatalog(demo_products))
+        orders = _backlog(demo_orders, 5)
+        expected = [processor.validate_order(o) for o in orders]
+        assert validate_orders_parallel(processor, iter(orders), workers=2, chunk_size=4) == expected
+
+    def test_stream_is_read_a_window_at_a_time(self, demo_processor, demo_orders):
+        """Only a few chunks per worker should be read ahead of the results."""
+        orders = _backlog(demo_orders, 30)
+        pulled = 0
+
+        def stream():
+            nonlocal pulled
+            for order in orders:
+                pulled += 1
+                yield order
+
+        results = iter_validate_orders_parallel(demo_processor, stream(), workers=2, chunk_size=5)
+        seen = 0
+        for seen, result in enumerate(results, 1):
+            # Four chunks in flight plus the one just refilled
+            assert pulled <= seen + 5 * 5
+        assert seen == len(orders)
+
+    def test_empty_backlog(self, demo_processor):
+        """No orders should give no results."""
+        assert validate_orders_parallel(demo_processor, [], workers=1) == []
@@ -0,0 +1,87 @@
+"""Tests for the integer-cents pricing engine."""
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from models import Order, OrderItem
+from order_processor import OrderProcessor
+from pricing import HALF_UP, PricingEngine, apply_discount, to_basis_points, to_cents
+from synthetic import Scale, generate_customers, generate_orders, generate_products
+
+
+class TestConversions:
+    """Test cents, basis points and the rounding rule."""
+
+    def test_to_cents_is_exact(self):
+        """Prices should convert to the cents they were written with."""
+        assert [to_cents(p) for p in (49.99, 19.95, 0.1, 4.25, 189.0)] == [4999, 1995, 10, 425, 18900]
+        assert to_cents(0.125) == 13
+
+    def test_to_basis_points(self):
+        """Discount rates should convert to whole basis points."""
+        assert [to_basis_points(r) for r in (0.0, 0.05, 0.10, 0.15)] == [0, 500, 1000, 1500]
+
+    def test_apply_discount_rounds_half_up(self):
+        """Half a cent should round up, anything less down."""
+        assert apply_discount(3990, 500) == 3791
+        assert apply_discount(3989, 500) == 3790
+        assert apply_discount(1000, 0) == 1000
+
+
+class TestPricingEngine:
+    """Test agreement with calculate_order_total and batch pricing."""
+
+    def test_matches_processor_on_fixtures(self, demo_processor, demo_orders):
+        """Every demo order should price exactly as the float path does."""
+        engine = PricingEngine.from_processor(demo_processor)
+        expected = [demo_processor.calculate_order_total(o) for o in demo_orders]
+        assert engine.price_orders(demo_orders) == expected
+        assert [engine.order_total(o) for o in demo_orders] == expected
+
+    def test_matches_processor_on_synthetic_batch(self):
+        """A large synthetic batch, ties included, should match to the cent."""
+        scale = Scale.for_orders(5000)
+        processor = OrderProcessor(list(generate_customers(scale.customers)),
+                                   list(generate_products(scale.products)))
+        orders = list(generate_orders(scale.orders, scale.customers, scale.products))
+        engine = PricingEngine.from_processor(processor)
+        assert engine.price_orders(orders) == [processor.calculate_order_total(o) for o in orders]
+
+    def test_half_up_rounding_rule(self, demo_processor, demo_orders):
+        """With HALF_UP, an exact half-cent total should round up."""
+        engine = PricingEngine.from_processor(demo_processor, rounding=HALF_UP)
+        # o3: 2 x 19.95 with a 5% discount is exactly 37.905
+        assert engine.order_total_cents(demo_orders[2]) == 3791
+        assert demo_processor.calculate_order_total(demo_orders[2]) == 37.9
+
+    def test_invalid_orders_cost_nothing(self, demo_processor):
+        """Orders failing Order.is_valid should price at 0, like the float path."""
+        engine = PricingEngine.from_processor(demo_processor)
+        orders = [
+            Order("x1", "c1", [OrderItem("p1", 0)], "pending", "2024-05-01"),
+            Order("x2", "c1", [OrderItem("p1", 1)], "lost", "2024-05-01"),
+            Order("x3", "", [OrderItem("p1", 1)], "pending", "2024-05-01"),
+        ]
+        assert engine.price_orders_cents(orders) == [0, 0, 0]
+
+    def test_follows_processor_updates(self, demo_processor, demo_orders):
+        """Price and membership changes through the processor should be picked up."""
+        engine = PricingEngine.from_processor(demo_processor)
+        demo_processor.update_product("p4", price=5.0)
+        demo_processor.update_customer("c1", "gold")
+        assert engine.order_total(demo_orders[0]) == demo_processor.calculate_order_total(demo_orders[0])
+
+        engine.close()
+        demo_processor.update_product("p4", price=6.0)
+        assert engine.price_cents["p4"] == 500
+
+    def test_unknown_rounding_rule(self, demo_products, demo_customers):
+        """An unknown rounding rule should be rejected."""
+        with pytest.raises(ValueError):
+            PricingEngine(demo_products, demo_customers, rounding="banker")
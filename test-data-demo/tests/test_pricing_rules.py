@@ -0,0 +1,114 @@
+"""Tests for the compiled pricing-rules engine."""
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from models import Order, OrderItem
+from order_processor import OrderProcessor
+from pricing_rules import CategoryDiscount, CompiledRules, Promotion, QuantityBreak, TierDiscount
+from synthetic import Scale, generate_customers, generate_orders, generate_products
+
+
+def _order(items, customer_id="c1", order_date="2024-05-01"):
+    return Order("x", customer_id, [OrderItem(pid, qty) for pid, qty in items], "pending", order_date)
+
+
+class TestCompiledRules:
+    """Test rule semantics and the compiled tables."""
+
+    def test_no_rules_prices_like_plain_path(self, demo_customers, demo_products, demo_orders):
+        """An empty rule set should reproduce calculate_order_total exactly."""
+        plain = OrderProcessor(demo_customers, demo_products)
+        rules = CompiledRules([], demo_products)
+        assert rules.price_orders(demo_orders, plain.customers, plain.products) == \
+            [plain.calculate_order_total(o) for o in demo_orders]
+
+    def test_no_rules_on_synthetic_batch(self):
+        """The plain and compiled paths should agree on a large batch too."""
+        scale = Scale.for_orders(3000)
+        customers = list(generate_customers(scale.customers))
+        products = list(generate_products(scale.products))
+        orders = list(generate_orders(scale.orders, scale.customers, scale.products))
+        plain = OrderProcessor(customers, products)
+        rules = CompiledRules([], products)
+        assert rules.price_orders(orders, plain.customers, plain.products) == plain.price_orders(orders)
+
+    def test_category_discount(self, demo_processor, demo_products):
+        """Lines in the category should be discounted before the membership discount."""
+        rules = CompiledRules([CategoryDiscount("stationery", 0.20)], demo_products)
+        # c2 (silver): (49.99 + 5 * 4.25 * 0.8) * 0.95
+        order = _order([("p1", 1), ("p4", 5)], customer_id="c2")
+        lines = [(demo_processor.get_product("p1"), 1), (demo_processor.get_product("p4"), 5)]
+        assert rules.total(order, demo_processor.get_customer("c2"), lines) == round((49.99 + 17.0) * 0.95, 2)
+
+    def test_best_line_rate_wins(self, demo_processor, demo_products):
+        """Overlapping rules should not stack; the best applicable rate is used."""
+        rules = CompiledRules([
+            CategoryDiscount("electronics", 0.05),
+            QuantityBreak(3, 0.10, category="electronics"),
+            QuantityBreak(10, 0.25, product_id="p1"),
+        ], demo_products)
+        thresholds, rates = rules.line_steps(demo_processor.get_product("p1"), "2024-05-01", None)
+        assert thresholds == (0, 1, 3, 10)
+        assert rates == (0.0, 0.05, 0.10, 0.25)
+        assert rules.line_steps(demo_processor.get_product("p4"), "2024-05-01", None) is None
+
+    def test_promotion_window(self, demo_processor, demo_products):
+        """Promotions should apply from start up to but not including end."""
+        rules = CompiledRules([Promotion(0.5, product_ids=("p4",), start="2024-05-10", end="2024-05-20")],
+                              demo_products)
+        p4 = demo_processor.get_product("p4")
+        rate = lambda date: (rules.line_steps(p4, date, None) or ((0,), (0.0,)))[1][-1]
+        assert [rate(d) for d in ("2024-05-09", "2024-05-10", "2024-05-19T23:59", "2024-05-20")] == \
+            [0.0, 0.5, 0.5, 0.0]
+
+    def test_tiers(self, demo_processor, demo_products):
+        """Tier-only rules and tier discount overrides should follow membership."""
+        rules = CompiledRules([
+            Promotion(0.10, categories=("home",), tiers=("gold",)),
+            TierDiscount("gold", 0.20),
+        ], demo_products)
+        p3 = demo_processor.get_product("p3")
+        assert rules.line_steps(p3, "2024-05-01", "gold") is not None
+        assert rules.line_steps(p3, "2024-05-01", "silver") is None
+        assert rules.line_steps(p3, "2024-05-01", None) is None
+        assert rules.tier_rate(demo_processor.get_customer("c3")) == 0.20
+        assert rules.tier_rate(demo_processor.get_customer("c2")) == 0.05
+        assert rules.tier_rate(None) == 0.0
+
+    def test_invalid_rules_rejected(self, demo_products):
+        """Rates outside [0, 1] and non-positive quantity breaks should be refused."""
+        with pytest.raises(ValueError):
+            CompiledRules([CategoryDiscount("home", 1.5)], demo_products)
+        with pytest.raises(ValueError):
+            CompiledRules([QuantityBreak(0, 0.1)], demo_products)
+
+
+class TestProcessorWithRules:
+    """Test OrderProcessor pricing through compiled rules."""
+
+    RULES = [CategoryDiscount("electronics", 0.10), QuantityBreak(5, 0.25, product_id="p4")]
+
+    def test_all_pricing_paths_agree(self, demo_customers, demo_products, demo_orders):
+        """calculate_order_total, price_orders and process_orders should give the same totals."""
+        processor = OrderProcessor(demo_customers, demo_products, pricing_rules=self.RULES)
+        expected = [processor.calculate_order_total(o) for o in demo_orders]
+        # o1: (2 * 49.99 * 0.9 + 5 * 4.25 * 0.75), bronze
+        assert expected[0] == round(2 * 49.99 * 0.9 + 5 * 4.25 * 0.75, 2)
+        assert processor.price_orders(demo_orders) == expected
+
+        results = processor.process_orders(demo_orders)
+        assert [r.total for r in results if r.success] == [t for t, r in zip(expected, results) if r.success]
+
+    def test_process_order_message_uses_rules(self, demo_customers, demo_products, demo_orders):
+        """Single-order processing should report the rule-priced total."""
+        processor = OrderProcessor(demo_customers, demo_products, pricing_rules=self.RULES)
+        expected = processor.calculate_order_total(demo_orders[1])
+        assert processor.process_order(demo_orders[1]) == \
+            (True, f"Order processed successfully. Total: ${expected:.2f}")
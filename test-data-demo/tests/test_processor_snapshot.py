@@ -0,0 +1,87 @@
+"""Tests for saving and restoring OrderProcessor state."""
+
+import os
+import struct
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from catalog import ProductCatalog
+from instrumentation import Instrumentation
+from order_processor import OrderProcessor, SNAPSHOT_MAGIC
+from pricing_rules import CategoryDiscount
+from stock_ledger import StockLedger
+
+
+@pytest.fixture
+def tracking_processor(demo_customers, demo_products):
+    """A processor that keeps a stock-level index."""
+    return OrderProcessor(demo_customers, demo_products, track_stock=True)
+
+
+class TestProcessorSnapshot:
+    """Test save_snapshot/load_snapshot round trips and format checks."""
+
+    def test_round_trip_preserves_state(self, tmp_path, tracking_processor, demo_orders):
+        """A restored processor should hold the same data and behave the same."""
+        tracking_processor.process_order(demo_orders[0])
+        path = str(tmp_path / "processor.snap")
+        tracking_processor.save_snapshot(path)
+
+        restored = OrderProcessor.load_snapshot(path, track_stock=True)
+        assert restored.customers == tracking_processor.customers
+        assert restored.products == tracking_processor.products
+        assert restored.stock_index.entries() == tracking_processor.stock_index.entries()
+        assert restored.get_low_stock_products(5) == tracking_processor.get_low_stock_products(5)
+        assert [restored.validate_order(o) for o in demo_orders] == \
+            [tracking_processor.validate_order(o) for o in demo_orders]
+
+    def test_restored_index_stays_live(self, tmp_path, tracking_processor, demo_orders):
+        """Stock taken after a restore should update the restored index."""
+        path = str(tmp_path / "processor.snap")
+        tracking_processor.save_snapshot(path)
+        restored = OrderProcessor.load_snapshot(path, track_stock=True)
+        restored.process_order(demo_orders[2])
+        assert restored.stock_index.level("p2") == 1
+        assert tracking_processor.stock_index.level("p2") == 3
+
+    def test_catalog_and_pricing_rules_round_trip(self, tmp_path, demo_customers, demo_products, demo_orders):
+        """A catalog-backed processor with rules should come back the same way."""
+        processor = OrderProcessor(demo_customers, ProductCatalog(demo_products),
+                                   pricing_rules=[CategoryDiscount("stationery", 0.5)])
+        path = str(tmp_path / "processor.snap")
+        processor.save_snapshot(path)
+
+        restored = OrderProcessor.load_snapshot(path)
+        assert isinstance(restored.products, ProductCatalog)
+        assert restored.price_orders(demo_orders) == processor.price_orders(demo_orders)
+
+    def test_constructor_options_and_ledger(self, tmp_path, tracking_processor, demo_orders):
+        """Options should reach the restored processor and ledger levels should win."""
+        path = str(tmp_path / "processor.snap")
+        tracking_processor.save_snapshot(path)
+        with StockLedger(str(tmp_path / "ledger"), fsync=False) as ledger:
+            ledger.record("p4", -40, 60)
+        ledger = StockLedger(str(tmp_path / "ledger"), fsync=False)
+
+        restored = OrderProcessor.load_snapshot(path, concurrent=True, ledger=ledger, track_stock=True,
+                                                instrumentation=Instrumentation())
+        assert restored.get_product("p4").stock_quantity == 60
+        assert restored.stock_index.level("p4") == 60
+        assert restored.process_order(demo_orders[0])[0]
+        assert restored.instrumentation.processed == 1
+        ledger.close()
+
+    def test_rejects_foreign_and_future_files(self, tmp_path, demo_processor):
+        """Files with the wrong magic or version should raise ValueError."""
+        foreign = tmp_path / "foreign.snap"
+        foreign.write_bytes(b"not a snapshot at all")
+        with pytest.raises(ValueError):
+            OrderProcessor.load_snapshot(str(foreign))
+
+        future = tmp_path / "future.snap"
+        future.write_bytes(struct.pack("<8sI", SNAPSHOT_MAGIC, 99))
+        with pytest.raises(ValueError, match="version 99"):
+            OrderProcessor.load_snapshot(str(future))
@@ -0,0 +1,133 @@
+"""Tests for processor change hooks and incremental revalidation."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from order_processor import CUSTOMER_CHANGED, OrderProcessor, PRODUCT_CHANGED, STOCK_CHANGED
+from revalidation import IncrementalRevalidator
+from stock_ledger import StockLedger
+
+
+class TestProcessorUpdates:
+    """Test OrderProcessor.update_product/update_customer and change listeners."""
+
+    def test_update_product_keeps_stock_index_and_ledger_in_step(self, tmp_path, demo_customers, demo_products):
+        """A stock change should reach the index and the ledger."""
+        ledger = StockLedger(str(tmp_path), fsync=False)
+        processor = OrderProcessor(demo_customers, demo_products, ledger=ledger, track_stock=True)
+        processor.update_product("p5", stock_quantity=4)
+        processor.update_product("p1", price=45.0)
+        ledger.commit()
+
+        assert processor.get_product("p5").in_stock
+        assert processor.stock_index.level("p5") == 4
+        assert processor.get_product("p1").price == 45.0
+        assert ledger.levels() == {"p5": 4}
+
+    def test_update_product_stock_to_zero_marks_out_of_stock(self, demo_processor):
+        """Without an explicit in_stock, availability should follow the stock."""
+        demo_processor.update_product("p2", stock_quantity=0)
+        assert not demo_processor.get_product("p2").in_stock
+        demo_processor.update_product("p2", stock_quantity=5, in_stock=False)
+        assert not demo_processor.get_product("p2").in_stock
+
+    def test_listeners_see_updates_and_sales(self, demo_processor, demo_orders):
+        """Listeners should hear about edits and stock taken by orders until unsubscribed."""
+        seen = []
+        unsubscribe = demo_processor.subscribe_changes(lambda kind, rid: seen.append((kind, rid)))
+        demo_processor.update_customer("c1", "gold")
+        demo_processor.process_order(demo_orders[0])
+        unsubscribe()
+        demo_processor.update_product("p1", price=1.0)
+        assert seen == [(CUSTOMER_CHANGED, "c1"), (STOCK_CHANGED, "p1"), (STOCK_CHANGED, "p4")]
+
+    def test_price_and_stock_edits_are_separate_events(self, demo_processor):
+        """A price edit should be PRODUCT_CHANGED and a stock edit STOCK_CHANGED."""
+        seen = []
+        demo_processor.subscribe_changes(lambda kind, rid: seen.append((kind, rid)))
+        demo_processor.update_product("p1", price=1.0)
+        demo_processor.update_product("p2", stock_quantity=7)
+        demo_processor.update_product("p3", price=2.0, in_stock=False)
+        assert seen == [(PRODUCT_CHANGED, "p1"), (STOCK_CHANGED, "p2"),
+                        (PRODUCT_CHANGED, "p3"), (STOCK_CHANGED, "p3")]
+
+
+class TestIncrementalRevalidator:
+    """Test dependency tracking and the changed-results feed."""
+
+    def test_tracks_only_open_orders(self, demo_processor, demo_orders):
+        """Only pending and confirmed orders should be tracked, with current results."""
+        revalidator = IncrementalRevalidator(demo_processor, demo_orders)
+        assert len(revalidator) == 6
+        assert revalidator.result("o7") is None
+        assert revalidator.result("o1").valid
+        assert revalidator.result("o1").total == demo_processor.calculate_order_total(demo_orders[0])
+        assert revalidator.orders_for_product("p2") == {"o2", "o3"}
+        assert revalidator.orders_for_customer("c3") == {"o5", "o6"}
+
+    def test_price_change_reprices_affected_orders_only(self, demo_processor, demo_orders):
+        """Changing a price should report exactly the orders that use the product."""
+        revalidator = IncrementalRevalidator(demo_processor, demo_orders)
+        demo_processor.update_product("p2", price=10.0)
+        changes = revalidator.refresh()
+
+        assert sorted(c.order_id for c in changes) == ["o2", "o3"]
+        o3 = next(c for c in changes if c.order_id == "o3")
+        assert (o3.previous.total, o3.current.total) == (37.9, 19.0)
+        assert revalidator.refresh() == []
+
+    def test_stock_change_flips_validity(self, demo_processor, demo_orders):
+        """Dropping stock below a request should invalidate the order and say why."""
+        revalidator = IncrementalRevalidator(demo_processor, demo_orders)
+        demo_processor.update_product("p2", stock_quantity=1)
+        changes = {c.order_id: c for c in revalidator.refresh()}
+
+        assert set(changes) == {"o2", "o3"}
+        assert changes["o2"].previous.valid and not changes["o2"].current.valid
+        assert "insufficient stock" in changes["o2"].current.errors[0]
+
+    def test_unchanged_results_are_not_reported(self, demo_processor, demo_orders):
+        """Orders revisited by a sale but with the same outcome should stay out of the feed."""
+        revalidator = IncrementalRevalidator(demo_processor, demo_orders[1:])
+        demo_processor.process_order(demo_orders[0])
+        assert revalidator.refresh() == []
+
+    def test_customer_change_reprices_their_orders(self, demo_processor, demo_orders):
+        """A membership change should reprice every open order of the customer."""
+        revalidator = IncrementalRevalidator(demo_processor, demo_orders)
+        demo_processor.update_customer("c2", "gold")
+        changes = revalidator.refresh()
+        assert [(c.order_id, c.current.total) for c in changes] == [("o3", 35.91)]
+
+    def test_refresh_only_evaluates_dirty_orders(self, demo_processor, demo_orders, monkeypatch):
+        """Work should scale with the change, not with the tracked backlog."""
+        revalidator = IncrementalRevalidator(demo_processor, demo_orders)
+        evaluated = []
+        original = demo_processor.validate_order
+        monkeypatch.setattr(demo_processor, "validate_order",
+                            lambda order: evaluated.append(order.id) or original(order))
+        demo_processor.update_product("p4", price=5.0)
+        revalidator.refresh()
+        assert evaluated == ["o1"]
+
+    def test_external_changes_can_be_marked(self, demo_processor, demo_orders):
+        """Edits made behind the processor's back should be picked up once marked."""
+        revalidator = IncrementalRevalidator(demo_processor, demo_orders)
+        demo_processor.get_product("p4").price = 1.0
+        assert revalidator.refresh() == []
+        revalidator.mark_product_changed("p4")
+        assert [c.order_id for c in revalidator.refresh()] == ["o1"]
+
+    def test_untracked_and_closed(self, demo_processor, demo_orders):
+        """Untracked orders and a closed revalidator should report nothing."""
+        revalidator = IncrementalRevalidator(demo_processor, demo_orders)
+        revalidator.untrack("o2")
+        demo_processor.update_product("p2", price=1.0)
+        assert [c.order_id for c in revalidator.refresh()] == ["o3"]
+        assert revalidator.orders_for_product("p2") == {"o3"}
+
+        revalidator.close()
+        demo_processor.update_product("p2", price=2.0)
+        assert revalidator.refresh() == []
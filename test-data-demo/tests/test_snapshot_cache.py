@@ -0,0 +1,74 @@
+"""Tests for the binary fixture snapshot cache."""
+
+import json
+import os
+import sys
+from dataclasses import asdict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_loader import load_customers, load_orders, load_products
+from snapshot_cache import SnapshotCache
+
+
+def _write(path, records):
+    path.write_text(json.dumps([asdict(r) for r in records]))
+    return str(path)
+
+
+class TestSnapshotCache:
+    """Test snapshot hits, invalidation and fallback."""
+
+    def test_second_load_comes_from_snapshot(self, tmp_path, demo_orders):
+        """A repeat load of an unchanged file should be a snapshot hit."""
+        source = _write(tmp_path / "orders.json", demo_orders)
+        cache = SnapshotCache(str(tmp_path / "cache"))
+
+        first = cache.load_orders(source)
+        second = cache.load_orders(source)
+        assert (cache.misses, cache.hits) == (1, 1)
+        assert first == second == load_orders(source)
+        assert os.path.exists(cache.snapshot_path(source, "orders"))
+
+    def test_all_record_kinds_round_trip(self, tmp_path, demo_customers, demo_products):
+        """Customers and products should decode to equal objects."""
+        customers = _write(tmp_path / "customers.json", demo_customers)
+        products = _write(tmp_path / "products.json", demo_products)
+        cache = SnapshotCache(str(tmp_path / "cache"))
+        for _ in range(2):
+            assert cache.load_customers(customers) == load_customers(customers)
+            assert cache.load_products(products) == load_products(products)
+        assert cache.hits == 2
+
+    def test_changed_source_is_reparsed(self, tmp_path, demo_orders):
+        """Editing the source should invalidate the snapshot."""
+        source = _write(tmp_path / "orders.json", demo_orders)
+        cache = SnapshotCache(str(tmp_path / "cache"))
+        cache.load_orders(source)
+
+        _write(tmp_path / "orders.json", demo_orders[:2])
+        stat = os.stat(source)
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert len(cache.load_orders(source)) == 2
+        assert cache.misses == 2
+
+    def test_corrupt_snapshot_falls_back_to_json(self, tmp_path, demo_orders):
+        """A damaged snapshot should be ignored and rewritten."""
+        source = _write(tmp_path / "orders.json", demo_orders)
+        cache = SnapshotCache(str(tmp_path / "cache"))
+        cache.load_orders(source)
+
+        snapshot = cache.snapshot_path(source, "orders")
+        with open(snapshot, "r+b") as f:
+            f.truncate(os.path.getsize(snapshot) - 10)
+        assert cache.load_orders(source) == demo_orders
+        assert cache.load_orders(source) == demo_orders
+        assert (cache.misses, cache.hits) == (2, 1)
+
+    def test_unwritable_cache_dir_still_loads(self, tmp_path, demo_orders):
+        """Failing to write a snapshot should not fail the load."""
+        source = _write(tmp_path / "orders.json", demo_orders)
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+        cache = SnapshotCache(str(blocker / "cache"))
+        assert cache.load_orders(source) == demo_orders
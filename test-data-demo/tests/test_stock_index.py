@@ -0,0 +1,96 @@
+"""Tests for the incrementally maintained stock-level index."""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import Order, OrderItem
+from order_processor import OrderProcessor
+from stock_index import StockLevelIndex
+
+
+class TestStockLevelIndex:
+    """Test ordering, queries and updates."""
+
+    def test_at_or_below_matches_scan(self, demo_products):
+        """Threshold queries should return the same products as a scan, lowest first."""
+        index = StockLevelIndex(demo_products)
+        for threshold in (-1, 0, 1, 3, 10, 1000):
+            expected = sorted((p.stock_quantity, p.id) for p in demo_products
+                              if p.stock_quantity <= threshold)
+            assert index.at_or_below(threshold) == [pid for _, pid in expected]
+
+    def test_update_reorders_product(self, demo_products):
+        """Updating a level should move the product within the order."""
+        index = StockLevelIndex(demo_products)
+        index.update("p4", 2)
+        assert index.level("p4") == 2
+        assert index.at_or_below(2) == ["p5", "p3", "p4"]
+
+    def test_remove(self, demo_products):
+        """Removed products should no longer be returned."""
+        index = StockLevelIndex(demo_products)
+        index.remove("p5")
+        assert "p5" not in index.at_or_below(1000)
+        assert len(index) == len(demo_products) - 1
+
+
+class TestThresholdSubscriptions:
+    """Test threshold-crossing notifications."""
+
+    def test_falling_and_rising_crossings(self, demo_products):
+        """Subscribers should hear about crossings in both directions only."""
+        index = StockLevelIndex(demo_products)
+        events = []
+        index.subscribe(5, lambda pid, old, new: events.append((pid, old, new)))
+
+        index.update("p1", 7)   # 10 -> 7, still above
+        index.update("p1", 5)   # 7 -> 5, crosses down
+        index.update("p1", 2)   # stays below
+        index.update("p1", 6)   # crosses back up
+        assert events == [("p1", 7, 5), ("p1", 2, 6)]
+
+    def test_unsubscribe(self, demo_products):
+        """A cancelled subscription should stop receiving events."""
+        index = StockLevelIndex(demo_products)
+        events = []
+        cancel = index.subscribe(5, lambda *event: events.append(event))
+        cancel()
+        index.update("p1", 0)
+        assert events == []
+
+
+class TestProcessorStockIndex:
+    """Test that OrderProcessor keeps the index current."""
+
+    @pytest.fixture
+    def processor(self, demo_customers, demo_products):
+        return OrderProcessor(demo_customers, demo_products, track_stock=True)
+
+    def test_processing_updates_low_stock(self, processor):
+        """Stock sold through process_order should show up in low-stock queries."""
+        assert "p1" not in [p.id for p in processor.get_low_stock_products(5)]
+        order = Order("o1", "c1", [OrderItem("p1", 6)], "pending", "2024-05-01")
+        assert processor.process_order(order)[0]
+        low = processor.get_low_stock_products(5)
+        assert "p1" in [p.id for p in low]
+        assert all(p.stock_quantity <= 5 for p in low)
+
+    def test_subscription_fires_on_batch_processing(self, processor):
+        """process_orders should trigger threshold events as stock drops."""
+        alerts = []
+        processor.stock_index.subscribe(0, lambda pid, old, new: alerts.append(pid))
+        orders = [Order("o1", "c2", [OrderItem("p3", 1), OrderItem("p4", 1)], "pending", "2024-05-01")]
+        processor.process_orders(orders)
+        assert alerts == ["p3"]
+
+    def test_untracked_processor_sees_outside_changes(self, demo_processor, demo_products):
+        """Without an index, low-stock queries should reflect stock changed directly."""
+        assert demo_processor.stock_index is None
+        demo_products[0].stock_quantity = 1
+        low = demo_processor.get_low_stock_products(5)
+        assert low[0].id == "p5" and "p1" in [p.id for p in low]
+        assert [(p.stock_quantity, p.id) for p in low] == sorted((p.stock_quantity, p.id) for p in low)
@@ -0,0 +1,134 @@
+"""Tests for the append-only stock ledger."""
+
+import copy
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from order_processor import OrderProcessor
+from stock_ledger import CHECKPOINT_NAME, LOG_NAME, StockLedger
+
+
+def _log_lines(directory):
+    with open(os.path.join(directory, LOG_NAME)) as f:
+        return f.readlines()
+
+
+class TestStockLedger:
+    """Test durability, group commit and compaction."""
+
+    def test_reopen_recovers_levels(self, tmp_path):
+        """Committed movements should be replayed on the next open."""
+        with StockLedger(str(tmp_path)) as ledger:
+            ledger.record("p1", -2, 8)
+            ledger.record("p2", -1, 2)
+            ledger.record("p1", -3, 5)
+        assert StockLedger(str(tmp_path)).levels() == {"p1": 5, "p2": 2}
+
+    def test_group_commit(self, tmp_path):
+        """Movements should reach the log in groups, not one by one."""
+        ledger = StockLedger(str(tmp_path), group_size=3)
+        ledger.record("p1", -1, 9)
+        ledger.record("p1", -1, 8)
+        assert _log_lines(str(tmp_path)) == []
+        ledger.record("p1", -1, 7)
+        assert len(_log_lines(str(tmp_path))) == 3
+
+    def test_uncommitted_movements_are_lost_on_crash(self, tmp_path):
+        """Only committed groups should survive a crash."""
+        ledger = StockLedger(str(tmp_path), group_size=100)
+        ledger.record("p1", -1, 9)
+        ledger.commit()
+        ledger.record("p1", -1, 8)
+        # No close(): simulate the process dying here
+        assert StockLedger(str(tmp_path)).levels() == {"p1": 9}
+
+    def test_checkpoint_compacts_log(self, tmp_path):
+        """Reaching checkpoint_every should fold the log into a checkpoint."""
+        ledger = StockLedger(str(tmp_path), group_size=2, checkpoint_every=4)
+        for level in range(10, 5, -1):
+            ledger.record("p1", -1, level)
+        ledger.close()
+
+        assert os.path.exists(os.path.join(str(tmp_path), CHECKPOINT_NAME))
+        assert len(_log_lines(str(tmp_path))) == 1
+        assert StockLedger(str(tmp_path)).levels() == {"p1": 6}
+
+    def test_torn_tail_is_ignored_and_truncated(self, tmp_path):
+        """A half-written last record should be dropped on open."""
+        with StockLedger(str(tmp_path)) as ledger:
+            ledger.record("p1", -1, 9)
+        with open(os.path.join(str(tmp_path), LOG_NAME), "a") as f:
+            f.write('[2, "p1", -1')
+
+        ledger = StockLedger(str(tmp_path))
+        assert ledger.levels() == {"p1": 9}
+        ledger.record("p1", -1, 8)
+        ledger.close()
+        assert StockLedger(str(tmp_path)).levels() == {"p1": 8}
+
+    def test_records_covered_by_checkpoint_are_skipped(self, tmp_path):
+        """A crash between checkpoint and truncate should not replay stale records."""
+        with StockLedger(str(tmp_path)) as ledger:
+            ledger.record("p1", -1, 9)
+            ledger.record("p1", -1, 8)
+        with open(os.path.join(str(tmp_path), CHECKPOINT_NAME), "w") as f:
+            json.dump({"seq": 2, "levels": {"p1": 8, "p2": 4}, "in_stock": {"p1": True, "p2": True}}, f)
+        with open(os.path.join(str(tmp_path), LOG_NAME), "a") as f:
+            f.write(json.dumps([1, "p2", -1, 99, True]) + "\n")
+        assert StockLedger(str(tmp_path)).levels() == {"p1": 8, "p2": 4}
+
+    def test_availability_is_recovered(self, tmp_path):
+        """in_stock should survive both the log and a checkpoint."""
+        with StockLedger(str(tmp_path)) as ledger:
+            ledger.record("p1", 0, 5, in_stock=False)
+            ledger.record("p2", -1, 0)
+            ledger.checkpoint()
+            ledger.record("p3", 4, 4)
+            ledger.record("p4", 0, 0, in_stock=True)
+        assert StockLedger(str(tmp_path)).availability() == \
+            {"p1": False, "p2": False, "p3": True, "p4": True}
+
+
+class TestProcessorWithLedger:
+    """Test that OrderProcessor writes to and restores from the ledger."""
+
+    def test_restart_restores_stock(self, tmp_path, demo_customers, demo_products, demo_orders):
+        """A restarted processor should see the stock left by the previous one."""
+        original = copy.deepcopy(demo_products)
+        ledger = StockLedger(str(tmp_path), group_size=1000)
+        processor = OrderProcessor(demo_customers, demo_products, ledger=ledger)
+        processor.process_orders(demo_orders)
+        ledger.close()
+
+        restarted = OrderProcessor(demo_customers, original, ledger=StockLedger(str(tmp_path)))
+        for product in demo_products:
+            restored = restarted.get_product(product.id)
+            assert restored.stock_quantity == product.stock_quantity
+            assert restored.in_stock == product.in_stock
+        assert [p.id for p in restarted.get_low_stock_products(5)] == \
+            [p.id for p in processor.get_low_stock_products(5)]
+
+    def test_batch_is_committed(self, tmp_path, demo_customers, demo_products, demo_orders):
+        """process_orders should make its movements durable before returning."""
+        processor = OrderProcessor(demo_customers, demo_products,
+                                   ledger=StockLedger(str(tmp_path), group_size=1000))
+        processor.process_orders(demo_orders[:2])
+        assert len(_log_lines(str(tmp_path))) == 3
+
+    def test_restock_and_availability_survive_restart(self, tmp_path, demo_customers, demo_products):
+        """A restocked product should be sellable again after a restart, and a delisting should stick."""
+        original = copy.deepcopy(demo_products)
+        with StockLedger(str(tmp_path)) as ledger:
+            processor = OrderProcessor(demo_customers, demo_products, ledger=ledger)
+            processor.update_product("p5", stock_quantity=3)
+            processor.update_product("p1", in_stock=False)
+        assert len(_log_lines(str(tmp_path))) == 2
+
+        restarted = OrderProcessor(demo_customers, original, ledger=StockLedger(str(tmp_path)))
+        assert restarted.get_product("p5").in_stock
+        assert restarted.get_product("p5").stock_quantity == 3
+        assert not restarted.get_product("p1").in_stock
+        assert restarted.get_product("p1").stock_quantity == 10
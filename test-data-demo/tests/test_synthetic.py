@@ -0,0 +1,46 @@
+"""Tests for the synthetic benchmark data generator."""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from data_loader import iter_orders, load_customers, load_products
+from synthetic import Scale, generate_orders, write_dataset
+
+
+class TestSyntheticData:
+    """Test determinism and consistency of generated datasets."""
+
+    def test_same_seed_same_data(self):
+        """Generation should be reproducible from the seed."""
+        first = list(generate_orders(50, 10, 20, seed=3))
+        assert first == list(generate_orders(50, 10, 20, seed=3))
+        assert first != list(generate_orders(50, 10, 20, seed=4))
+
+    def test_written_dataset_is_valid_and_consistent(self, tmp_path):
+        """Every record should be valid and every reference should resolve."""
+        scale = Scale.for_orders(300)
+        paths = write_dataset(str(tmp_path), scale, seed=1)
+        customers = load_customers(paths["customers"])
+        products = load_products(paths["products"])
+        orders = list(iter_orders(paths["orders"]))
+
+        assert (len(orders), len(customers), len(products)) == (scale.orders, scale.customers, scale.products)
+        customer_ids = {c.id for c in customers}
+        product_ids = {p.id for p in products}
+        assert all(c.is_valid() for c in customers)
+        assert all(p.is_valid() for p in products)
+        for order in orders:
+            assert order.is_valid()
+            assert order.customer_id in customer_ids
+            assert all(item.product_id in product_ids for item in order.items)
+
+    def test_json_lines_output(self, tmp_path):
+        """JSON Lines datasets should stream back to the same orders."""
+        scale = Scale.for_orders(40)
+        paths = write_dataset(str(tmp_path), scale, seed=2, json_lines=True)
+        assert list(iter_orders(paths["orders"])) == \
+            list(generate_orders(scale.orders, scale.customers, scale.products, seed=2))
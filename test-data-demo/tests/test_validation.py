@@ -0,0 +1,85 @@
+"""Tests for the compiled ValidationEngine."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import Customer, Order, OrderItem, Product
+from validation import ValidationEngine
+
+
+BAD_CUSTOMERS = [
+    Customer("", "No Id", "noid@example.com", "gold", "2024-01-01"),
+    Customer("c10", "", "noname@example.com", "gold", "2024-01-01"),
+    Customer("c11", "Bad Email", "not-an-email", "gold", "2024-01-01"),
+    Customer("c12", "Bad Level", "level@example.com", "diamond", "2024-01-01"),
+]
+
+BAD_PRODUCTS = [
+    Product("p10", "Free", 0.0, "misc", True, 1),
+    Product("p11", "Negative", 5.0, "misc", True, -2),
+    Product("", "", 5.0, "misc", True, 1),
+]
+
+BAD_ORDERS = [
+    Order("o10", "c1", [], "pending", "2024-05-01"),
+    Order("o11", "c1", [OrderItem("p1", 1)], "lost", "2024-05-01"),
+    Order("o12", "c1", [OrderItem("p1", 1), OrderItem("", 0)], "pending", "2024-05-01"),
+    Order("", "", [OrderItem("p1", 1)], "pending", "2024-05-01"),
+]
+
+
+class TestEngineMatchesModels:
+    """The engine should apply exactly the models' rules."""
+
+    def test_customers(self, demo_customers):
+        """Customer checks and discount rates should match the model methods."""
+        engine = ValidationEngine()
+        for customer in demo_customers + BAD_CUSTOMERS:
+            assert engine.is_valid_customer(customer) == customer.is_valid()
+            assert engine.discount_rate(customer) == customer.get_discount_rate()
+
+    def test_products(self, demo_products):
+        """Product checks should match Product.is_valid."""
+        engine = ValidationEngine()
+        for product in demo_products + BAD_PRODUCTS:
+            assert engine.is_valid_product(product) == product.is_valid()
+
+    def test_orders(self, demo_orders):
+        """Order checks should match Order.is_valid."""
+        engine = ValidationEngine()
+        for order in demo_orders + BAD_ORDERS:
+            assert engine.is_valid_order(order) == order.is_valid()
+
+
+class TestBulkValidation:
+    """Test the bulk report API."""
+
+    def test_customer_report(self, demo_customers):
+        """Rejected records should be reported by index with their reasons."""
+        report = ValidationEngine().validate_customers(demo_customers + BAD_CUSTOMERS)
+        assert report.valid == demo_customers
+        assert [e.index for e in report.rejected] == [4, 5, 6, 7]
+        assert report.rejected[2].record_id == "c11"
+        assert report.rejected[2].reasons == ["invalid email 'not-an-email'"]
+        assert report.rejected[3].reasons == ["invalid membership level 'diamond'"]
+
+    def test_product_report_lists_every_reason(self, demo_products):
+        """A record breaking several rules should list each of them."""
+        report = ValidationEngine().validate_products(BAD_PRODUCTS + demo_products)
+        assert report.valid == demo_products
+        assert report.rejected[2].reasons == ["missing id", "missing name"]
+
+    def test_order_report_names_items(self, demo_orders):
+        """Item-level failures should say which item broke the rule."""
+        report = ValidationEngine().validate_orders(BAD_ORDERS)
+        assert not report.ok
+        assert report.rejected[0].reasons == ["no items"]
+        assert report.rejected[1].reasons == ["invalid status 'lost'"]
+        assert report.rejected[2].reasons == ["item 1: missing product_id", "item 1: non-positive quantity 0"]
+
+    def test_all_valid_report_is_ok(self, demo_orders):
+        """A report without rejections should be ok."""
+        valid_orders = [o for o in demo_orders if o.is_valid()]
+        assert ValidationEngine().validate_orders(valid_orders).ok